@@ -4,8 +4,11 @@
 Этот файл содержит все константы, используемые в проекте.
 """
 
-# Русские названия месяцев с разными падежами
-MONTHS_RU = {
+from types import MappingProxyType
+
+# Русские названия месяцев с разными падежами (только для чтения;
+# в горячих участках кода используйте кортежи MONTH_NOM и MONTH_GEN)
+MONTHS_RU = MappingProxyType({
     1: {'nom': 'Январь', 'gen': 'января'},
     2: {'nom': 'Февраль', 'gen': 'февраля'},
     3: {'nom': 'Март', 'gen': 'марта'},
@@ -18,10 +21,21 @@ MONTHS_RU = {
     10: {'nom': 'Октябрь', 'gen': 'октября'},
     11: {'nom': 'Ноябрь', 'gen': 'ноября'},
     12: {'nom': 'Декабрь', 'gen': 'декабря'}
+})
+
+# Названия месяцев в виде кортежей с индексом, равным номеру месяца (элемент 0 пустой)
+MONTH_NOM = ('',) + tuple(MONTHS_RU[m]['nom'] for m in range(1, 13))
+MONTH_GEN = ('',) + tuple(MONTHS_RU[m]['gen'] for m in range(1, 13))
+
+# Готовые строки вида "05 марта" для всех пар (месяц, день)
+DAY_MONTH_GEN = {
+    (m, d): f"{d:02d} {MONTHS_RU[m]['gen']}"
+    for m in range(1, 13)
+    for d in range(1, 32)
 }
 
 # Разрешенные HTML-теги для шаблонов
-ALLOWED_HTML_TAGS = [
+ALLOWED_HTML_TAGS = frozenset({
     'b', 'strong',  # жирный текст
     'i', 'em',      # курсив
     'u', 'ins',     # подчеркнутый текст
@@ -33,19 +47,19 @@ ALLOWED_HTML_TAGS = [
     'pre',          # предварительно отформатированный текст
     'blockquote',   # цитата
     'tg-emoji'      # эмодзи
-]
+})
 
 # Доступные переменные для шаблонов
-TEMPLATE_VARIABLES = [
-    "{name}",        # Полное имя пользователя
-    "{first_name}",  # Имя пользователя
-    "{last_name}",   # Фамилия пользователя
-    "{date}",        # Дата события
-    "{date_before}", # Дата за день до события
-    "{days_until}",  # Количество дней до события
-    "{phone_pay}",   # Номер телефона для перевода
-    "{name_pay}"     # ФИО получателя платежа
-]
+TEMPLATE_VARIABLES = frozenset({
+    "name",          # Полное имя пользователя
+    "first_name",    # Имя пользователя
+    "last_name",     # Фамилия пользователя
+    "date",          # Дата события
+    "date_before",   # Дата за день до события
+    "days_until",    # Количество дней до события
+    "phone_pay",     # Номер телефона для перевода
+    "name_pay"       # ФИО получателя платежа
+})
 
 # Тестовые данные для шаблонов
 SAMPLE_TEMPLATE_DATA = {
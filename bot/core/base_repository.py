@@ -48,6 +48,24 @@ class BaseRepository(RepositoryInterface[T, E]):
             Соединение с базой данных
         """
         return self._db_manager.get_connection()
+    
+    def _read_conn(self):
+        """
+        Контекстный менеджер для соединения только для чтения.
+        
+        Returns:
+            Контекстный менеджер соединения из пула чтения
+        """
+        return self._db_manager.get_read_connection()
+    
+    def _write_conn(self):
+        """
+        Контекстный менеджер для соединения с правом записи.
+        
+        Returns:
+            Контекстный менеджер соединения с фиксацией транзакции при выходе
+        """
+        return self._db_manager.get_connection()
             
     def execute_query(self, query: str, params: Tuple = (), fetchone: bool = False) -> Union[List[Dict[str, Any]], Dict[str, Any], None]:
         """
@@ -66,7 +66,7 @@ class NotificationLog:
         message: Текст сообщения
         status: Статус отправки ('success', 'error', 'warning')
         error_message: Сообщение об ошибке (если есть)
-        created_at: Дата и время создания записи
+        created_at: Время создания записи (Unix-время в секундах)
     """
     
     def __init__(
@@ -76,7 +76,7 @@ class NotificationLog:
         message: str = "",
         status: str = "success",
         error_message: Optional[str] = None,
-        created_at: Optional[str] = None
+        created_at: Optional[int] = None
     ):
         """
         Инициализация модели записи журнала уведомлений.
@@ -87,11 +87,22 @@ class NotificationLog:
             message: Текст сообщения
             status: Статус отправки ('success', 'error', 'warning')
             error_message: Сообщение об ошибке (если есть)
-            created_at: Дата и время создания записи
+            created_at: Время создания записи (Unix-время в секундах)
         """
         self.id = id
         self.user_id = user_id
         self.message = message
         self.status = status
         self.error_message = error_message
-        self.created_at = created_at 
\ No newline at end of file
+        self.created_at = created_at
+    
+    @property
+    def created_at_datetime(self) -> Optional[datetime]:
+        """
+        Время создания записи в виде datetime (местное время).
+        
+        Преобразование выполняется только при обращении, например для отображения.
+        """
+        if self.created_at is None:
+            return None
+        return datetime.fromtimestamp(self.created_at) 
\ No newline at end of file
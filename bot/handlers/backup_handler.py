@@ -43,6 +43,9 @@ class BackupHandler(BaseHandler):
         self.backup_service = backup_service
         self.user_service = user_service
         
+        # После восстановления права пользователей берутся из новой базы данных
+        self.backup_service.add_restore_listener(self.clear_access_cache)
+        
     def register_handlers(self) -> None:
         """Регистрация обработчиков команд для управления резервными копиями."""
         # Команды для работы с резервными копиями
@@ -137,7 +140,7 @@ class BackupHandler(BaseHandler):
                 return
             
             # Формируем сообщение со списком резервных копий
-            backups_text = f"{EMOJI['backup']} <b>Список резервных копий ({len(backups)}):</b>\n\n"
+            parts = [f"{EMOJI['backup']} <b>Список резервных копий ({len(backups)}):</b>\n\n"]
             
             for backup in backups:
                 backup_name = backup.get('filename')
@@ -150,15 +153,16 @@ class BackupHandler(BaseHandler):
                     f"Размер: {backup_size:.2f} KB\n\n"
                 )
                 
-                backups_text += backup_text
+                parts.append(backup_text)
             
             # Добавляем инструкции
-            backups_text += (
+            parts.append(
                 f"Для восстановления из резервной копии используйте:\n"
                 f"<code>/restore [имя_файла]</code>\n\n"
                 f"Для удаления резервной копии используйте:\n"
                 f"<code>/delete_backup [имя_файла]</code>"
             )
+            backups_text = ''.join(parts)
             
             self.send_message(message.chat.id, backups_text)
             logger.info(f"Отправлен список резервных копий администратору {message.from_user.id}")
@@ -193,12 +197,7 @@ class BackupHandler(BaseHandler):
             # Проверяем наличие аргументов
             if not args or len(args) < 1:
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_backup"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_backup")
                 
                 # Если аргументы не переданы, отправляем информационное сообщение
                 self.send_message(
@@ -275,12 +274,7 @@ class BackupHandler(BaseHandler):
             result = self.backup_service.restore_from_backup(backup_filename)
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             if result:
                 self.bot.edit_message_text(
@@ -303,12 +297,7 @@ class BackupHandler(BaseHandler):
             logger.error(f"Ошибка при восстановлении из резервной копии: {str(e)}")
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             self.send_message(
                 call.message.chat.id,
@@ -329,12 +318,7 @@ class BackupHandler(BaseHandler):
         self.bot.answer_callback_query(call.id)
         
         # Создаем клавиатуру с кнопкой "Назад"
-        keyboard = types.InlineKeyboardMarkup()
-        back_btn = types.InlineKeyboardButton(
-            text=f"{EMOJI['back']} Назад", 
-            callback_data="menu_backup"
-        )
-        keyboard.add(back_btn)
+        keyboard = self.back_keyboard("menu_backup")
         
         # Изменяем сообщение
         self.bot.edit_message_text(
@@ -367,12 +351,7 @@ class BackupHandler(BaseHandler):
             # Проверяем наличие аргументов
             if not args or len(args) < 1:
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_backup"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_backup")
                 
                 # Если аргументы не переданы, отправляем информационное сообщение
                 self.send_message(
@@ -448,12 +427,7 @@ class BackupHandler(BaseHandler):
             result = self.backup_service.delete_backup(backup_filename)
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             if result:
                 self.bot.edit_message_text(
@@ -476,12 +450,7 @@ class BackupHandler(BaseHandler):
             logger.error(f"Ошибка при удалении резервной копии: {str(e)}")
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             self.send_message(
                 call.message.chat.id,
@@ -502,12 +471,7 @@ class BackupHandler(BaseHandler):
         self.bot.answer_callback_query(call.id)
         
         # Создаем клавиатуру с кнопкой "Назад"
-        keyboard = types.InlineKeyboardMarkup()
-        back_btn = types.InlineKeyboardButton(
-            text=f"{EMOJI['back']} Назад", 
-            callback_data="menu_backup"
-        )
-        keyboard.add(back_btn)
+        keyboard = self.back_keyboard("menu_backup")
         
         # Изменяем сообщение
         self.bot.edit_message_text(
@@ -537,12 +501,7 @@ class BackupHandler(BaseHandler):
         )
         
         # Создаем клавиатуру с кнопкой "Назад"
-        keyboard = types.InlineKeyboardMarkup()
-        back_btn = types.InlineKeyboardButton(
-            text=f"{EMOJI['back']} Назад", 
-            callback_data="menu_backup"
-        )
-        keyboard.add(back_btn)
+        keyboard = self.back_keyboard("menu_backup")
         
         self.send_message(message.chat.id, help_text, reply_markup=keyboard)
         logger.info(f"Отправлена справка по резервному копированию администратору {message.from_user.id}")
@@ -579,12 +538,7 @@ class BackupHandler(BaseHandler):
             backup_path = self.backup_service.save_uploaded_backup(downloaded_file, message.document.file_name)
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             if not backup_path or not os.path.exists(backup_path):
                 self.send_message(
@@ -610,12 +564,7 @@ class BackupHandler(BaseHandler):
             logger.error(f"Ошибка при загрузке резервной копии: {str(e)}")
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             self.send_message(
                 message.chat.id,
@@ -657,12 +606,7 @@ class BackupHandler(BaseHandler):
             
             if not backup_path or not os.path.exists(backup_path):
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_backup"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_backup")
                 
                 self.send_message(
                     call.message.chat.id,
@@ -684,12 +628,7 @@ class BackupHandler(BaseHandler):
             )
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             self.send_message(call.message.chat.id, success_message, reply_markup=keyboard)
             logger.info(f"Создана резервная копия базы данных администратором {call.from_user.id}: {backup_path}")
@@ -698,12 +637,7 @@ class BackupHandler(BaseHandler):
             logger.error(f"Ошибка при создании резервной копии: {str(e)}")
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             self.send_message(
                 call.message.chat.id,
@@ -736,12 +670,7 @@ class BackupHandler(BaseHandler):
             backups = self.backup_service.get_backup_list()
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             if not backups:
                 self.send_message(
@@ -752,7 +681,7 @@ class BackupHandler(BaseHandler):
                 return
             
             # Формируем сообщение со списком резервных копий
-            backups_text = f"{EMOJI['backup']} <b>Список резервных копий ({len(backups)}):</b>\n\n"
+            parts = [f"{EMOJI['backup']} <b>Список резервных копий ({len(backups)}):</b>\n\n"]
             
             for backup in backups:
                 backup_name = backup.get('filename')
@@ -765,15 +694,16 @@ class BackupHandler(BaseHandler):
                     f"Размер: {backup_size:.2f} KB\n\n"
                 )
                 
-                backups_text += backup_text
+                parts.append(backup_text)
             
             # Добавляем инструкции
-            backups_text += (
+            parts.append(
                 f"Для восстановления из резервной копии используйте:\n"
                 f"<code>/restore [имя_файла]</code>\n\n"
                 f"Для удаления резервной копии используйте:\n"
                 f"<code>/delete_backup [имя_файла]</code>"
             )
+            backups_text = ''.join(parts)
             
             self.send_message(call.message.chat.id, backups_text, reply_markup=keyboard)
             logger.info(f"Отправлен список резервных копий администратору {call.from_user.id}")
@@ -782,12 +712,7 @@ class BackupHandler(BaseHandler):
             logger.error(f"Ошибка при получении списка резервных копий: {str(e)}")
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_backup"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_backup")
             
             self.send_message(
                 call.message.chat.id,
@@ -815,12 +740,7 @@ class BackupHandler(BaseHandler):
         self.bot.answer_callback_query(call.id)
         
         # Создаем клавиатуру с кнопкой "Назад"
-        keyboard = types.InlineKeyboardMarkup()
-        back_btn = types.InlineKeyboardButton(
-            text=f"{EMOJI['back']} Назад", 
-            callback_data="menu_backup"
-        )
-        keyboard.add(back_btn)
+        keyboard = self.back_keyboard("menu_backup")
         
         self.send_message(
             call.message.chat.id,
@@ -849,12 +769,7 @@ class BackupHandler(BaseHandler):
         self.bot.answer_callback_query(call.id)
         
         # Создаем клавиатуру с кнопкой "Назад"
-        keyboard = types.InlineKeyboardMarkup()
-        back_btn = types.InlineKeyboardButton(
-            text=f"{EMOJI['back']} Назад", 
-            callback_data="menu_backup"
-        )
-        keyboard.add(back_btn)
+        keyboard = self.back_keyboard("menu_backup")
         
         self.send_message(
             call.message.chat.id,
@@ -894,12 +809,7 @@ class BackupHandler(BaseHandler):
         )
         
         # Создаем клавиатуру с кнопкой "Назад"
-        keyboard = types.InlineKeyboardMarkup()
-        back_btn = types.InlineKeyboardButton(
-            text=f"{EMOJI['back']} Назад", 
-            callback_data="menu_backup"
-        )
-        keyboard.add(back_btn)
+        keyboard = self.back_keyboard("menu_backup")
         
         # Отправляем сообщение с кнопкой "Назад"
         self.send_message(call.message.chat.id, help_text, reply_markup=keyboard)
@@ -5,14 +5,19 @@
 Telegram-бота, предоставляя общие функции и интерфейсы.
 """
 
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 import telebot
 from typing import Dict, List, Callable, Any, Optional, Union, Set
 import re
 
 from bot.core.models import User
-from config import ADMIN_IDS
+from config import ADMIN_IDS, TELEGRAM_SEND_RATE, TELEGRAM_CHAT_SEND_INTERVAL
 from bot.utils.keyboard_manager import KeyboardManager
+from bot.utils.outbox import MessageOutbox
 from bot.constants import EMOJI
 
 logger = logging.getLogger(__name__)
@@ -25,6 +30,29 @@ class BaseHandler:
     Предоставляет общие функции и утилиты для обработки сообщений и команд.
     """
     
+    # Время жизни записей кэша прав доступа (в секундах) и максимальный размер кэша
+    ACCESS_CACHE_TTL = 60
+    ACCESS_CACHE_MAXSIZE = 10000
+    
+    # Кэш прав доступа общий для всех обработчиков:
+    # telegram_id -> (зарегистрирован, администратор, время истечения)
+    _access_cache: Dict[int, tuple] = {}
+    
+    # Последнее отрисованное обработчиками содержимое сообщений:
+    # (chat_id, message_id) -> (хеш текста и клавиатуры, edit_date после редактирования)
+    # Обращения к кэшу идут из рабочих потоков TeleBot, поэтому защищены блокировкой
+    _last_render: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _last_render_lock = threading.Lock()
+    LAST_RENDER_MAXSIZE = 10000
+    
+    # Клавиатуры с единственной кнопкой "Назад", общие для всех обработчиков:
+    # callback_data -> клавиатура
+    _back_keyboards: Dict[str, telebot.types.InlineKeyboardMarkup] = {}
+    
+    # Очередь исходящих сообщений с ограничением частоты, общая для всех обработчиков
+    _outbox: Optional[MessageOutbox] = None
+    _outbox_lock = threading.Lock()
+    
     def __init__(self, bot: telebot.TeleBot):
         """
         Инициализация базового обработчика.
@@ -34,8 +62,56 @@ class BaseHandler:
         """
         self.bot = bot
         self.keyboard_manager = KeyboardManager()
+        with BaseHandler._outbox_lock:
+            if BaseHandler._outbox is None:
+                BaseHandler._outbox = MessageOutbox(
+                    bot, rate=TELEGRAM_SEND_RATE, chat_interval=TELEGRAM_CHAT_SEND_INTERVAL
+                )
+        # Главное меню зависит только от прав пользователя, поэтому строим оба варианта один раз
+        self._menu_admin = self.keyboard_manager.create_main_menu(is_admin=True)
+        self._menu_user = self.keyboard_manager.create_main_menu(is_admin=False)
         self._next_step_handlers = {}  # Словарь для хранения обработчиков следующего шага
         
+    @staticmethod
+    def _build_back_keyboard(back_callback: str, *buttons: telebot.types.InlineKeyboardButton) -> telebot.types.InlineKeyboardMarkup:
+        """
+        Создание клавиатуры с кнопкой "Назад" и дополнительными кнопками над ней.
+        
+        Args:
+            back_callback: callback_data кнопки "Назад"
+            *buttons: Кнопки, размещаемые перед кнопкой "Назад"
+            
+        Returns:
+            telebot.types.InlineKeyboardMarkup: Клавиатура
+        """
+        keyboard = telebot.types.InlineKeyboardMarkup()
+        for button in buttons:
+            keyboard.add(button)
+        keyboard.add(telebot.types.InlineKeyboardButton(
+            text=f"{EMOJI['back']} Назад", 
+            callback_data=back_callback
+        ))
+        return keyboard
+    
+    def back_keyboard(self, back_callback: str) -> telebot.types.InlineKeyboardMarkup:
+        """
+        Получение клавиатуры с единственной кнопкой "Назад".
+        
+        Клавиатура создается один раз для каждого callback_data и переиспользуется
+        всеми обработчиками, поэтому изменять ее нельзя.
+        
+        Args:
+            back_callback: callback_data кнопки "Назад"
+            
+        Returns:
+            telebot.types.InlineKeyboardMarkup: Клавиатура
+        """
+        keyboard = self._back_keyboards.get(back_callback)
+        if keyboard is None:
+            keyboard = self._build_back_keyboard(back_callback)
+            self._back_keyboards[back_callback] = keyboard
+        return keyboard
+    
     def register_handlers(self) -> None:
         """
         Регистрация обработчиков сообщений и команд.
@@ -44,6 +120,55 @@ class BaseHandler:
         """
         pass
     
+    def _get_user_access(self, user_id: int) -> Optional[tuple]:
+        """
+        Получение прав доступа пользователя из базы данных с кэшированием.
+        
+        Args:
+            user_id: Идентификатор пользователя в Telegram
+            
+        Returns:
+            Кортеж (зарегистрирован, администратор) или None, если права
+            не удалось получить из базы данных
+        """
+        if not hasattr(self, 'user_service'):
+            return None
+        
+        cached = self._access_cache.get(user_id)
+        if cached and cached[2] > time.monotonic():
+            return cached[0], cached[1]
+        
+        user = self.user_service.get_user_by_telegram_id(user_id)
+        is_registered = user is not None
+        is_admin = bool(user and user.is_admin)
+        
+        if len(self._access_cache) >= self.ACCESS_CACHE_MAXSIZE:
+            self._access_cache.clear()
+        self._access_cache[user_id] = (is_registered, is_admin, time.monotonic() + self.ACCESS_CACHE_TTL)
+        
+        return is_registered, is_admin
+    
+    @classmethod
+    def invalidate_user_access(cls, user_id: int) -> None:
+        """
+        Сброс кэшированных прав доступа пользователя.
+        
+        Вызывается после изменения пользователя в базе данных.
+        
+        Args:
+            user_id: Идентификатор пользователя в Telegram
+        """
+        cls._access_cache.pop(user_id, None)
+    
+    @classmethod
+    def clear_access_cache(cls) -> None:
+        """
+        Сброс кэшированных прав доступа всех пользователей.
+        
+        Вызывается после замены базы данных (восстановления из резервной копии).
+        """
+        cls._access_cache.clear()
+    
     def is_admin(self, user_id: int) -> bool:
         """
         Проверка, является ли пользователь администратором.
@@ -56,10 +181,9 @@ class BaseHandler:
         """
         # Проверяем сначала в базе данных
         try:
-            if hasattr(self, 'user_service'):
-                user = self.user_service.get_user_by_telegram_id(user_id)
-                if user and user.is_admin:
-                    return True
+            access = self._get_user_access(user_id)
+            if access and access[1]:
+                return True
         except Exception as e:
             logger.error(f"Ошибка при проверке администратора в базе данных: {str(e)}")
             
@@ -77,16 +201,15 @@ class BaseHandler:
             True, если пользователь зарегистрирован, иначе False
         """
         # Администраторы всегда считаются зарегистрированными
-        if self.is_admin(user_id):
+        if user_id in ADMIN_IDS:
             return True
         
         # Проверка в базе данных, если у класса есть доступ к сервису пользователей
-        if hasattr(self, 'user_service'):
-            try:
-                user = self.user_service.get_user_by_telegram_id(user_id)
-                return user is not None
-            except Exception as e:
-                logger.error(f"Ошибка при проверке регистрации пользователя: {str(e)}")
+        try:
+            access = self._get_user_access(user_id)
+            return bool(access and access[0])
+        except Exception as e:
+            logger.error(f"Ошибка при проверке регистрации пользователя: {str(e)}")
         
         return False
     
@@ -118,6 +241,27 @@ class BaseHandler:
             logger.error(f"Ошибка отправки сообщения пользователю {chat_id}: {str(e)}")
             return None
     
+    def queue_message(self, chat_id: int, text: str, parse_mode: str = 'HTML',
+                      reply_markup: Optional[Union[telebot.types.InlineKeyboardMarkup,
+                              telebot.types.ReplyKeyboardMarkup,
+                              telebot.types.ReplyKeyboardRemove,
+                              telebot.types.ForceReply]] = None, **kwargs) -> None:
+        """
+        Постановка сообщения в очередь исходящих сообщений.
+        
+        В отличие от send_message не ждет отправки: сообщение уходит из фонового
+        потока с учетом ограничений Telegram на частоту отправки. Подходит для
+        уведомлений, результат отправки которых обработчику не нужен.
+        
+        Args:
+            chat_id: Идентификатор чата
+            text: Текст сообщения
+            parse_mode: Режим парсинга текста ('HTML', 'Markdown')
+            reply_markup: Разметка клавиатуры (опционально)
+            **kwargs: Дополнительные параметры отправки сообщения
+        """
+        self._outbox.put(chat_id, text, parse_mode=parse_mode, reply_markup=reply_markup, **kwargs)
+    
     def edit_message_text(self, text: str, chat_id: int = None, message_id: int = None, 
                          inline_message_id: str = None, parse_mode: str = 'HTML',
                          reply_markup: Optional[telebot.types.InlineKeyboardMarkup] = None) -> bool:
@@ -149,6 +293,55 @@ class BaseHandler:
             logger.error(f"Ошибка редактирования сообщения: {str(e)}")
             return False
     
+    def edit_callback_message(self, call: telebot.types.CallbackQuery, text: str,
+                              reply_markup: Optional[telebot.types.InlineKeyboardMarkup] = None,
+                              parse_mode: str = 'HTML') -> None:
+        """
+        Редактирование сообщения, из которого пришел callback-запрос.
+        
+        Запрос к Telegram пропускается, если сообщение уже содержит тот же текст
+        и ту же клавиатуру: содержимое сравнивается по хешу последней отрисовки,
+        а edit_date подтверждает, что с тех пор сообщение никто не менял.
+        Ответ Telegram "message is not modified" не считается ошибкой,
+        остальные ошибки не перехватываются.
+        
+        Args:
+            call: Callback-запрос
+            text: Новый текст сообщения
+            reply_markup: Клавиатура (опционально)
+            parse_mode: Режим парсинга текста ('HTML', 'Markdown')
+        """
+        key = (call.message.chat.id, call.message.message_id)
+        markup_json = reply_markup.to_json() if reply_markup else ""
+        digest = hashlib.blake2b((text + markup_json).encode(), digest_size=8).digest()
+        
+        with self._last_render_lock:
+            last = self._last_render.get(key)
+        if last and last[0] == digest and last[1] == call.message.edit_date:
+            return
+        
+        try:
+            result = self.bot.edit_message_text(
+                chat_id=call.message.chat.id,
+                message_id=call.message.message_id,
+                text=text,
+                reply_markup=reply_markup,
+                parse_mode=parse_mode
+            )
+        except telebot.apihelper.ApiTelegramException as e:
+            # Содержимое уже совпадает с текущим - это не ошибка
+            if "message is not modified" in str(e):
+                return
+            raise
+        
+        edit_date = getattr(result, 'edit_date', None)
+        if edit_date:
+            with self._last_render_lock:
+                self._last_render[key] = (digest, edit_date)
+                self._last_render.move_to_end(key)
+                if len(self._last_render) > self.LAST_RENDER_MAXSIZE:
+                    self._last_render.popitem(last=False)
+    
     def answer_callback_query(self, callback_query_id: str, text: str = None, 
                              show_alert: bool = False, url: str = None, 
                              cache_time: int = 0) -> bool:
@@ -270,7 +463,7 @@ class BaseHandler:
         if not text:
             text = "📋 <b>Главное меню</b>\n\nВыберите действие:"
         
-        keyboard = self.keyboard_manager.create_main_menu(is_admin)
+        keyboard = self._menu_admin if is_admin else self._menu_user
         self.send_message(chat_id, text, reply_markup=keyboard)
     
     def update_menu(self, callback_query: telebot.types.CallbackQuery, new_text: str, 
@@ -284,13 +477,7 @@ class BaseHandler:
             new_markup: Новая клавиатура
         """
         try:
-            self.bot.edit_message_text(
-                chat_id=callback_query.message.chat.id,
-                message_id=callback_query.message.message_id,
-                text=new_text,
-                reply_markup=new_markup,
-                parse_mode='HTML'
-            )
+            self.edit_callback_message(callback_query, new_text, new_markup)
         except Exception as e:
             logger.error(f"Ошибка обновления меню: {str(e)}")
     
@@ -70,6 +70,7 @@ class CommonHandler(BaseHandler):
                 )
                 
                 self.user_service.create_user(user)
+                self.invalidate_user_access(user_id)
                 logger.info(f"Зарегистрирован новый пользователь: {username} ({user_id})")
                 
                 # Уведомляем администраторов о новом пользователе
@@ -133,6 +133,37 @@ def log_errors(func: Callable) -> Callable:
     return wrapper
 
 
+CALLBACK_ERROR_TEXT = "Произошла ошибка при обработке запроса. Попробуйте еще раз."
+
+
+def log_callback_errors(func: Callable) -> Callable:
+    """
+    Декоратор для логирования ошибок в обработчиках callback-запросов.
+    
+    Если callback-запрос еще не был подтвержден, пользователь получит
+    всплывающее уведомление об ошибке, иначе - сообщение в чат.
+    
+    Args:
+        func: Декорируемая функция
+        
+    Returns:
+        Обертка для функции с логированием ошибок
+    """
+    @functools.wraps(func)
+    def wrapper(self, call: types.CallbackQuery, *args, **kwargs) -> Any:
+        try:
+            return func(self, call, *args, **kwargs)
+        except Exception:
+            logger.exception("Ошибка в обработчике callback-запроса %s (%s)", func.__name__, call.data)
+            
+            # Повторный ответ на уже подтвержденный запрос завершится неудачей
+            if not self.answer_callback_query(call.id, CALLBACK_ERROR_TEXT, show_alert=True):
+                self.send_message(call.message.chat.id, f"{EMOJI['error']} {CALLBACK_ERROR_TEXT}")
+            return None
+            
+    return wrapper
+
+
 def command_args(min_args: int = 0, max_args: Optional[int] = None, 
                  usage_message: Optional[str] = None) -> Callable:
     """
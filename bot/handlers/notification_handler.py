@@ -341,17 +341,11 @@ class NotificationHandler(BaseHandler):
         Отправка сообщения выбранным пользователям.
         """
         text = message.text
-        results = {"success": 0, "failed": 0}
-        
-        for user_id in selected_users:
-            if self.notification_service.send_notification(
-                user_id=user_id,
-                template_name="custom_message",
-                context={"message": text}
-            ):
-                results["success"] += 1
-            else:
-                results["failed"] += 1
+        results = self.notification_service.force_send_notifications(
+            user_ids=list(selected_users),
+            template_name="custom_message",
+            context={"message": text}
+        )
         
         self.send_message(
             message.chat.id,
@@ -19,6 +19,23 @@ from .decorators import admin_required, log_errors, command_args
 logger = logging.getLogger(__name__)
 
 
+def format_log_timestamp(timestamp: str) -> str:
+    """
+    Преобразование времени записи журнала из формата ISO в ДД.ММ.ГГГГ ЧЧ:ММ:СС.
+    
+    Args:
+        timestamp: Время записи в формате ISO
+        
+    Returns:
+        Отформатированное время или исходная строка, если ее не удалось разобрать
+    """
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except (TypeError, ValueError):
+        return timestamp
+    return f"{dt.day:02d}.{dt.month:02d}.{dt.year} {dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+
+
 class NotificationLogHandler(BaseHandler):
     """
     Обработчик команд для управления журналом уведомлений.
@@ -91,7 +108,7 @@ class NotificationLogHandler(BaseHandler):
                 return
             
             # Формируем сообщение со списком записей
-            logs_text = f"{EMOJI['log']} <b>Последние {len(logs)} записей журнала уведомлений:</b>\n\n"
+            logs_parts = [f"{EMOJI['log']} <b>Последние {len(logs)} записей журнала уведомлений:</b>\n\n"]
             
             for log in logs:
                 log_id = log.get('id')
@@ -105,11 +122,7 @@ class NotificationLogHandler(BaseHandler):
                 status_emoji = EMOJI['success'] if status == 'success' else EMOJI['error']
                 
                 # Форматируем timestamp
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    timestamp_str = dt.strftime('%d.%m.%Y %H:%M:%S')
-                except:
-                    timestamp_str = timestamp
+                timestamp_str = format_log_timestamp(timestamp)
                 
                 log_text = (
                     f"{status_emoji} <b>ID {log_id}</b> - {timestamp_str}\n"
@@ -118,9 +131,9 @@ class NotificationLogHandler(BaseHandler):
                     f"Статус: {status}\n\n"
                 )
                 
-                logs_text += log_text
+                logs_parts.append(log_text)
             
-            self.send_message(message.chat.id, logs_text)
+            self.send_message(message.chat.id, ''.join(logs_parts))
             logger.info(f"Отправлен список записей журнала администратору {message.from_user.id}")
             
         except Exception as e:
@@ -175,7 +188,7 @@ class NotificationLogHandler(BaseHandler):
             
             # Формируем сообщение со списком записей
             user_name = logs[0].get('user_name', f'Пользователь {user_id}')
-            logs_text = f"{EMOJI['log']} <b>Последние {len(logs)} уведомлений для {user_name}:</b>\n\n"
+            logs_parts = [f"{EMOJI['log']} <b>Последние {len(logs)} уведомлений для {user_name}:</b>\n\n"]
             
             for log in logs:
                 log_id = log.get('id')
@@ -187,11 +200,7 @@ class NotificationLogHandler(BaseHandler):
                 status_emoji = EMOJI['success'] if status == 'success' else EMOJI['error']
                 
                 # Форматируем timestamp
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    timestamp_str = dt.strftime('%d.%m.%Y %H:%M:%S')
-                except:
-                    timestamp_str = timestamp
+                timestamp_str = format_log_timestamp(timestamp)
                 
                 log_text = (
                     f"{status_emoji} <b>ID {log_id}</b> - {timestamp_str}\n"
@@ -199,9 +208,9 @@ class NotificationLogHandler(BaseHandler):
                     f"Статус: {status}\n\n"
                 )
                 
-                logs_text += log_text
+                logs_parts.append(log_text)
             
-            self.send_message(message.chat.id, logs_text)
+            self.send_message(message.chat.id, ''.join(logs_parts))
             logger.info(f"Отправлен список записей журнала для пользователя {user_id} администратору {message.from_user.id}")
             
         except Exception as e:
@@ -256,7 +265,7 @@ class NotificationLogHandler(BaseHandler):
             
             # Формируем сообщение со списком записей
             template_name = logs[0].get('template_name', f'Шаблон {template_id}')
-            logs_text = f"{EMOJI['log']} <b>Последние {len(logs)} уведомлений с шаблоном \"{template_name}\":</b>\n\n"
+            logs_parts = [f"{EMOJI['log']} <b>Последние {len(logs)} уведомлений с шаблоном \"{template_name}\":</b>\n\n"]
             
             for log in logs:
                 log_id = log.get('id')
@@ -268,11 +277,7 @@ class NotificationLogHandler(BaseHandler):
                 status_emoji = EMOJI['success'] if status == 'success' else EMOJI['error']
                 
                 # Форматируем timestamp
-                try:
-                    dt = datetime.fromisoformat(timestamp)
-                    timestamp_str = dt.strftime('%d.%m.%Y %H:%M:%S')
-                except:
-                    timestamp_str = timestamp
+                timestamp_str = format_log_timestamp(timestamp)
                 
                 log_text = (
                     f"{status_emoji} <b>ID {log_id}</b> - {timestamp_str}\n"
@@ -280,9 +285,9 @@ class NotificationLogHandler(BaseHandler):
                     f"Статус: {status}\n\n"
                 )
                 
-                logs_text += log_text
+                logs_parts.append(log_text)
             
-            self.send_message(message.chat.id, logs_text)
+            self.send_message(message.chat.id, ''.join(logs_parts))
             logger.info(f"Отправлен список записей журнала для шаблона {template_id} администратору {message.from_user.id}")
             
         except Exception as e:
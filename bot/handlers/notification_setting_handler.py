@@ -9,7 +9,6 @@ import logging
 import telebot
 from telebot import types
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, time
 
 from bot.core.models import NotificationSetting
 from bot.services.notification_setting_service import NotificationSettingService
@@ -81,12 +80,7 @@ class NotificationSettingHandler(BaseHandler):
             settings = self.setting_service.get_settings_with_templates()
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_settings"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_settings")
             
             if not settings:
                 self.send_message(
@@ -97,7 +91,7 @@ class NotificationSettingHandler(BaseHandler):
                 return
             
             # Формируем сообщение со списком настроек
-            settings_text = f"{EMOJI['setting']} <b>Список настроек уведомлений ({len(settings)}):</b>\n\n"
+            parts = [f"{EMOJI['setting']} <b>Список настроек уведомлений ({len(settings)}):</b>\n\n"]
             
             for setting_item in settings:
                 # Получаем объекты настройки и шаблона
@@ -120,7 +114,9 @@ class NotificationSettingHandler(BaseHandler):
                     f"Время отправки: {time_str}\n\n"
                 )
                 
-                settings_text += setting_text
+                parts.append(setting_text)
+            
+            settings_text = ''.join(parts)
             
             self.send_message(message.chat.id, settings_text, reply_markup=keyboard)
             logger.info(f"Отправлен список настроек администратору {message.from_user.id}")
@@ -220,12 +216,7 @@ class NotificationSettingHandler(BaseHandler):
             
             if result:
                 # Добавляем кнопку "Назад" к сообщению об успешном создании
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_settings"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_settings")
                 
                 self.send_message(
                     message.chat.id,
@@ -338,12 +329,7 @@ class NotificationSettingHandler(BaseHandler):
             
             if result:
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_settings"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_settings")
                 
                 self.send_message(
                     message.chat.id,
@@ -440,12 +426,7 @@ class NotificationSettingHandler(BaseHandler):
             
             if result:
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_settings"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_settings")
                 
                 self.send_message(
                     message.chat.id,
@@ -538,12 +519,7 @@ class NotificationSettingHandler(BaseHandler):
             
             if result:
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_settings"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_settings")
                 
                 self.send_message(
                     message.chat.id,
@@ -636,12 +612,7 @@ class NotificationSettingHandler(BaseHandler):
             
             if result:
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_settings"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_settings")
                 
                 self.send_message(
                     message.chat.id,
@@ -902,7 +873,7 @@ class NotificationSettingHandler(BaseHandler):
                 text = f"{EMOJI['info']} В системе нет настроек уведомлений."
             else:
                 # Формируем сообщение со списком настроек
-                text = f"{EMOJI['setting']} <b>Список настроек уведомлений ({len(settings)}):</b>\n\n"
+                parts = [f"{EMOJI['setting']} <b>Список настроек уведомлений ({len(settings)}):</b>\n\n"]
                 
                 for setting_item in settings:
                     # Получаем объекты настройки и шаблона
@@ -925,15 +896,12 @@ class NotificationSettingHandler(BaseHandler):
                         f"Время отправки: {time_str}\n\n"
                     )
                     
-                    text += setting_text
+                    parts.append(setting_text)
+                
+                text = ''.join(parts)
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_settings"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_settings")
             
             # Обновляем сообщение
             self.bot.edit_message_text(
@@ -1236,12 +1204,7 @@ class NotificationSettingHandler(BaseHandler):
             text = self._get_help_text()
             
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_settings"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_settings")
             
             # Обновляем сообщение
             self.bot.edit_message_text(
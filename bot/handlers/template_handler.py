@@ -15,6 +15,7 @@ from bot.core.models import NotificationTemplate
 from bot.services.template_service import TemplateService
 from bot.services.user_service import UserService
 from bot.constants import EMOJI, ERROR_MESSAGES, ALLOWED_HTML_TAGS, TEMPLATE_VARIABLES, TEMPLATE_HELP_TEXT, SAMPLE_TEMPLATE_DATA
+from bot.utils.validators import has_only_allowed_tags, has_only_allowed_variables
 from .base_handler import BaseHandler
 from .decorators import admin_required, log_errors, command_args
 
@@ -83,12 +84,7 @@ class TemplateHandler(BaseHandler):
 
             if not templates:
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(
                     message.chat.id,
@@ -133,12 +129,7 @@ class TemplateHandler(BaseHandler):
             logger.error(f"Ошибка при получении списка шаблонов: {str(e)}")
 
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад",
-                callback_data="menu_templates"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_templates")
 
             self.send_message(
                 message.chat.id,
@@ -182,12 +173,7 @@ class TemplateHandler(BaseHandler):
                 )
 
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(message.chat.id, text, reply_markup=keyboard)
                 return
@@ -202,15 +188,14 @@ class TemplateHandler(BaseHandler):
                 self.send_message(
                     message.chat.id,
                     f"{EMOJI['error']} <b>Ошибка:</b> Шаблон содержит недопустимые HTML-теги.\n\n"
-                    f"Разрешены только теги: {', '.join(ALLOWED_HTML_TAGS)}"
+                    f"Разрешены только теги: {', '.join(sorted(ALLOWED_HTML_TAGS))}"
                 )
                 return
 
             # Проверяем валидность переменных шаблона
             if not self._validate_template_variables(text):
-                # Получаем список допустимых переменных без фигурных скобок для отображения
-                allowed_vars = [var.strip('{}') for var in TEMPLATE_VARIABLES]
-                valid_vars = ", ".join(["{" + v + "}" for v in allowed_vars])
+                # Список допустимых переменных в фигурных скобках для отображения
+                valid_vars = ", ".join(["{" + v + "}" for v in sorted(TEMPLATE_VARIABLES)])
 
                 self.send_message(
                     message.chat.id,
@@ -232,12 +217,7 @@ class TemplateHandler(BaseHandler):
 
             if result:
                 # Добавляем кнопку "Назад" в сообщение об успешном создании шаблона
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(
                     message.chat.id,
@@ -285,12 +265,7 @@ class TemplateHandler(BaseHandler):
                 )
 
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(message.chat.id, text, reply_markup=keyboard)
                 return
@@ -328,12 +303,7 @@ class TemplateHandler(BaseHandler):
             # Обновляем шаблон
             if self.template_service.update_template(template_id, name, category, text):
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(
                     message.chat.id,
@@ -378,12 +348,7 @@ class TemplateHandler(BaseHandler):
                 )
 
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(message.chat.id, text, reply_markup=keyboard)
                 return
@@ -401,12 +366,7 @@ class TemplateHandler(BaseHandler):
             # Удаляем шаблон, передавая setting_service для проверки использования шаблона
             if self.template_service.delete_template(template_id, setting_service=self.setting_service):
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(
                     message.chat.id,
@@ -426,8 +386,10 @@ class TemplateHandler(BaseHandler):
                     )
 
                     # Добавляем первые 3 настройки в сообщение (чтобы не перегружать)
-                    for i, setting in enumerate(settings[:3]):
-                        error_message += f"• Настройка ID: {setting.id}, время: {setting.time}, дней до события: {setting.days_before}\n"
+                    error_message += ''.join(
+                        f"• Настройка ID: {setting.id}, время: {setting.time}, дней до события: {setting.days_before}\n"
+                        for setting in settings[:3]
+                    )
 
                     if len(settings) > 3:
                         error_message += f"...и еще {len(settings) - 3} настроек.\n"
@@ -556,12 +518,7 @@ class TemplateHandler(BaseHandler):
             preview_text, success = self._format_preview_template(template_id)
 
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад",
-                callback_data="menu_templates"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_templates")
 
             # Отправляем предпросмотр или сообщение об ошибке
             self.send_message(message.chat.id, preview_text, reply_markup=keyboard)
@@ -573,12 +530,7 @@ class TemplateHandler(BaseHandler):
             logger.error(f"Ошибка при предпросмотре шаблона: {str(e)}")
 
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад",
-                callback_data="menu_templates"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_templates")
 
             self.send_message(
                 message.chat.id,
@@ -610,12 +562,7 @@ class TemplateHandler(BaseHandler):
                 )
 
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(message.chat.id, text, reply_markup=keyboard)
                 return
@@ -633,12 +580,7 @@ class TemplateHandler(BaseHandler):
             # Активируем шаблон
             if self.template_service.activate_template(template_id):
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(
                     message.chat.id,
@@ -683,12 +625,7 @@ class TemplateHandler(BaseHandler):
                 )
 
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(message.chat.id, text, reply_markup=keyboard)
                 return
@@ -706,12 +643,7 @@ class TemplateHandler(BaseHandler):
             # Деактивируем шаблон
             if self.template_service.deactivate_template(template_id):
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 self.send_message(
                     message.chat.id,
@@ -744,12 +676,7 @@ class TemplateHandler(BaseHandler):
         help_text = TEMPLATE_HELP_TEXT
 
         # Создаем клавиатуру с кнопкой "Назад"
-        keyboard = types.InlineKeyboardMarkup()
-        back_btn = types.InlineKeyboardButton(
-            text=f"{EMOJI['back']} Назад",
-            callback_data="menu_templates"
-        )
-        keyboard.add(back_btn)
+        keyboard = self.back_keyboard("menu_templates")
 
         self.send_message(message.chat.id, help_text, reply_markup=keyboard)
         logger.info(f"Отправлена справка по шаблонам администратору {message.from_user.id}")
@@ -823,12 +750,7 @@ class TemplateHandler(BaseHandler):
             )
 
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад",
-                callback_data="menu_templates"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_templates")
 
             # Обновляем сообщение
             self.bot.edit_message_text(
@@ -920,12 +842,7 @@ class TemplateHandler(BaseHandler):
                 text = f"{EMOJI['info']} В системе нет шаблонов уведомлений."
 
                 # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад",
-                    callback_data="menu_templates"
-                )
-                keyboard.add(back_btn)
+                keyboard = self.back_keyboard("menu_templates")
 
                 # Обновляем сообщение
                 self.bot.edit_message_text(
@@ -1065,14 +982,16 @@ class TemplateHandler(BaseHandler):
         notification_settings = self.setting_service.get_settings_by_template_id(template_id)
 
         # Формируем сообщение с полной информацией о шаблоне
-        template_text = f"📋 <b>Шаблон #{template_id}</b>\n"
-        template_text += f"📝 <b>Название:</b> {name}\n"
-        template_text += f"📂 <b>Категория:</b> {category}\n"
-        template_text += f"⏱ <b>Создан:</b> {created_at_str}\n"
-        template_text += f"📊 <b>Статус:</b> {status_emoji} {status_text}\n\n"
+        parts = [
+            f"📋 <b>Шаблон #{template_id}</b>\n"
+            f"📝 <b>Название:</b> {name}\n"
+            f"📂 <b>Категория:</b> {category}\n"
+            f"⏱ <b>Создан:</b> {created_at_str}\n"
+            f"📊 <b>Статус:</b> {status_emoji} {status_text}\n\n"
+            f"⚙️ <b>Настройки уведомлений:</b>\n"
+        ]
 
         # Добавляем информацию о настройках уведомлений
-        template_text += f"⚙️ <b>Настройки уведомлений:</b>\n"
         if notification_settings:
             for setting in notification_settings:
                 setting_id = setting.id if hasattr(setting, 'id') else 'N/A'
@@ -1082,13 +1001,13 @@ class TemplateHandler(BaseHandler):
                 setting_status = "✅" if is_setting_active else "❌"
                 setting_status_text = "Активна" if is_setting_active else "Неактивна"
 
-                template_text += f"• id настройки #{setting_id}: За {days_before} дней в {time} - {setting_status} {setting_status_text}\n"
+                parts.append(f"• id настройки #{setting_id}: За {days_before} дней в {time} - {setting_status} {setting_status_text}\n")
         else:
-            template_text += f"• ❌ настройки уведомлений для шаблона отсутствуют\n"
+            parts.append("• ❌ настройки уведомлений для шаблона отсутствуют\n")
 
-        template_text += f"\n🔤 <b>Текст шаблона:</b>\n\n{text}\n"
+        parts.append(f"\n🔤 <b>Текст шаблона:</b>\n\n{text}\n")
 
-        return template_text
+        return ''.join(parts)
 
     @log_errors
     def cmd_update_template_callback(self, call: types.CallbackQuery) -> None:
@@ -1167,12 +1086,7 @@ class TemplateHandler(BaseHandler):
                     preview_text, success = self._format_preview_template(template_id)
 
                     # Создаем клавиатуру с кнопкой "Назад"
-                    keyboard = types.InlineKeyboardMarkup()
-                    back_btn = types.InlineKeyboardButton(
-                        text=f"{EMOJI['back']} Назад",
-                        callback_data="menu_templates"
-                    )
-                    keyboard.add(back_btn)
+                    keyboard = self.back_keyboard("menu_templates")
 
                     # Обновляем сообщение с предпросмотром
                     self.bot.edit_message_text(
@@ -1346,12 +1260,7 @@ class TemplateHandler(BaseHandler):
         try:
             # Отправляем справку по шаблонам
             # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад",
-                callback_data="menu_templates"
-            )
-            keyboard.add(back_btn)
+            keyboard = self.back_keyboard("menu_templates")
 
             # Обновляем сообщение
             self.bot.edit_message_text(
@@ -1379,11 +1288,8 @@ class TemplateHandler(BaseHandler):
         Returns:
             True, если все HTML-теги в тексте валидны, иначе False
         """
-        from bot.utils.validators import validate_html
-
-        # Используем функцию validate_html из модуля validators
-        is_valid, _ = validate_html(text)
-        return is_valid
+        # Список недопустимых тегов не нужен, поэтому достаточно быстрой проверки
+        return has_only_allowed_tags(text)
 
     def _validate_template_variables(self, text: str) -> bool:
         """
@@ -1395,11 +1301,8 @@ class TemplateHandler(BaseHandler):
         Returns:
             True, если все переменные в тексте валидны, иначе False
         """
-        from bot.utils.validators import validate_template_variables
-
-        # Используем функцию validate_template_variables из модуля validators
-        is_valid, _ = validate_template_variables(text)
-        return is_valid
+        # Список недопустимых переменных не нужен, поэтому достаточно быстрой проверки
+        return has_only_allowed_variables(text)
 
     @log_errors
     def menu_templates_callback(self, call: types.CallbackQuery) -> None:
@@ -9,17 +9,156 @@ import logging
 import telebot
 from telebot import types
 from typing import Dict, List, Any, Optional, Tuple
-from datetime import datetime, timedelta
-import re
+from datetime import datetime
+import time
 
 from bot.core.models import User
 from bot.services.user_service import UserService
-from bot.constants import EMOJI, ERROR_MESSAGES, MONTHS_RU
+from bot.constants import EMOJI, ERROR_MESSAGES, MONTH_NOM, DAY_MONTH_GEN
+from config import ADMIN_IDS
 from .base_handler import BaseHandler
-from .decorators import admin_required, log_errors, command_args, registered_user_required
+from .decorators import admin_required, log_errors, log_callback_errors, command_args, registered_user_required
 
 logger = logging.getLogger(__name__)
 
+# Ссылки на мини-приложения (из game_handler.py)
+GAME_2048_URL = "https://t.me/PlayToTime_bot/Game2048"
+WRITE_MATE_URL = "https://t.me/PlayToTime_bot/WriteMate"
+
+# Тексты статических меню, открываемых из главного меню
+MENU_USERS_TEXT = (
+    f"{EMOJI['users']} <b>Управление пользователями</b>\n\n"
+    f"Выберите команду:"
+)
+MENU_NOTIFICATIONS_TEXT = (
+    f"{EMOJI['bell']} <b>Управление рассылками</b>\n\n"
+    f"Выберите команду:"
+)
+MENU_SETTINGS_TEXT = (
+    f"{EMOJI['setting']} <b>Управление настройками уведомлений</b>\n\n"
+    f"В этом разделе вы можете управлять настройками уведомлений:\n"
+    f"• Просматривать список настроек\n"
+    f"• Добавлять новые настройки\n"
+    f"• Обновлять существующие настройки\n"
+    f"• Удалять настройки\n"
+    f"• Активировать/деактивировать настройки\n\n"
+    f"Выберите действие:"
+)
+MENU_BACKUP_TEXT = (
+    f"{EMOJI['backup']} <b>Управление резервными копиями</b>\n\n"
+    f"Выберите команду:"
+)
+
+# Инструкции к командам управления пользователями
+ADD_USER_USAGE_TEXT = (
+    f"{EMOJI['plus']} <b>Добавление пользователя</b>\n\n"
+    f"Если вы знаете Telegram ID пользователя, используйте команду:\n"
+    f"<code>/add_user @username Имя Фамилия ГГГГ-ММ-ДД Telegram_ID</code>\n\n"
+    f"Например:\n"
+    f"<code>/add_user @username Иван Иванов 2000-01-01 1234567890</code>\n\n"
+    f"Если Telegram ID неизвестен, попросите пользователя нажать кнопку /start в боте.\n"
+    f"После этого вы получите сообщение с готовой командой для добавления пользователя."
+)
+REMOVE_USER_USAGE_TEXT = (
+    f"{EMOJI['minus']} <b>Удаление пользователя</b>\n\n"
+    f"Для удаления пользователя отправьте команду в формате:\n"
+    f"<code>/remove_user @username</code>\n\n"
+    f"После удаления пользователь не будет получать уведомления о днях рождения."
+)
+SET_ADMIN_USAGE_TEXT = (
+    f"{EMOJI['admin']} <b>Назначение администратора</b>\n\n"
+    f"Для назначения пользователя администратором отправьте команду в формате:\n"
+    f"<code>/set_admin @username</code>\n\n"
+    f"После назначения пользователь получит доступ ко всем административным функциям бота."
+)
+REMOVE_ADMIN_USAGE_TEXT = (
+    f"{EMOJI['user']} <b>Отзыв прав администратора</b>\n\n"
+    f"Для отзыва прав администратора у пользователя отправьте команду в формате:\n"
+    f"<code>/remove_admin @username</code>\n\n"
+    f"После отзыва прав пользователь потеряет доступ к административным функциям бота."
+)
+
+# Тексты разделов с мини-приложениями
+GAME_2048_TEXT = (
+    f"{EMOJI['game']} <b>Игра 2048</b>\n\n"
+    f"Нажмите на кнопку ниже, чтобы запустить игру 2048."
+)
+WRITE_MATE_TEXT = (
+    f"{EMOJI['pencil']} <b>ПишиЛегко</b>\n\n"
+    f"📝 <b>ПишиЛегко</b> - твой AI помощник для создания и улучшения текстовых сообщений.\n\n"
+    f"• Создавай новые тексты\n"
+    f"• Улучшай существующие сообщения\n"
+    f"• Выбирай подходящий тон и формат\n\n"
+    f"Нажмите на кнопку ниже для перехода:"
+)
+
+# Параметры команд назначения и отзыва прав администратора
+ADMIN_STATUS_ACTIONS = {
+    True: {
+        'usage': SET_ADMIN_USAGE_TEXT,
+        'unchanged': "уже является администратором",
+        'failure': "Не удалось назначить пользователя администратором",
+        'success': "Пользователь @{username} назначен администратором",
+        'notification': (
+            f"{EMOJI['wave']} <b>Поздравляем!</b>\n\n"
+            f"Вам были выданы права администратора.\n"
+            f"Теперь вам доступен полный функционал бота.\n\n"
+            f"Нажмите /start для обновления меню."
+        ),
+        'error': "Ошибка при назначении администратора",
+    },
+    False: {
+        'usage': REMOVE_ADMIN_USAGE_TEXT,
+        'unchanged': "не является администратором",
+        'failure': "Не удалось отозвать права администратора",
+        'success': "У пользователя @{username} отозваны права администратора",
+        'notification': (
+            f"{EMOJI['info']} <b>Уведомление об изменении прав доступа</b>\n\n"
+            f"У вас были отозваны права администратора.\n"
+            f"Теперь вам доступен только базовый функционал бота.\n\n"
+        ),
+        'error': "Ошибка при отзыве прав администратора",
+    },
+}
+
+# Карточка пользователя в справочнике; строки логина и даты рождения
+# подставляются целиком и могут быть пустыми
+USER_DIRECTORY_ROW = (
+    "👤 <b>{name}</b>\n"
+    "{username_line}"
+    "{birth_line}"
+    "• Подписка: {subscribed}\n"
+    "• Рассылка: {notifications}\n"
+    "• Telegram ID: {telegram_id}\n\n"
+)
+
+# Заголовки месяцев в списке дней рождения, индекс равен номеру месяца
+MONTH_HEADER = tuple(f"{EMOJI['calendar']} <b>{MONTH_NOM[m]}:</b>\n" for m in range(13))
+
+TOGGLE_NOTIFICATIONS_USAGE_TEXT = (
+    f"{EMOJI['bell']} <b>Управление уведомлениями</b>\n\n"
+    f"Для включения или отключения уведомлений пользователя отправьте команду в формате:\n"
+    f"<code>/toggle_notifications @username</code>\n\n"
+    f"После выполнения команды статус получения уведомлений для пользователя изменится на противоположный."
+)
+
+
+def format_birth_date(birth_date: str) -> str:
+    """
+    Преобразование даты рождения из формата ГГГГ-ММ-ДД в ДД.ММ.ГГГГ.
+    
+    Дата переставляется срезами строки без разбора в объект date.
+    
+    Args:
+        birth_date: Дата рождения в формате ГГГГ-ММ-ДД
+        
+    Returns:
+        str: Дата в формате ДД.ММ.ГГГГ или исходная строка, если формат другой
+    """
+    if len(birth_date) == 10 and birth_date[4] == '-' and birth_date[7] == '-':
+        return f"{birth_date[8:10]}.{birth_date[5:7]}.{birth_date[0:4]}"
+    return birth_date
+
 
 class UserHandler(BaseHandler):
     """
@@ -29,6 +168,13 @@ class UserHandler(BaseHandler):
     и удалением пользователей, а также управлением их правами.
     """
     
+    # Время жизни кэша списка дней рождения (в секундах)
+    BIRTHDAYS_CACHE_TTL = 300
+    # Время жизни кэша справочника пользователей (в секундах)
+    DIRECTORY_CACHE_TTL = 300
+    # Количество пользователей на одной странице справочника
+    USERS_PAGE_SIZE = 20
+    
     def __init__(self, bot: telebot.TeleBot, user_service: UserService):
         """
         Инициализация обработчика пользователей.
@@ -39,7 +185,32 @@ class UserHandler(BaseHandler):
         """
         super().__init__(bot)
         self.user_service = user_service
-        
+        # Готовый текст списка дней рождения и время его построения
+        self._birthdays_cache: Optional[Tuple[str, float]] = None
+        # Версия данных пользователей, увеличивается при каждом изменении через этот обработчик
+        self._users_version = 0
+        # Страницы справочника: номер страницы -> (текст или None, если пользователей нет,
+        # количество страниц, версия данных, время построения)
+        self._directory_cache: Dict[int, Tuple[Optional[str], int, int, float]] = {}
+        # Клавиатуры с единственной кнопкой "Назад" одинаковы для всех обработчиков
+        self._back_to_users_kb = self.back_keyboard("menu_users")
+        self._back_to_main_kb = self.back_keyboard("menu_main")
+        self._game_kb = self._build_back_keyboard(
+            "menu_main",
+            types.InlineKeyboardButton(text="Играть в 2048", url=GAME_2048_URL)
+        )
+        self._write_kb = self._build_back_keyboard(
+            "menu_main",
+            types.InlineKeyboardButton(text="✍️ ПишиЛегко", url=WRITE_MATE_URL)
+        )
+        # Статические меню администратора: callback_data -> (текст, клавиатура)
+        self._static_menus: Dict[str, Tuple[str, types.InlineKeyboardMarkup]] = {
+            "menu_users": (MENU_USERS_TEXT, self.keyboard_manager.create_users_menu()),
+            "menu_notifications": (MENU_NOTIFICATIONS_TEXT, self.keyboard_manager.create_notifications_menu()),
+            "menu_settings": (MENU_SETTINGS_TEXT, self.keyboard_manager.create_settings_menu()),
+            "menu_backup": (MENU_BACKUP_TEXT, self.keyboard_manager.create_backup_menu()),
+        }
+    
     def register_handlers(self) -> None:
         """
         Регистрация обработчиков для команд пользователя.
@@ -56,17 +227,16 @@ class UserHandler(BaseHandler):
         # Регистрация обработчиков callback-запросов для кнопок меню
         self.bot.callback_query_handler(func=lambda call: call.data == "menu_main")(self.menu_main_callback)
         self.bot.callback_query_handler(func=lambda call: call.data == "menu_birthdays")(self.menu_birthdays_callback)
-        self.bot.callback_query_handler(func=lambda call: call.data == "menu_users")(self.menu_users_callback)
-        self.bot.callback_query_handler(func=lambda call: call.data == "menu_notifications")(self.menu_notifications_callback)
-        self.bot.callback_query_handler(func=lambda call: call.data == "menu_settings")(self.menu_settings_callback)
-        self.bot.callback_query_handler(func=lambda call: call.data == "menu_backup")(self.menu_backup_callback)
+        self.bot.callback_query_handler(func=lambda call: call.data in self._static_menus)(self.static_menu_callback)
         self.bot.callback_query_handler(func=lambda call: call.data == "menu_game")(self.menu_game_callback)
         self.bot.callback_query_handler(func=lambda call: call.data == "menu_write")(self.menu_write_callback)
         
         # Регистрация обработчиков callback-запросов для команд управления пользователями
         self.bot.callback_query_handler(func=lambda call: call.data == "cmd_add_user")(self.cmd_add_user_callback)
         self.bot.callback_query_handler(func=lambda call: call.data == "cmd_remove_user")(self.cmd_remove_user_callback)
-        self.bot.callback_query_handler(func=lambda call: call.data == "cmd_users_directory")(self.cmd_users_directory_callback)
+        self.bot.callback_query_handler(
+            func=lambda call: call.data == "cmd_users_directory" or call.data.startswith("users_dir:page=")
+        )(self.cmd_users_directory_callback)
         self.bot.callback_query_handler(func=lambda call: call.data == "cmd_set_admin")(self.cmd_set_admin_callback)
         self.bot.callback_query_handler(func=lambda call: call.data == "cmd_remove_admin")(self.cmd_remove_admin_callback)
     
@@ -110,7 +280,7 @@ class UserHandler(BaseHandler):
                     f"У вас есть доступ ко всем функциям бота.\n"
                     f"Выберите нужный раздел в меню ниже:"
                 )
-                keyboard = self.keyboard_manager.create_main_menu(is_admin=True)
+                keyboard = self._menu_admin
                 self.send_message(message.chat.id, welcome_text, reply_markup=keyboard)
                 logger.info(f"Администратор {telegram_id} запустил бота")
                 return
@@ -122,7 +292,7 @@ class UserHandler(BaseHandler):
                     f"Этот бот помогает отслеживать дни рождения и отправлять уведомления.\n\n"
                     f"Выберите нужный раздел в меню ниже:"
                 )
-                keyboard = self.keyboard_manager.create_main_menu(is_admin=False)
+                keyboard = self._menu_user
                 self.send_message(message.chat.id, welcome_text, reply_markup=keyboard)
                 logger.info(f"Пользователь {telegram_id} запустил бота")
                 return
@@ -172,14 +342,11 @@ class UserHandler(BaseHandler):
                 f"<b>Telegram ID пользователя ({user.id}) уже добавлен в команду!</b>"
             )
             
-            # Отправляем сообщение всем администраторам
+            # Ставим сообщение в очередь на отправку всем администраторам
             for admin_id in admin_telegram_ids:
-                self.send_message(
-                    admin_id,
-                    admin_message
-                )
+                self.queue_message(admin_id, admin_message, disable_web_page_preview=True)
             
-            logger.info(f"Запрос на регистрацию от @{user.username} отправлен администраторам")
+            logger.info(f"Запрос на регистрацию от @{user.username} поставлен в очередь для администраторов")
         
         except Exception as e:
             logger.error(f"Ошибка при отправке запроса на регистрацию администраторам: {str(e)}")
@@ -200,14 +367,186 @@ class UserHandler(BaseHandler):
             )
             
             # Отправляем сообщение пользователю с клавиатурой
-            keyboard = self.keyboard_manager.create_main_menu(is_admin=False)
-            self.send_message(telegram_id, welcome_text, reply_markup=keyboard)
+            keyboard = self._menu_user
+            self.queue_message(telegram_id, welcome_text, reply_markup=keyboard)
             
-            logger.info(f"Пользователь @{username} (ID: {telegram_id}) уведомлен о регистрации")
+            logger.info(f"Уведомление о регистрации для @{username} (ID: {telegram_id}) поставлено в очередь")
         
         except Exception as e:
             logger.error(f"Ошибка при уведомлении пользователя о регистрации: {str(e)}")
     
+    def _rebuild_birthdays_text(self) -> str:
+        """
+        Формирование текста со списком дней рождения, сгруппированным по месяцам.
+        
+        Returns:
+            str: HTML-текст со списком дней рождения
+        """
+        # Получаем всех пользователей с днями рождения
+        birthdays_list = self.user_service.get_all_users_with_birthdays()
+        
+        if not birthdays_list:
+            return f"{EMOJI['info']} В базе данных нет дней рождения."
+        
+        parts = [f"{EMOJI['gift']} <b>Дни рождения</b>\n\n"]
+        
+        current_month = None
+        
+        for birthday in birthdays_list:
+            month_num = birthday.get('month')
+            
+            # Если начался новый месяц, добавляем его заголовок
+            if month_num != current_month:
+                if current_month is not None:
+                    parts.append("\n")  # Добавляем перенос строки между месяцами
+                current_month = month_num
+                parts.append(MONTH_HEADER[month_num])
+            
+            # Форматируем имя пользователя
+            first_name = birthday.get('first_name', '')
+            last_name = birthday.get('last_name', '')
+            name = f"{first_name} {last_name}".strip() if last_name else first_name
+            
+            # Форматируем дату рождения
+            date_str = DAY_MONTH_GEN[month_num, birthday.get('day')]
+            
+            # Добавляем строку с днем рождения
+            parts.append(f"{EMOJI['birthday']} {name} - {date_str}\n")
+        
+        return ''.join(parts)
+    
+    def get_birthdays_text(self) -> str:
+        """
+        Получение текста со списком дней рождения из кэша.
+        
+        Текст перестраивается, если кэш сброшен или устарел.
+        
+        Returns:
+            str: HTML-текст со списком дней рождения
+        """
+        cached = self._birthdays_cache
+        if cached and time.monotonic() - cached[1] < self.BIRTHDAYS_CACHE_TTL:
+            return cached[0]
+        
+        text = self._rebuild_birthdays_text()
+        self._birthdays_cache = (text, time.monotonic())
+        return text
+    
+    def invalidate_birthdays_cache(self) -> None:
+        """
+        Сброс кэша списка дней рождения после изменения пользователей.
+        """
+        self._birthdays_cache = None
+    
+    def _on_users_changed(self, telegram_id: int) -> None:
+        """
+        Сброс кэшей, зависящих от данных пользователей, после их изменения.
+        
+        Args:
+            telegram_id: Telegram ID измененного пользователя
+        """
+        self.invalidate_user_access(telegram_id)
+        self.invalidate_birthdays_cache()
+        self._users_version += 1
+        self._directory_cache.clear()
+    
+    def get_users_directory_page(self, page: int) -> Tuple[Optional[str], int]:
+        """
+        Получение страницы справочника пользователей из кэша.
+        
+        Страница перестраивается, если данные пользователей изменились
+        или кэш устарел. Пустые страницы не кэшируются.
+        
+        Args:
+            page: Номер страницы (начиная с 0)
+            
+        Returns:
+            Кортеж (HTML-текст страницы или None, если пользователей нет, количество страниц)
+        """
+        cached = self._directory_cache.get(page)
+        if (cached and cached[2] == self._users_version
+                and time.monotonic() - cached[3] < self.DIRECTORY_CACHE_TTL):
+            return cached[0], cached[1]
+        
+        version = self._users_version
+        total_users = self.user_service.count_users()
+        total_pages = max(1, -(-total_users // self.USERS_PAGE_SIZE))
+        
+        rows = self.user_service.get_users_directory_rows(self.USERS_PAGE_SIZE, page * self.USERS_PAGE_SIZE)
+        text = None
+        if rows:
+            text = self._build_users_directory_text(rows)
+            if total_pages > 1:
+                text += f"Страница {page + 1} из {total_pages}"
+        
+        # Кэшируются только успешно прочитанные страницы: при ошибке чтения репозиторий
+        # возвращает пустой результат, и он не должен держаться в кэше весь TTL
+        if rows and total_users:
+            self._directory_cache[page] = (text, total_pages, version, time.monotonic())
+        return text, total_pages
+    
+    def _build_directory_keyboard(self, page: int, total_pages: int) -> types.InlineKeyboardMarkup:
+        """
+        Создание клавиатуры навигации по страницам справочника.
+        
+        Args:
+            page: Номер текущей страницы (начиная с 0)
+            total_pages: Количество страниц
+            
+        Returns:
+            types.InlineKeyboardMarkup: Клавиатура с кнопками страниц и кнопкой "Назад"
+        """
+        if total_pages <= 1:
+            return self._back_to_users_kb
+        
+        buttons = []
+        if page > 0:
+            buttons.append(types.InlineKeyboardButton(text="◀️", callback_data=f"users_dir:page={page - 1}"))
+        if page < total_pages - 1:
+            buttons.append(types.InlineKeyboardButton(text="▶️", callback_data=f"users_dir:page={page + 1}"))
+        
+        keyboard = types.InlineKeyboardMarkup()
+        keyboard.row(*buttons)
+        keyboard.add(types.InlineKeyboardButton(
+            text=f"{EMOJI['back']} Назад", 
+            callback_data="menu_users"
+        ))
+        return keyboard
+    
+    def _build_users_directory_text(self, rows: List[Tuple]) -> str:
+        """
+        Формирование текста справочника пользователей.
+        
+        Args:
+            rows: Кортежи из UserService.get_users_directory_rows, упорядоченные так,
+                что администраторы идут первыми
+            
+        Returns:
+            str: HTML-текст справочника
+        """
+        parts = [f"{EMOJI['directory']} <b>Справочник пользователей</b>\n\n"]
+        
+        section_is_admin = None
+        
+        for first_name, last_name, username, birth_date, is_admin, is_subscribed, notifications, telegram_id in rows:
+            # Заголовок секции выводится, когда меняется признак администратора
+            is_admin = bool(is_admin)
+            if is_admin != section_is_admin:
+                section_is_admin = is_admin
+                parts.append("👑 <b>Администраторы:</b>\n\n" if section_is_admin else "👥 <b>Пользователи:</b>\n\n")
+            
+            # Формируем строку с информацией о пользователе одной подстановкой
+            parts.append(USER_DIRECTORY_ROW.format(
+                name=f"{first_name} {last_name}".strip() if last_name else first_name,
+                username_line=f"• @{username}\n" if username else "",
+                birth_line=f"• {format_birth_date(birth_date)}\n" if birth_date else "",
+                subscribed='✅' if is_subscribed else '❌',
+                notifications='✅' if notifications else '❌',
+                telegram_id=telegram_id
+            ))
+        
+        return ''.join(parts)
+    
     @registered_user_required
     @log_errors
     def list_birthdays(self, message: types.Message) -> None:
@@ -218,42 +557,8 @@ class UserHandler(BaseHandler):
             message: Сообщение от пользователя
         """
         try:
-            # Получаем всех пользователей с днями рождения
-            birthdays_list = self.user_service.get_all_users_with_birthdays()
-            
-            if not birthdays_list:
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['info']} В базе данных нет дней рождения."
-                )
-                return
-            
-            # Формируем сообщение со списком дней рождений, сгруппированным по месяцам
-            birthdays_text = f"{EMOJI['gift']} <b>Дни рождения</b>\n\n"
-            
-            current_month = None
-            
-            for birthday in birthdays_list:
-                month_num = birthday.get('month')
-                
-                # Если начался новый месяц, добавляем его заголовок
-                if month_num != current_month:
-                    if current_month is not None:
-                        birthdays_text += "\n"  # Добавляем перенос строки между месяцами
-                    current_month = month_num
-                    birthdays_text += f"{EMOJI['calendar']} <b>{MONTHS_RU[month_num]['nom']}:</b>\n"
-                
-                # Форматируем имя пользователя
-                first_name = birthday.get('first_name', '')
-                last_name = birthday.get('last_name', '')
-                name = f"{first_name} {last_name}".strip() if last_name else first_name
-                
-                # Форматируем дату рождения
-                birth_date_obj = datetime.strptime(birthday.get('birth_date'), '%Y-%m-%d').date()
-                date_str = f"{birth_date_obj.day:02d} {MONTHS_RU[month_num]['gen']}"
-                
-                # Добавляем строку с днем рождения
-                birthdays_text += f"{EMOJI['birthday']} {name} - {date_str}\n"
+            # Получаем готовый список дней рождения
+            birthdays_text = self.get_birthdays_text()
             
             self.send_message(message.chat.id, birthdays_text)
             logger.info(f"Отправлен полный список дней рождения пользователю {message.from_user.id}")
@@ -278,26 +583,11 @@ class UserHandler(BaseHandler):
             args = self.extract_command_args(message.text)
             
             if not args:
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
+                # Клавиатура с кнопкой "Назад"
+                keyboard = self._back_to_users_kb
                 
                 # Отправляем информационное сообщение
-                self.send_message(
-                    message.chat.id, 
-                    f"{EMOJI['plus']} <b>Добавление пользователя</b>\n\n"
-                    f"Если вы знаете Telegram ID пользователя, используйте команду:\n"
-                    f"<code>/add_user @username Имя Фамилия ГГГГ-ММ-ДД Telegram_ID</code>\n\n"
-                    f"Например:\n"
-                    f"<code>/add_user @username Иван Иванов 2000-01-01 1234567890</code>\n\n"
-                    f"Если Telegram ID неизвестен, попросите пользователя нажать кнопку /start в боте.\n"
-                    f"После этого вы получите сообщение с готовой командой для добавления пользователя.",
-                    reply_markup=keyboard
-                )
+                self.send_message(message.chat.id, ADD_USER_USAGE_TEXT, reply_markup=keyboard)
                 return
             
             # Извлекаем имя пользователя
@@ -305,15 +595,6 @@ class UserHandler(BaseHandler):
             if username.startswith('@'):
                 username = username[1:]  # Убираем символ @ из имени пользователя
             
-            # Проверяем, существует ли уже пользователь с таким именем
-            existing_user = self.user_service.get_user_by_username(username)
-            if existing_user:
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['error']} <b>Ошибка:</b> Пользователь с именем @{username} уже существует."
-                )
-                return
-            
             # Разбираем остальные аргументы
             name = args[1] if len(args) > 1 else username
             last_name = args[2] if len(args) > 2 else ""
@@ -391,10 +672,18 @@ class UserHandler(BaseHandler):
                 is_notifications_enabled=True,
             )
             
-            # Добавляем пользователя в базу
-            result = self.user_service.create_user(user)
+            # Добавляем пользователя в базу, если его там еще нет
+            result = self.user_service.create_user_if_absent(user)
+            
+            if result is None and self.user_service.get_user_by_username(username):
+                self.send_message(
+                    message.chat.id,
+                    f"{EMOJI['error']} <b>Ошибка:</b> Пользователь с именем @{username} уже существует."
+                )
+                return
             
             if result:
+                self._on_users_changed(telegram_id)
                 # Формируем сообщение об успешном добавлении пользователя
                 success_message = f"{EMOJI['success']} Пользователь @{username} успешно добавлен."
                 
@@ -406,13 +695,8 @@ class UserHandler(BaseHandler):
                 # Уведомляем пользователя о регистрации
                 self.notify_user_added(telegram_id, username)
                 
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
+                # Клавиатура с кнопкой "Назад"
+                keyboard = self._back_to_users_kb
                 
                 self.send_message(message.chat.id, success_message, reply_markup=keyboard)
                 logger.info(f"Администратор {message.from_user.id} добавил пользователя @{username}")
@@ -439,17 +723,12 @@ class UserHandler(BaseHandler):
             message: Сообщение от пользователя
         """
         try:
-            # Получаем всех пользователей
-            users = self.user_service.get_all_users()
+            # Получаем первую страницу справочника пользователей
+            users_text, total_pages = self.get_users_directory_page(0)
             
-            if not users:
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
+            if users_text is None:
+                # Клавиатура с кнопкой "Назад"
+                keyboard = self._back_to_users_kb
                 
                 self.send_message(
                     message.chat.id,
@@ -458,76 +737,8 @@ class UserHandler(BaseHandler):
                 )
                 return
             
-            # Разделяем пользователей на администраторов и обычных пользователей
-            admins = [user for user in users if user.is_admin]
-            regular_users = [user for user in users if not user.is_admin]
-            
-            # Формируем сообщение со списком пользователей
-            users_text = f"{EMOJI['directory']} <b>Справочник пользователей</b>\n\n"
-            
-            # Добавляем администраторов
-            if admins:
-                users_text += f"👑 <b>Администраторы:</b>\n\n"
-                
-                for admin in admins:
-                    # Имя и фамилия
-                    name = f"{admin.first_name} {admin.last_name}".strip() if admin.last_name else admin.first_name
-                    
-                    # Логин
-                    username = f"@{admin.username}" if admin.username else ""
-                    
-                    # Полная дата рождения
-                    birth_date = ""
-                    if admin.birth_date:
-                        try:
-                            birth_date_obj = datetime.strptime(admin.birth_date, '%Y-%m-%d').date()
-                            birth_date = f"{birth_date_obj.strftime('%d.%m.%Y')}"
-                        except ValueError:
-                            birth_date = f"{admin.birth_date}"
-                    
-                    # Формируем строку с информацией о пользователе
-                    users_text += f"👤 <b>{name}</b>\n"
-                    users_text += f"• {username}\n" if username else ""
-                    users_text += f"• {birth_date}\n" if birth_date else ""
-                    users_text += f"• Подписка: {'✅' if admin.is_subscribed else '❌'}\n"
-                    users_text += f"• Рассылка: {'✅' if admin.is_notifications_enabled else '❌'}\n"
-                    users_text += f"• Telegram ID: {admin.telegram_id}\n\n"
-            
-            # Добавляем обычных пользователей
-            if regular_users:
-                users_text += f"👥 <b>Пользователи:</b>\n\n"
-                
-                for user in regular_users:
-                    # Имя и фамилия
-                    name = f"{user.first_name} {user.last_name}".strip() if user.last_name else user.first_name
-                    
-                    # Логин
-                    username = f"@{user.username}" if user.username else ""
-                    
-                    # Полная дата рождения
-                    birth_date = ""
-                    if user.birth_date:
-                        try:
-                            birth_date_obj = datetime.strptime(user.birth_date, '%Y-%m-%d').date()
-                            birth_date = f"{birth_date_obj.strftime('%d.%m.%Y')}"
-                        except ValueError:
-                            birth_date = f"{user.birth_date}"
-                    
-                    # Формируем строку с информацией о пользователе
-                    users_text += f"👤 <b>{name}</b>\n"
-                    users_text += f"• {username}\n" if username else ""
-                    users_text += f"• {birth_date}\n" if birth_date else ""
-                    users_text += f"• Подписка: {'✅' if user.is_subscribed else '❌'}\n"
-                    users_text += f"• Рассылка: {'✅' if user.is_notifications_enabled else '❌'}\n"
-                    users_text += f"• Telegram ID: {user.telegram_id}\n\n"
-            
-            # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_users"
-            )
-            keyboard.add(back_btn)
+            # Клавиатура с навигацией по страницам и кнопкой "Назад"
+            keyboard = self._build_directory_keyboard(0, total_pages)
             
             self.send_message(message.chat.id, users_text, reply_markup=keyboard)
             logger.info(f"Отправлен справочник пользователей администратору {message.from_user.id}")
@@ -552,23 +763,11 @@ class UserHandler(BaseHandler):
             args = self.extract_command_args(message.text)
             
             if not args:
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
+                # Клавиатура с кнопкой "Назад"
+                keyboard = self._back_to_users_kb
                 
                 # Отправляем информационное сообщение
-                self.send_message(
-                    message.chat.id, 
-                    f"{EMOJI['minus']} <b>Удаление пользователя</b>\n\n"
-                    f"Для удаления пользователя отправьте команду в формате:\n"
-                    f"<code>/remove_user @username</code>\n\n"
-                    f"После удаления пользователь не будет получать уведомления о днях рождения.",
-                    reply_markup=keyboard
-                )
+                self.send_message(message.chat.id, REMOVE_USER_USAGE_TEXT, reply_markup=keyboard)
                 return
             
             # Извлекаем имя пользователя
@@ -592,14 +791,10 @@ class UserHandler(BaseHandler):
             result = self.user_service.delete_user(user_id)
             
             if result:
+                self._on_users_changed(user_id)
                 # Отправляем сообщение администратору
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
+                # Клавиатура с кнопкой "Назад"
+                keyboard = self._back_to_users_kb
                 
                 self.send_message(
                     message.chat.id,
@@ -630,103 +825,96 @@ class UserHandler(BaseHandler):
                 f"{EMOJI['error']} <b>Ошибка:</b> {str(e)}"
             )
     
-    @admin_required
-    @log_errors
-    def set_admin(self, message: types.Message) -> None:
+    def _extract_target_username(self, message: types.Message, usage_text: str) -> Optional[str]:
         """
-        Обработчик команды /set_admin.
+        Извлечение имени пользователя из аргументов команды.
+        
+        Если аргументы не переданы, отправляет инструкцию по использованию команды.
         
         Args:
             message: Сообщение от пользователя
+            usage_text: Текст инструкции по использованию команды
+            
+        Returns:
+            Имя пользователя без символа @ или None, если аргументы не переданы
         """
+        args = self.extract_command_args(message.text)
+        
+        if not args:
+            # Отправляем информационное сообщение
+            self.send_message(message.chat.id, usage_text, reply_markup=self._back_to_users_kb)
+            return None
+        
+        # Извлекаем имя пользователя
+        username = args[0]
+        if username.startswith('@'):
+            username = username[1:]  # Убираем символ @ из имени пользователя
+        return username
+    
+    def _change_admin_status(self, message: types.Message, is_admin: bool) -> None:
+        """
+        Назначение или отзыв прав администратора по команде.
+        
+        Args:
+            message: Сообщение от пользователя
+            is_admin: True - назначить администратором, False - отозвать права администратора
+        """
+        action = ADMIN_STATUS_ACTIONS[is_admin]
+        
         try:
-            args = self.extract_command_args(message.text)
-            
-            if not args:
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
-                
-                # Отправляем информационное сообщение
-                self.send_message(
-                    message.chat.id, 
-                    f"{EMOJI['admin']} <b>Назначение администратора</b>\n\n"
-                    f"Для назначения пользователя администратором отправьте команду в формате:\n"
-                    f"<code>/set_admin @username</code>\n\n"
-                    f"После назначения пользователь получит доступ ко всем административным функциям бота.",
-                    reply_markup=keyboard
-                )
+            username = self._extract_target_username(message, action['usage'])
+            if username is None:
                 return
             
-            # Извлекаем имя пользователя
-            username = args[0]
-            if username.startswith('@'):
-                username = username[1:]  # Убираем символ @ из имени пользователя
-            
-            # Проверяем, существует ли пользователь
-            user = self.user_service.get_user_by_username(username)
-            if not user:
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['error']} <b>Ошибка:</b> Пользователь с именем @{username} не найден."
-                )
-                return
+            # Меняем статус одним запросом
+            user = self.user_service.set_admin_by_username(username, is_admin)
             
-            # Проверяем, уже является ли пользователь администратором
-            if user.is_admin:
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['info']} Пользователь @{username} уже является администратором."
-                )
+            if user is None:
+                # Изменений не было: уточняем причину
+                existing_user = self.user_service.get_user_by_username(username)
+                if not existing_user:
+                    text = f"{EMOJI['error']} <b>Ошибка:</b> Пользователь с именем @{username} не найден."
+                elif existing_user.is_admin == is_admin:
+                    text = f"{EMOJI['info']} Пользователь @{username} {action['unchanged']}."
+                else:
+                    text = f"{EMOJI['error']} <b>Ошибка:</b> {action['failure']}."
+                self.send_message(message.chat.id, text)
                 return
             
-            # Назначаем пользователя администратором
             user_id = user.telegram_id
-            result = self.user_service.set_admin_status(user_id, True)
+            self._on_users_changed(user_id)
+            
+            # Отправляем сообщение администратору, выполнившему команду
+            self.send_message(
+                message.chat.id,
+                f"{EMOJI['success']} {action['success'].format(username=username)}.",
+                reply_markup=self._back_to_users_kb
+            )
+            
+            # Отправляем уведомление пользователю об изменении прав
+            keyboard = None if is_admin else self._menu_user
+            self.queue_message(user_id, action['notification'], reply_markup=keyboard)
+            
+            logger.info(f"{action['success'].format(username=username)} пользователем {message.from_user.id}")
             
-            if result:
-                # Отправляем сообщение администратору
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
-                
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['success']} Пользователь @{username} назначен администратором.",
-                    reply_markup=keyboard
-                )
-                
-                # Отправляем уведомление новому администратору
-                welcome_text = (
-                    f"{EMOJI['wave']} <b>Поздравляем!</b>\n\n"
-                    f"Вам были выданы права администратора.\n"
-                    f"Теперь вам доступен полный функционал бота.\n\n"
-                    f"Нажмите /start для обновления меню."
-                )
-                self.send_message(user_id, welcome_text)
-                
-                logger.info(f"Пользователь @{username} назначен администратором пользователем {message.from_user.id}")
-            else:
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['error']} <b>Ошибка:</b> Не удалось назначить пользователя администратором."
-                )
-                
         except Exception as e:
-            logger.error(f"Ошибка при назначении администратора: {str(e)}")
+            logger.error(f"{action['error']}: {str(e)}")
             self.send_message(
                 message.chat.id,
                 f"{EMOJI['error']} <b>Ошибка:</b> {str(e)}"
             )
     
+    @admin_required
+    @log_errors
+    def set_admin(self, message: types.Message) -> None:
+        """
+        Обработчик команды /set_admin.
+        
+        Args:
+            message: Сообщение от пользователя
+        """
+        self._change_admin_status(message, True)
+    
     @admin_required
     @log_errors
     def remove_admin(self, message: types.Message) -> None:
@@ -736,95 +924,7 @@ class UserHandler(BaseHandler):
         Args:
             message: Сообщение от пользователя
         """
-        try:
-            args = self.extract_command_args(message.text)
-            
-            if not args:
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
-                
-                # Отправляем информационное сообщение
-                self.send_message(
-                    message.chat.id, 
-                    f"{EMOJI['user']} <b>Отзыв прав администратора</b>\n\n"
-                    f"Для отзыва прав администратора у пользователя отправьте команду в формате:\n"
-                    f"<code>/remove_admin @username</code>\n\n"
-                    f"После отзыва прав пользователь потеряет доступ к административным функциям бота.",
-                    reply_markup=keyboard
-                )
-                return
-            
-            # Извлекаем имя пользователя
-            username = args[0]
-            if username.startswith('@'):
-                username = username[1:]  # Убираем символ @ из имени пользователя
-            
-            # Проверяем, существует ли пользователь
-            user = self.user_service.get_user_by_username(username)
-            if not user:
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['error']} <b>Ошибка:</b> Пользователь с именем @{username} не найден."
-                )
-                return
-            
-            # Проверяем, является ли пользователь администратором
-            if not user.is_admin:
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['info']} Пользователь @{username} не является администратором."
-                )
-                return
-            
-            # Отзываем права администратора
-            user_id = user.telegram_id
-            result = self.user_service.set_admin_status(user_id, False)
-            
-            if result:
-                # Отправляем сообщение администратору, выполнившему команду
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
-                
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['success']} У пользователя @{username} отозваны права администратора.",
-                    reply_markup=keyboard
-                )
-                
-                # Отправляем уведомление пользователю об отзыве прав
-                notification_text = (
-                    f"{EMOJI['info']} <b>Уведомление об изменении прав доступа</b>\n\n"
-                    f"У вас были отозваны права администратора.\n"
-                    f"Теперь вам доступен только базовый функционал бота.\n\n"
-                )
-                
-                # Создаем базовую клавиатуру для пользователя
-                keyboard = self.keyboard_manager.create_main_menu(is_admin=False)
-                self.send_message(user_id, notification_text, reply_markup=keyboard)
-                
-                logger.info(f"У пользователя @{username} отозваны права администратора пользователем {message.from_user.id}")
-            else:
-                self.send_message(
-                    message.chat.id,
-                    f"{EMOJI['error']} <b>Ошибка:</b> Не удалось отозвать права администратора."
-                )
-                
-        except Exception as e:
-            logger.error(f"Ошибка при отзыве прав администратора: {str(e)}")
-            self.send_message(
-                message.chat.id,
-                f"{EMOJI['error']} <b>Ошибка:</b> {str(e)}"
-            )
+        self._change_admin_status(message, False)
     
     @admin_required
     @log_errors
@@ -836,33 +936,10 @@ class UserHandler(BaseHandler):
             message: Сообщение от пользователя
         """
         try:
-            args = self.extract_command_args(message.text)
-            
-            if not args:
-                # Создаем клавиатуру с кнопкой "Назад"
-                keyboard = types.InlineKeyboardMarkup()
-                back_btn = types.InlineKeyboardButton(
-                    text=f"{EMOJI['back']} Назад", 
-                    callback_data="menu_users"
-                )
-                keyboard.add(back_btn)
-                
-                # Отправляем информационное сообщение
-                self.send_message(
-                    message.chat.id, 
-                    f"{EMOJI['bell']} <b>Управление уведомлениями</b>\n\n"
-                    f"Для включения или отключения уведомлений пользователя отправьте команду в формате:\n"
-                    f"<code>/toggle_notifications @username</code>\n\n"
-                    f"После выполнения команды статус получения уведомлений для пользователя изменится на противоположный.",
-                    reply_markup=keyboard
-                )
+            username = self._extract_target_username(message, TOGGLE_NOTIFICATIONS_USAGE_TEXT)
+            if username is None:
                 return
             
-            # Извлекаем имя пользователя
-            username = args[0]
-            if username.startswith('@'):
-                username = username[1:]  # Убираем символ @ из имени пользователя
-            
             # Проверяем, существует ли пользователь
             user = self.user_service.get_user_by_username(username)
             if not user:
@@ -872,15 +949,13 @@ class UserHandler(BaseHandler):
                 )
                 return
             
-            # Получаем текущий статус уведомлений
+            # Инвертируем текущий статус уведомлений
             user_id = user.telegram_id
-            current_status = user.notifications_enabled
-            
-            # Инвертируем статус
-            new_status = not current_status
+            new_status = not user.is_notifications_enabled
             result = self.user_service.toggle_notifications(user_id, new_status)
             
             if result:
+                self._on_users_changed(user_id)
                 status_text = "включены" if new_status else "отключены"
                 emoji = EMOJI['bell'] if new_status else EMOJI['bell_slash']
                 
@@ -904,6 +979,7 @@ class UserHandler(BaseHandler):
     
     # Обработчики callback-запросов для меню
     
+    @log_callback_errors
     def menu_main_callback(self, call: types.CallbackQuery) -> None:
         """
         Обработчик для возврата в главное меню.
@@ -911,42 +987,31 @@ class UserHandler(BaseHandler):
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # Проверяем регистрацию пользователя
-            user_id = call.from_user.id
-            if not self.is_registered_user(user_id) and not self.is_admin(user_id):
-                self.answer_callback_query(
-                    call.id, 
-                    "Вы не зарегистрированы в системе. Ожидайте подтверждения администратора.", 
-                    show_alert=True
-                )
-                return
-            
-            is_admin = self.is_admin(user_id)
-            
-            # Текст для главного меню
-            menu_text = (
-                f"📋 <b>Главное меню</b>\n\n"
-                f"Выберите нужный раздел:"
+        # Права проверяем один раз: администратор всегда считается зарегистрированным
+        user_id = call.from_user.id
+        is_admin = self.is_admin(user_id)
+        if not is_admin and not self.is_registered_user(user_id):
+            self.answer_callback_query(
+                call.id, 
+                "Вы не зарегистрированы в системе. Ожидайте подтверждения администратора.", 
+                show_alert=True
             )
-            
-            # Обновляем сообщение с клавиатурой
-            keyboard = self.keyboard_manager.create_main_menu(is_admin)
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=menu_text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса menu_main: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+            return
+        
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id)
+        
+        # Текст для главного меню
+        menu_text = (
+            f"📋 <b>Главное меню</b>\n\n"
+            f"Выберите нужный раздел:"
+        )
+        
+        # Обновляем сообщение с клавиатурой
+        keyboard = self._menu_admin if is_admin else self._menu_user
+        self.edit_callback_message(call, menu_text, keyboard)
     
+    @log_callback_errors
     def menu_birthdays_callback(self, call: types.CallbackQuery) -> None:
         """
         Обработчик для отображения списка дней рождения.
@@ -954,226 +1019,53 @@ class UserHandler(BaseHandler):
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # Проверяем регистрацию пользователя
-            user_id = call.from_user.id
-            if not self.is_registered_user(user_id) and not self.is_admin(user_id):
-                self.answer_callback_query(
-                    call.id, 
-                    "Вы не зарегистрированы в системе. Ожидайте подтверждения администратора.", 
-                    show_alert=True
-                )
-                return
-            
-            # Получаем всех пользователей с днями рождения
-            birthdays_list = self.user_service.get_all_users_with_birthdays()
-            
-            if not birthdays_list:
-                text = f"{EMOJI['info']} В базе данных нет дней рождения."
-            else:
-                # Формируем сообщение со списком дней рождений, сгруппированным по месяцам
-                text = f"{EMOJI['gift']} <b>Дни рождения</b>\n\n"
-                
-                current_month = None
-                
-                for birthday in birthdays_list:
-                    month_num = birthday.get('month')
-                    
-                    # Если начался новый месяц, добавляем его заголовок
-                    if month_num != current_month:
-                        if current_month is not None:
-                            text += "\n"  # Добавляем перенос строки между месяцами
-                        current_month = month_num
-                        text += f"{EMOJI['calendar']} <b>{MONTHS_RU[month_num]['nom']}:</b>\n"
-                    
-                    # Форматируем имя пользователя
-                    first_name = birthday.get('first_name', '')
-                    last_name = birthday.get('last_name', '')
-                    name = f"{first_name} {last_name}".strip() if last_name else first_name
-                    
-                    # Форматируем дату рождения
-                    birth_date_obj = datetime.strptime(birthday.get('birth_date'), '%Y-%m-%d').date()
-                    date_str = f"{birth_date_obj.day:02d} {MONTHS_RU[month_num]['gen']}"
-                    
-                    # Добавляем строку с днем рождения
-                    text += f"{EMOJI['birthday']} {name} - {date_str}\n"
-            
-            # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_main"
-            )
-            keyboard.add(back_btn)
-            
-            # Обновляем сообщение
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
+        # Проверяем регистрацию пользователя (администраторы имеют доступ всегда)
+        user_id = call.from_user.id
+        if not self.is_admin(user_id) and not self.is_registered_user(user_id):
+            self.answer_callback_query(
+                call.id, 
+                "Вы не зарегистрированы в системе. Ожидайте подтверждения администратора.", 
+                show_alert=True
             )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-            logger.info(f"Отправлен список дней рождения пользователю {call.from_user.id}")
-            
-        except Exception as e:
-            logger.error(f"Ошибка при получении списка дней рождения: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
-    
-    def menu_users_callback(self, call: types.CallbackQuery) -> None:
-        """
-        Обработчик для отображения меню управления пользователями.
+            return
         
-        Args:
-            call: Callback-запрос от кнопки
-        """
-        try:
-            # Проверяем права администратора
-            if not self.is_admin(call.from_user.id):
-                self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
-                return
-            
-            # Текст для меню управления пользователями
-            menu_text = (
-                f"{EMOJI['users']} <b>Управление пользователями</b>\n\n"
-                f"Выберите команду:"
-            )
-            
-            # Обновляем сообщение с клавиатурой
-            keyboard = self.keyboard_manager.create_users_menu()
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=menu_text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса menu_users: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
-    
-    def menu_notifications_callback(self, call: types.CallbackQuery) -> None:
-        """
-        Обработчик для отображения меню управления рассылками.
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id)
         
-        Args:
-            call: Callback-запрос от кнопки
-        """
-        try:
-            # Проверяем права администратора
-            if not self.is_admin(call.from_user.id):
-                self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
-                return
-            
-            # Текст для меню управления рассылками
-            menu_text = (
-                f"{EMOJI['bell']} <b>Управление рассылками</b>\n\n"
-                f"Выберите команду:"
-            )
-            
-            # Обновляем сообщение с клавиатурой
-            keyboard = self.keyboard_manager.create_notifications_menu()
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=menu_text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса menu_notifications: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
-    
-    def menu_settings_callback(self, call: types.CallbackQuery) -> None:
-        """
-        Обработчик для отображения меню настроек уведомлений.
+        # Получаем готовый список дней рождения
+        text = self.get_birthdays_text()
         
-        Args:
-            call: Callback-запрос от кнопки
-        """
-        try:
-            # Проверяем права администратора
-            if not self.is_admin(call.from_user.id):
-                self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
-                return
-            
-            # Текст для меню настроек уведомлений
-            menu_text = (
-                f"{EMOJI['setting']} <b>Управление настройками уведомлений</b>\n\n"
-                f"В этом разделе вы можете управлять настройками уведомлений:\n"
-                f"• Просматривать список настроек\n"
-                f"• Добавлять новые настройки\n"
-                f"• Обновлять существующие настройки\n"
-                f"• Удалять настройки\n"
-                f"• Активировать/деактивировать настройки\n\n"
-                f"Выберите действие:"
-            )
-            
-            # Обновляем сообщение с клавиатурой
-            keyboard = self.keyboard_manager.create_settings_menu()
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=menu_text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса menu_settings: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+        # Клавиатура с кнопкой "Назад"
+        keyboard = self._back_to_main_kb
+        
+        # Обновляем сообщение
+        self.edit_callback_message(call, text, keyboard)
+        
+        logger.info(f"Отправлен список дней рождения пользователю {call.from_user.id}")
     
-    def menu_backup_callback(self, call: types.CallbackQuery) -> None:
+    @log_callback_errors
+    def static_menu_callback(self, call: types.CallbackQuery) -> None:
         """
-        Обработчик для отображения меню управления резервными копиями.
+        Обработчик для отображения статических меню администратора
+        (пользователи, рассылки, настройки, резервные копии).
         
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # Проверяем права администратора
-            if not self.is_admin(call.from_user.id):
-                self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
-                return
-            
-            # Текст для меню управления резервными копиями
-            menu_text = (
-                f"{EMOJI['backup']} <b>Управление резервными копиями</b>\n\n"
-                f"Выберите команду:"
-            )
-            
-            # Обновляем сообщение с клавиатурой
-            keyboard = self.keyboard_manager.create_backup_menu()
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=menu_text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса menu_backup: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+        # Проверяем права администратора
+        if not self.is_admin(call.from_user.id):
+            self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
+            return
+        
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id)
+        
+        menu_text, keyboard = self._static_menus[call.data]
+        
+        # Обновляем сообщение с клавиатурой
+        self.edit_callback_message(call, menu_text, keyboard)
     
+    @log_callback_errors
     def menu_game_callback(self, call: types.CallbackQuery) -> None:
         """
         Обработчик для запуска игры 2048.
@@ -1181,50 +1073,19 @@ class UserHandler(BaseHandler):
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # URL игры 2048 (из game_handler.py)
-            game_url = "https://t.me/PlayToTime_bot/Game2048"
-            
-            # Текст сообщения
-            text = (
-                f"{EMOJI['game']} <b>Игра 2048</b>\n\n"
-                f"Нажмите на кнопку ниже, чтобы запустить игру 2048."
-            )
-            
-            # Создаем клавиатуру с кнопками для игры и возврата
-            keyboard = types.InlineKeyboardMarkup()
-            
-            # Кнопка для запуска игры
-            game_button = types.InlineKeyboardButton(
-                text="Играть в 2048",
-                url=game_url
-            )
-            
-            # Кнопка возврата в главное меню
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_main"
-            )
-            
-            keyboard.add(game_button)
-            keyboard.add(back_btn)
-            
-            # Обновляем сообщение
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id, "Переход к игре 2048")
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса menu_game: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id, "Переход к игре 2048")
+        
+        # Текст сообщения
+        text = GAME_2048_TEXT
+        
+        # Клавиатура с кнопками для игры и возврата
+        keyboard = self._game_kb
+        
+        # Обновляем сообщение
+        self.edit_callback_message(call, text, keyboard)
     
+    @log_callback_errors
     def menu_write_callback(self, call: types.CallbackQuery) -> None:
         """
         Обработчик для запуска функции "ПишиЛегко".
@@ -1232,56 +1093,21 @@ class UserHandler(BaseHandler):
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # URL сервиса ПишиЛегко (из game_handler.py)
-            write_url = "https://t.me/PlayToTime_bot/WriteMate"
-            
-            # Текст сообщения
-            text = (
-                f"{EMOJI['pencil']} <b>ПишиЛегко</b>\n\n"
-                f"📝 <b>ПишиЛегко</b> - твой AI помощник для создания и улучшения текстовых сообщений.\n\n"
-                f"• Создавай новые тексты\n"
-                f"• Улучшай существующие сообщения\n"
-                f"• Выбирай подходящий тон и формат\n\n"
-                f"Нажмите на кнопку ниже для перехода:"
-            )
-            
-            # Создаем клавиатуру с кнопками
-            keyboard = types.InlineKeyboardMarkup()
-            
-            # Кнопка для перехода к сервису
-            write_button = types.InlineKeyboardButton(
-                text="✍️ ПишиЛегко",
-                url=write_url
-            )
-            
-            # Кнопка возврата в главное меню
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_main"
-            )
-            
-            keyboard.add(write_button)
-            keyboard.add(back_btn)
-            
-            # Обновляем сообщение
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id, "Переход к сервису ПишиЛегко")
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса menu_write: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id, "Переход к сервису ПишиЛегко")
+        
+        # Текст сообщения
+        text = WRITE_MATE_TEXT
+        
+        # Клавиатура с кнопками для перехода к сервису и возврата
+        keyboard = self._write_kb
+        
+        # Обновляем сообщение
+        self.edit_callback_message(call, text, keyboard)
     
     # Обработчики callback-запросов для команд управления пользователями
     
+    @log_callback_errors
     def cmd_add_user_callback(self, call: types.CallbackQuery) -> None:
         """
         Обработчик для команды добавления пользователя.
@@ -1289,47 +1115,24 @@ class UserHandler(BaseHandler):
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # Проверяем права администратора
-            if not self.is_admin(call.from_user.id):
-                self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
-                return
-            
-            # Текст с инструкцией по добавлению пользователя
-            text = (
-                f"{EMOJI['plus']} <b>Добавление пользователя</b>\n\n"
-                f"Если вы знаете Telegram ID пользователя, используйте команду:\n"
-                f"<code>/add_user @username Имя Фамилия ГГГГ-ММ-ДД Telegram_ID</code>\n\n"
-                f"Например:\n"
-                f"<code>/add_user @username Иван Иванов 2000-01-01 1234567890</code>\n\n"
-                f"Если Telegram ID неизвестен, попросите пользователя нажать кнопку /start в боте.\n"
-                f"После этого вы получите сообщение с готовой командой для добавления пользователя."
-            )
-            
-            # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_users"
-            )
-            keyboard.add(back_btn)
-            
-            # Обновляем сообщение
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса cmd_add_user: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+        # Проверяем права администратора
+        if not self.is_admin(call.from_user.id):
+            self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
+            return
+        
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id)
+        
+        # Текст с инструкцией по добавлению пользователя
+        text = ADD_USER_USAGE_TEXT
+        
+        # Клавиатура с кнопкой "Назад"
+        keyboard = self._back_to_users_kb
+        
+        # Обновляем сообщение
+        self.edit_callback_message(call, text, keyboard)
     
+    @log_callback_errors
     def cmd_remove_user_callback(self, call: types.CallbackQuery) -> None:
         """
         Обработчик для команды удаления пользователя.
@@ -1337,43 +1140,24 @@ class UserHandler(BaseHandler):
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # Проверяем права администратора
-            if not self.is_admin(call.from_user.id):
-                self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
-                return
-            
-            # Текст с инструкцией по удалению пользователя
-            text = (
-                f"{EMOJI['minus']} <b>Удаление пользователя</b>\n\n"
-                f"Для удаления пользователя из системы отправьте команду в формате:\n"
-                f"<code>/remove_user @username</code>\n\n"
-            )
-            
-            # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_users"
-            )
-            keyboard.add(back_btn)
-            
-            # Обновляем сообщение
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса cmd_remove_user: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+        # Проверяем права администратора
+        if not self.is_admin(call.from_user.id):
+            self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
+            return
+        
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id)
+        
+        # Текст с инструкцией по удалению пользователя
+        text = REMOVE_USER_USAGE_TEXT
+        
+        # Клавиатура с кнопкой "Назад"
+        keyboard = self._back_to_users_kb
+        
+        # Обновляем сообщение
+        self.edit_callback_message(call, text, keyboard)
     
+    @log_callback_errors
     def cmd_users_directory_callback(self, call: types.CallbackQuery) -> None:
         """
         Обработчик для команды просмотра справочника пользователей.
@@ -1381,105 +1165,36 @@ class UserHandler(BaseHandler):
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # Проверяем права администратора
-            if not self.is_admin(call.from_user.id):
-                self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
-                return
-            
-            # Получаем список всех пользователей
-            users = self.user_service.get_all_users()
-            
-            if not users:
-                text = f"{EMOJI['info']} Справочник пользователей пуст."
-            else:
-                # Разделяем пользователей на администраторов и обычных пользователей
-                admins = [user for user in users if user.is_admin]
-                regular_users = [user for user in users if not user.is_admin]
-                
-                # Формируем сообщение со списком пользователей
-                text = f"{EMOJI['directory']} <b>Справочник пользователей</b>\n\n"
-                
-                # Добавляем администраторов
-                if admins:
-                    text += f"👑 <b>Администраторы:</b>\n\n"
-                    
-                    for admin in admins:
-                        # Имя и фамилия
-                        name = f"{admin.first_name} {admin.last_name}".strip() if admin.last_name else admin.first_name
-                        
-                        # Логин
-                        username = f"@{admin.username}" if admin.username else ""
-                        
-                        # Полная дата рождения
-                        birth_date = ""
-                        if admin.birth_date:
-                            try:
-                                birth_date_obj = datetime.strptime(admin.birth_date, '%Y-%m-%d').date()
-                                birth_date = f"{birth_date_obj.strftime('%d.%m.%Y')}"
-                            except ValueError:
-                                birth_date = f"{admin.birth_date}"
-                        
-                        # Формируем строку с информацией о пользователе
-                        text += f"👤 <b>{name}</b>\n"
-                        text += f"• {username}\n" if username else ""
-                        text += f"• {birth_date}\n" if birth_date else ""
-                        text += f"• Подписка: {'✅' if admin.is_subscribed else '❌'}\n"
-                        text += f"• Рассылка: {'✅' if admin.is_notifications_enabled else '❌'}\n"
-                        text += f"• Telegram ID: {admin.telegram_id}\n\n"
-                
-                # Добавляем обычных пользователей
-                if regular_users:
-                    text += f"👥 <b>Пользователи:</b>\n\n"
-                    
-                    for user in regular_users:
-                        # Имя и фамилия
-                        name = f"{user.first_name} {user.last_name}".strip() if user.last_name else user.first_name
-                        
-                        # Логин
-                        username = f"@{user.username}" if user.username else ""
-                        
-                        # Полная дата рождения
-                        birth_date = ""
-                        if user.birth_date:
-                            try:
-                                birth_date_obj = datetime.strptime(user.birth_date, '%Y-%m-%d').date()
-                                birth_date = f"{birth_date_obj.strftime('%d.%m.%Y')}"
-                            except ValueError:
-                                birth_date = f"{user.birth_date}"
-                        
-                        # Формируем строку с информацией о пользователе
-                        text += f"👤 <b>{name}</b>\n"
-                        text += f"• {username}\n" if username else ""
-                        text += f"• {birth_date}\n" if birth_date else ""
-                        text += f"• Подписка: {'✅' if user.is_subscribed else '❌'}\n"
-                        text += f"• Рассылка: {'✅' if user.is_notifications_enabled else '❌'}\n"
-                        text += f"• Telegram ID: {user.telegram_id}\n\n"
-            
-            # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_users"
-            )
-            keyboard.add(back_btn)
-            
-            # Обновляем сообщение
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса cmd_users_directory: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+        # Проверяем права администратора
+        if not self.is_admin(call.from_user.id):
+            self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
+            return
+        
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id)
+        
+        # Номер страницы передается в callback_data вида users_dir:page=N
+        page = 0
+        if call.data.startswith("users_dir:page="):
+            page = max(0, int(call.data.split("=", 1)[1]))
+        
+        # Получаем страницу справочника пользователей
+        text, total_pages = self.get_users_directory_page(page)
+        if text is None and page >= total_pages:
+            # Страница пропала после удаления пользователей - показываем последнюю
+            page = total_pages - 1
+            text, total_pages = self.get_users_directory_page(page)
+        
+        if text is None:
+            text = f"{EMOJI['info']} Справочник пользователей пуст."
+        
+        # Клавиатура с навигацией по страницам и кнопкой "Назад"
+        keyboard = self._build_directory_keyboard(page, total_pages)
+        
+        # Обновляем сообщение
+        self.edit_callback_message(call, text, keyboard)
     
+    @log_callback_errors
     def cmd_set_admin_callback(self, call: types.CallbackQuery) -> None:
         """
         Обработчик для команды назначения администратора.
@@ -1487,44 +1202,24 @@ class UserHandler(BaseHandler):
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # Проверяем права администратора
-            if not self.is_admin(call.from_user.id):
-                self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
-                return
-            
-            # Текст с инструкцией по назначению администратора
-            text = (
-                f"{EMOJI['admin']} <b>Назначение администратора</b>\n\n"
-                f"Для назначения пользователя администратором отправьте команду в формате:\n"
-                f"<code>/set_admin @username</code>\n\n"
-                f"После назначения пользователь получит доступ ко всем административным функциям бота."
-            )
-            
-            # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_users"
-            )
-            keyboard.add(back_btn)
-            
-            # Обновляем сообщение
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса cmd_set_admin: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+        # Проверяем права администратора
+        if not self.is_admin(call.from_user.id):
+            self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
+            return
+        
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id)
+        
+        # Текст с инструкцией по назначению администратора
+        text = SET_ADMIN_USAGE_TEXT
+        
+        # Клавиатура с кнопкой "Назад"
+        keyboard = self._back_to_users_kb
+        
+        # Обновляем сообщение
+        self.edit_callback_message(call, text, keyboard)
     
+    @log_callback_errors
     def cmd_remove_admin_callback(self, call: types.CallbackQuery) -> None:
         """
         Обработчик для команды отзыва прав администратора.
@@ -1532,42 +1227,21 @@ class UserHandler(BaseHandler):
         Args:
             call: Callback-запрос от кнопки
         """
-        try:
-            # Проверяем права администратора
-            if not self.is_admin(call.from_user.id):
-                self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
-                return
-            
-            # Текст с инструкцией по отзыву прав администратора
-            text = (
-                f"{EMOJI['user']} <b>Отзыв прав администратора</b>\n\n"
-                f"Для отзыва прав администратора у пользователя отправьте команду в формате:\n"
-                f"<code>/remove_admin @username</code>\n\n"
-                f"После отзыва прав пользователь потеряет доступ к административным функциям бота."
-            )
-            
-            # Создаем клавиатуру с кнопкой "Назад"
-            keyboard = types.InlineKeyboardMarkup()
-            back_btn = types.InlineKeyboardButton(
-                text=f"{EMOJI['back']} Назад", 
-                callback_data="menu_users"
-            )
-            keyboard.add(back_btn)
-            
-            # Обновляем сообщение
-            self.bot.edit_message_text(
-                chat_id=call.message.chat.id,
-                message_id=call.message.message_id,
-                text=text,
-                reply_markup=keyboard,
-                parse_mode='HTML'
-            )
-            
-            # Отвечаем на callback-запрос
-            self.answer_callback_query(call.id)
-            
-        except Exception as e:
-            logger.error(f"Ошибка в обработчике callback-запроса cmd_remove_admin: {str(e)}")
-            self.answer_callback_query(call.id, f"Ошибка: {str(e)}", show_alert=True)
+        # Проверяем права администратора
+        if not self.is_admin(call.from_user.id):
+            self.answer_callback_query(call.id, "У вас нет прав администратора", show_alert=True)
+            return
+        
+        # Сразу отвечаем на callback-запрос, чтобы убрать индикатор загрузки на кнопке
+        self.answer_callback_query(call.id)
+        
+        # Текст с инструкцией по отзыву прав администратора
+        text = REMOVE_ADMIN_USAGE_TEXT
+        
+        # Клавиатура с кнопкой "Назад"
+        keyboard = self._back_to_users_kb
+        
+        # Обновляем сообщение
+        self.edit_callback_message(call, text, keyboard)
     
     # ... остальные методы класса ... 
\ No newline at end of file
@@ -6,20 +6,160 @@
 """
 
 import sqlite3
+import errno
+import functools
 import logging
 import os
+import queue
 import shutil
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Optional, List
-import json
 from datetime import datetime
 
-from config import DB_PATH, SCHEMA_PATH
+from config import DB_PATH, SCHEMA_PATH, DB_POOL_SIZE, DB_STATEMENT_CACHE_SIZE, BACKUP_STAT_WORKERS
 from bot.constants import DEFAULT_NOTIFICATION_SETTINGS, DEFAULT_NOTIFICATION_TEMPLATES
 from bot.core.base_repository import BaseRepository
 
 logger = logging.getLogger(__name__)
 
+# Версия структуры таблиц, проверяемой check_table_structure.
+# Увеличивается при каждом изменении описания таблиц в check_table_structure
+SCHEMA_VERSION = 1
+
+# Версия набора шаблонов и настроек по умолчанию (DEFAULT_NOTIFICATION_*).
+# Увеличивается при их изменении, чтобы добавить новые значения в существующие базы
+DEFAULTS_VERSION = 1
+
+# Версия структуры журнала уведомлений (NOTIFICATION_LOG_STATEMENTS).
+# Отметка хранится в таблице meta самой базы, поэтому восстановленный файл
+# проверяется по своей отметке
+NOTIFICATION_LOGS_VERSION = 1
+
+# Минимальный интервал между обслуживанием базы данных (ANALYZE, PRAGMA optimize), в секундах
+MAINTENANCE_INTERVAL = 24 * 60 * 60
+
+# Параметры, применяемые к каждому новому соединению:
+# WAL позволяет читать во время записи, synchronous=NORMAL в режиме WAL
+# не выполняет fsync при каждом коммите, busy_timeout ожидает блокировку
+# вместо немедленной ошибки "database is locked"
+CONNECTION_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
+]
+
+# Индексы, создаваемые при каждом запуске (в том числе для уже существующих баз)
+INDEX_STATEMENTS = [
+    # Частичный покрывающий индекс для выборки получателей оповещений
+    # (столбец условия нужен для покрытия)
+    """
+    CREATE INDEX IF NOT EXISTS idx_users_notifiable
+    ON users (telegram_id, is_notifications_enabled)
+    WHERE is_notifications_enabled = 1
+    """,
+    # Индекс по месяцу и дню рождения (birth_date хранится в формате YYYY-MM-DD)
+    """
+    CREATE INDEX IF NOT EXISTS idx_users_birth_month_day
+    ON users (substr(birth_date, 6, 5))
+    """,
+    # Уникальные индексы шаблонов и настроек уведомлений (на них опирается
+    # INSERT OR IGNORE значений по умолчанию). В базе, созданной до их появления,
+    # могут быть дубликаты, поэтому сначала оставляем по одной строке:
+    # настройки переводятся на сохраняемый шаблон с наименьшим ID
+    """
+    UPDATE notification_settings
+    SET template_id = (
+        SELECT MIN(keep.id)
+        FROM notification_templates AS dup
+        JOIN notification_templates AS keep
+            ON keep.name = dup.name AND keep.category = dup.category
+        WHERE dup.id = notification_settings.template_id
+    )
+    WHERE template_id NOT IN (
+        SELECT MIN(id) FROM notification_templates GROUP BY name, category
+    )
+    AND template_id IN (SELECT id FROM notification_templates)
+    """,
+    """
+    DELETE FROM notification_templates
+    WHERE id NOT IN (SELECT MIN(id) FROM notification_templates GROUP BY name, category)
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_notification_templates_name_category
+    ON notification_templates (name, category)
+    """,
+    """
+    DELETE FROM notification_settings
+    WHERE id NOT IN (
+        SELECT MIN(id) FROM notification_settings GROUP BY template_id, days_before, time
+    )
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_notification_settings_template_days_time
+    ON notification_settings (template_id, days_before, time)
+    """,
+]
+
+# Таблица журнала уведомлений, перевод времени отправки в Unix-время и индексы
+# под запросы журнала. Выполняются при каждом запуске и после восстановления:
+# резервная копия может быть сделана до изменения структуры журнала
+NOTIFICATION_LOG_STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS notification_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        message_text TEXT NOT NULL,
+        status TEXT NOT NULL,
+        error_message TEXT,
+        sent_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    )
+    """,
+    # Записи, сохраненные до перехода на Unix-время, хранят текст с местным временем
+    """
+    UPDATE notification_logs
+    SET sent_at = CAST(strftime('%s', sent_at, 'utc') AS INTEGER)
+    WHERE typeof(sent_at) = 'text'
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_notification_logs_user_sent
+    ON notification_logs (user_id, sent_at DESC)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_notification_logs_status_sent
+    ON notification_logs (status, sent_at DESC)
+    """,
+    # Покрывающий индекс для статистики за период; по первому столбцу
+    # он же обслуживает остальные выборки по времени отправки
+    """
+    CREATE INDEX IF NOT EXISTS idx_notification_logs_sent_status
+    ON notification_logs (sent_at, status)
+    """,
+    # Прежний индекс только по sent_at заменен индексом выше
+    "DROP INDEX IF EXISTS idx_notification_logs_sent",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_schema() -> str:
+    """
+    Чтение SQL-схемы базы данных.
+    
+    Файл схемы не меняется во время работы, поэтому читается один раз за процесс.
+    
+    Returns:
+        str: Текст SQL-схемы
+    """
+    with open(SCHEMA_PATH, 'rb') as f:
+        return f.read().decode('utf-8')
+
 
 class DatabaseManager:
     """
@@ -29,14 +169,26 @@ class DatabaseManager:
     и создание базового подключения.
     """
     
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, pool_size: int = DB_POOL_SIZE):
         """
         Инициализация менеджера базы данных.
         
         Args:
             db_path: Путь к файлу базы данных SQLite
+            pool_size: Максимальное количество соединений, хранимых для повторного использования
         """
-        self.db_path = db_path
+        # Путь приводится к абсолютному один раз: дальше он не разрешается заново,
+        # а байтовая форма передается sqlite3.connect без перекодирования
+        self.db_path = os.path.realpath(db_path)
+        self._db_path_bytes = os.fsencode(self.db_path)
+        # Признак существования файла базы; обновляется при создании и восстановлении
+        self._db_exists = os.path.exists(self.db_path)
+        # Пул открытых соединений, общий для всех потоков обработчиков
+        self._pool = queue.LifoQueue(maxsize=pool_size)
+        # Отдельный пул соединений только для чтения: в режиме WAL они читают
+        # параллельно с записью и не занимают соединения пишущих запросов
+        self._read_pool = queue.LifoQueue(maxsize=pool_size)
+        self._maintenance_thread: Optional[threading.Thread] = None
         self.backup_dir = os.path.join(os.path.dirname(self.db_path), "backups")
         self._ensure_data_directory()
         self._init_db()
@@ -59,28 +211,192 @@ class DatabaseManager:
         logger.info(f"Проверка наличия директории данных: {data_dir}")
         logger.info(f"Проверка наличия директории резервных копий: {self.backup_dir}")
         
+    def _create_connection(self) -> sqlite3.Connection:
+        """
+        Создание нового соединения с базой данных.
+        
+        Returns:
+            sqlite3.Connection: Соединение с базой данных
+        """
+        # Соединение может быть возвращено в пул и взято другим потоком.
+        # Соединения из пула живут долго, поэтому кэш подготовленных запросов
+        # увеличен: повторяющиеся запросы не разбираются заново
+        conn = sqlite3.connect(
+            self._db_path_bytes,
+            check_same_thread=False,
+            cached_statements=DB_STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure_connection(conn)
+        return conn
+    
+    def _create_read_connection(self) -> sqlite3.Connection:
+        """
+        Создание нового соединения с базой данных только для чтения.
+        
+        Returns:
+            sqlite3.Connection: Соединение, в котором запрещены изменения данных
+        """
+        conn = self._create_connection()
+        conn.execute("PRAGMA query_only = ON")
+        return conn
+    
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """
+        Применение параметров производительности к соединению.
+        
+        Выполняется один раз при открытии соединения: соединения из пула
+        переиспользуются и сохраняют параметры.
+        
+        Args:
+            conn: Соединение с базой данных
+        """
+        for pragma in CONNECTION_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error as e:
+                logger.warning(f"Не удалось применить {pragma}: {str(e)}")
+    
+    def _backup_to_file(self, conn: sqlite3.Connection, target_path: str) -> None:
+        """
+        Копирование базы данных в файл через Online Backup API SQLite.
+        
+        В отличие от копирования файла, учитывает изменения из WAL-журнала
+        и не дает несогласованной копии при одновременной записи.
+        
+        Args:
+            conn: Соединение с копируемой базой данных
+            target_path: Путь к файлу копии
+        """
+        target = sqlite3.connect(target_path)
+        try:
+            conn.backup(target, pages=1024)
+            # Копия должна быть самодостаточным файлом без WAL-журнала
+            target.execute("PRAGMA journal_mode=DELETE")
+        finally:
+            target.close()
+    
+    def _copy_file(self, source_path: str, target_path: str) -> None:
+        """
+        Копирование файла средствами ядра.
+        
+        Использует os.copy_file_range: данные не проходят через память процесса,
+        а на файловых системах с поддержкой reflink (Btrfs, XFS) копия создается
+        без копирования блоков. Если системный вызов недоступен, используется
+        shutil.copyfile. Время изменения файла сохраняется, как в shutil.copy2.
+        
+        Args:
+            source_path: Путь к исходному файлу
+            target_path: Путь к файлу копии
+        """
+        copied = False
+        if hasattr(os, "copy_file_range"):
+            with open(source_path, 'rb') as src, open(target_path, 'wb') as dst:
+                try:
+                    remaining = os.fstat(src.fileno()).st_size
+                    while remaining > 0:
+                        written = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if written == 0:
+                            break
+                        remaining -= written
+                    copied = remaining <= 0
+                except OSError as e:
+                    if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP):
+                        raise
+        
+        if not copied:
+            shutil.copyfile(source_path, target_path)
+        shutil.copystat(source_path, target_path)
+    
+    def close_all_connections(self) -> None:
+        """
+        Закрытие всех соединений, хранящихся в пуле.
+        
+        Вызывается перед заменой файла базы данных.
+        """
+        for pool in (self._pool, self._read_pool):
+            while True:
+                try:
+                    conn = pool.get_nowait()
+                except queue.Empty:
+                    break
+                conn.close()
+    
     @contextmanager
     def get_connection(self):
         """
         Контекстный менеджер для соединения с базой данных.
         
-        Автоматически открывает и закрывает соединение с базой данных,
-        а также управляет транзакциями (commit/rollback).
+        Берет соединение из пула (или открывает новое, если пул пуст),
+        управляет транзакциями (commit/rollback) и возвращает соединение
+        в пул после использования.
         
         Yields:
             Соединение с базой данных
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            conn = self._create_connection()
+        
+        reusable = True
         try:
             yield conn
             conn.commit()
         except Exception as e:
-            conn.rollback()
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                reusable = False
             logger.error(f"Ошибка базы данных: {str(e)}")
             raise
         finally:
-            conn.close()
+            if reusable:
+                try:
+                    self._pool.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+            else:
+                conn.close()
+    
+    @contextmanager
+    def get_read_connection(self):
+        """
+        Контекстный менеджер для соединения только для чтения.
+        
+        Берет соединение из пула чтения (или открывает новое, если пул пуст)
+        и возвращает его в пул после использования. Попытка изменить данные
+        через такое соединение завершается ошибкой.
+        
+        Yields:
+            Соединение с базой данных
+        """
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._create_read_connection()
+        
+        reusable = True
+        try:
+            yield conn
+        except Exception as e:
+            logger.error(f"Ошибка базы данных: {str(e)}")
+            raise
+        finally:
+            # Незавершенная транзакция чтения удерживала бы снимок WAL
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                reusable = False
+            
+            if reusable:
+                try:
+                    self._read_pool.put_nowait(conn)
+                except queue.Full:
+                    conn.close()
+            else:
+                conn.close()
             
     def _init_db(self):
         """
@@ -97,25 +413,42 @@ class DatabaseManager:
                 raise FileNotFoundError(f"Файл схемы {SCHEMA_PATH} не найден!")
 
             # Проверяем существование базы данных
-            db_exists = os.path.exists(self.db_path)
+            db_exists = self._db_exists
 
             # Создаем соединение с базой данных (создает файл если его нет)
             with self.get_connection() as conn:
                 if not db_exists:
                     logger.info("Создание новой базы данных")
                     # Читаем и выполняем SQL-схему
-                    with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
-                        schema = f.read()
+                    schema = _load_schema()
 
-                    # Выполняем каждый SQL-запрос отдельно
-                    for statement in schema.split(';'):
-                        if statement.strip():
-                            conn.execute(statement)
+                    # Выполняем схему целиком одним скриптом: разбор выполняет SQLite,
+                    # поэтому точки с запятой внутри строк и триггеров не разрывают запросы.
+                    # Транзакция остается открытой: схема, значения по умолчанию и индексы
+                    # фиксируются одним коммитом при выходе из get_connection
+                    conn.executescript(f"BEGIN;\n{schema}\n")
+                else:
+                    conn.execute("BEGIN")
 
+                self._ensure_meta_table(conn)
+                # Индексы создаются до значений по умолчанию: уникальные индексы
+                # должны существовать до INSERT OR IGNORE
+                self._ensure_indexes(conn)
+                defaults_version = self._get_meta(conn, 'defaults_version')
+                
+                if defaults_version is None and db_exists:
+                    # База создана до появления отметки: значения по умолчанию
+                    # были добавлены при ее создании
+                    self._set_meta(conn, 'defaults_version', DEFAULTS_VERSION)
+                elif defaults_version is None or int(defaults_version) < DEFAULTS_VERSION:
                     # Инициализация базовых настроек
-                    self._init_default_settings()
+                    self._init_default_settings(conn)
+                    self._set_meta(conn, 'defaults_version', DEFAULTS_VERSION)
+
+                self._ensure_notification_logs(conn)
 
-                logger.info("База данных успешно инициализирована")
+            self._db_exists = True
+            logger.info("База данных успешно инициализирована")
 
         except FileNotFoundError as e:
             logger.error(f"Файл схемы не найден: {str(e)}")
@@ -125,91 +458,243 @@ class DatabaseManager:
             logger.error(f"Ошибка инициализации базы данных: {str(e)}")
             raise
             
-    def _init_default_settings(self):
+    def _ensure_meta_table(self, conn: sqlite3.Connection) -> None:
+        """
+        Создание служебной таблицы meta, если она отсутствует.
+        
+        Таблица хранит отметки вида ключ-значение о выполненной однократной работе.
+        
+        Args:
+            conn: Соединение с базой данных
+        """
+        conn.execute("""
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        )
+        """)
+    
+    def _get_meta(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        """
+        Получение значения из служебной таблицы meta.
+        
+        Args:
+            conn: Соединение с базой данных
+            key: Ключ
+            
+        Returns:
+            Optional[str]: Значение или None, если ключ отсутствует
+        """
+        row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+    
+    def _set_meta(self, conn: sqlite3.Connection, key: str, value) -> None:
+        """
+        Сохранение значения в служебной таблице meta.
+        
+        Args:
+            conn: Соединение с базой данных
+            key: Ключ
+            value: Значение (сохраняется как строка)
+        """
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, str(value))
+        )
+    
+    def _ensure_indexes(self, conn: sqlite3.Connection) -> None:
+        """
+        Создание индексов, если они отсутствуют.
+        
+        Перед созданием уникальных индексов удаляет строки-дубликаты, чтобы
+        создание не завершалось ошибкой на уже существующих данных.
+        
+        Args:
+            conn: Соединение с базой данных
+        """
+        for statement in INDEX_STATEMENTS:
+            try:
+                conn.execute(statement)
+            except sqlite3.OperationalError as e:
+                logger.warning(f"Не удалось создать индекс: {str(e)}")
+            
+    def _ensure_notification_logs(self, conn: sqlite3.Connection) -> None:
+        """
+        Приведение таблицы журнала уведомлений к текущей структуре.
+        
+        Создает таблицу, если она отсутствует, переводит время отправки старых
+        записей в Unix-время и создает индексы журнала. Пропускается, если база
+        уже отмечена версией NOTIFICATION_LOGS_VERSION.
+        
+        Args:
+            conn: Соединение с базой данных
+        """
+        self._ensure_meta_table(conn)
+        version = self._get_meta(conn, 'notification_logs_version')
+        if version is not None and int(version) >= NOTIFICATION_LOGS_VERSION:
+            return
+        
+        completed = True
+        for statement in NOTIFICATION_LOG_STATEMENTS:
+            try:
+                conn.execute(statement)
+            except sqlite3.OperationalError as e:
+                completed = False
+                logger.warning(f"Не удалось обновить таблицу журнала уведомлений: {str(e)}")
+        
+        # Отметка ставится только после полного обновления, иначе оно повторится при следующем запуске
+        if completed:
+            self._set_meta(conn, 'notification_logs_version', NOTIFICATION_LOGS_VERSION)
+            
+    def _init_default_settings(self, conn: sqlite3.Connection):
         """
         Инициализация настроек по умолчанию.
         
         Создает таблицы для шаблонов и настроек уведомлений, если они не существуют,
-        а также добавляет шаблоны и настройки по умолчанию.
+        а также добавляет шаблоны и настройки по умолчанию. Выполняется в транзакции
+        переданного соединения, фиксация остается за вызывающим кодом.
+        
+        Args:
+            conn: Соединение с базой данных
         """
         try:
-            with self.get_connection() as conn:
-                # Проверяем существование таблицы notification_templates
-                conn.execute("""
-                CREATE TABLE IF NOT EXISTS notification_templates (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL,
-                    template TEXT NOT NULL,
-                    category TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    is_active BOOLEAN DEFAULT 1
-                )
-                """)
-                
-                # Проверяем существование таблицы notification_settings
-                conn.execute("""
-                CREATE TABLE IF NOT EXISTS notification_settings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    template_id INTEGER NOT NULL,
-                    days_before INTEGER NOT NULL,
-                    time TEXT NOT NULL,
-                    is_active BOOLEAN DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (template_id) REFERENCES notification_templates(id)
-                )
-                """)
-
-                # Добавляем шаблоны уведомлений по умолчанию
-                template_ids = {}
-                for template_data in DEFAULT_NOTIFICATION_TEMPLATES:
-                    # Проверяем существование шаблона
-                    existing_template = conn.execute("""
-                        SELECT id FROM notification_templates 
-                        WHERE name = ? AND category = ?
-                    """, (template_data['name'], template_data['category'])).fetchone()
-
-                    if existing_template:
-                        template_ids[template_data['name']] = existing_template['id']
-                    else:
-                        cursor = conn.execute("""
-                            INSERT INTO notification_templates (name, template, category)
-                            VALUES (?, ?, ?)
-                        """, (template_data['name'], template_data['template'], template_data['category']))
-                        template_ids[template_data['name']] = cursor.lastrowid
-
-                # Добавляем настройки уведомлений
-                for setting in DEFAULT_NOTIFICATION_SETTINGS:
-                    template_id = template_ids.get(setting['template_name'])
-                    if not template_id:
-                        continue
-                    
-                    # Проверяем существование настройки
-                    exists = conn.execute("""
-                        SELECT COUNT(*) FROM notification_settings 
-                        WHERE template_id = ? AND days_before = ? AND time = ?
-                    """, (template_id, setting['days_before'], setting['time'])).fetchone()[0]
+            # Проверяем существование таблицы notification_templates
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS notification_templates (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                template TEXT NOT NULL,
+                category TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                is_active BOOLEAN DEFAULT 1
+            )
+            """)
+            
+            # Проверяем существование таблицы notification_settings
+            conn.execute("""
+            CREATE TABLE IF NOT EXISTS notification_settings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                template_id INTEGER NOT NULL,
+                days_before INTEGER NOT NULL,
+                time TEXT NOT NULL,
+                is_active BOOLEAN DEFAULT 1,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (template_id) REFERENCES notification_templates(id)
+            )
+            """)
+
+            # Уникальные индексы позволяют добавлять значения по умолчанию
+            # через INSERT OR IGNORE без предварительной проверки каждой строки
+            conn.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ux_notification_templates_name_category
+            ON notification_templates (name, category)
+            """)
+            conn.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ux_notification_settings_template_days_time
+            ON notification_settings (template_id, days_before, time)
+            """)
+
+            # Добавляем шаблоны уведомлений по умолчанию
+            conn.executemany("""
+                INSERT OR IGNORE INTO notification_templates (name, template, category)
+                VALUES (?, ?, ?)
+            """, [
+                (template_data['name'], template_data['template'], template_data['category'])
+                for template_data in DEFAULT_NOTIFICATION_TEMPLATES
+            ])
 
-                    if not exists:
-                        conn.execute("""
-                            INSERT INTO notification_settings (template_id, days_before, time)
-                            VALUES (?, ?, ?)
-                        """, (template_id, setting['days_before'], setting['time']))
+            # Получаем ID шаблонов (как добавленных, так и существовавших ранее)
+            template_ids = {}
+            for row in conn.execute("SELECT id, name, category FROM notification_templates"):
+                template_ids[row['name'], row['category']] = row['id']
 
-                logger.info("Настройки по умолчанию успешно добавлены")
+            # Добавляем настройки уведомлений
+            default_categories = {
+                template_data['name']: template_data['category']
+                for template_data in DEFAULT_NOTIFICATION_TEMPLATES
+            }
+            setting_rows = []
+            for setting in DEFAULT_NOTIFICATION_SETTINGS:
+                template_name = setting['template_name']
+                template_id = template_ids.get((template_name, default_categories.get(template_name)))
+                if not template_id:
+                    continue
+                setting_rows.append((template_id, setting['days_before'], setting['time']))
+
+            conn.executemany("""
+                INSERT OR IGNORE INTO notification_settings (template_id, days_before, time)
+                VALUES (?, ?, ?)
+            """, setting_rows)
+
+            logger.info("Настройки по умолчанию успешно добавлены")
 
         except Exception as e:
             logger.error(f"Ошибка при инициализации настроек по умолчанию: {str(e)}")
             raise
             
+    def maintenance(self) -> bool:
+        """
+        Обслуживание базы данных: обновление статистики планировщика запросов.
+        
+        Пропускается, если с прошлого обслуживания прошло меньше MAINTENANCE_INTERVAL
+        (время хранится в таблице meta).
+        
+        Returns:
+            bool: True, если обслуживание выполнено, иначе False
+        """
+        try:
+            with self.get_connection() as conn:
+                self._ensure_meta_table(conn)
+                last_maintenance = self._get_meta(conn, 'last_maintenance_ts')
+                now = time.time()
+                if last_maintenance is not None and now - float(last_maintenance) < MAINTENANCE_INTERVAL:
+                    return False
+                
+                conn.execute("ANALYZE")
+                conn.execute("PRAGMA optimize")
+                self._set_meta(conn, 'last_maintenance_ts', now)
+            
+            logger.info("Обслуживание базы данных выполнено")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Ошибка обслуживания базы данных: {str(e)}")
+            return False
+    
+    def _run_maintenance(self) -> None:
+        """
+        Цикл фонового обслуживания базы данных.
+        """
+        while True:
+            self.maintenance()
+            time.sleep(MAINTENANCE_INTERVAL)
+    
+    def start_maintenance(self) -> None:
+        """
+        Запуск фонового обслуживания базы данных.
+        
+        Обслуживание выполняется в отдельном потоке, чтобы не задерживать запуск бота.
+        """
+        if self._maintenance_thread is None or not self._maintenance_thread.is_alive():
+            self._maintenance_thread = threading.Thread(target=self._run_maintenance, name="db-maintenance")
+            self._maintenance_thread.daemon = True
+            self._maintenance_thread.start()
+    
     def check_table_structure(self):
         """
         Проверка структуры таблиц.
         
         Проверяет структуру таблиц и создает отсутствующие таблицы и столбцы.
+        Проверка пропускается, если база уже приведена к SCHEMA_VERSION
+        (номер хранится в PRAGMA user_version).
         """
         try:
             with self.get_connection() as conn:
+                if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                    logger.info("Структура таблиц актуальна, проверка пропущена")
+                    return
+                
                 # Проверяем существование базовых таблиц
                 tables = {
                     "users": [
@@ -254,12 +739,17 @@ class DatabaseManager:
                     ]
                 }
                 
+                # Запросы с параметрами: текст не меняется между итерациями,
+                # поэтому подготовленное выражение берется из кэша соединения
+                table_exists_query = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+                table_columns_query = "SELECT name FROM pragma_table_info(?)"
+                
+                # Недостающие столбцы (таблица, описание столбца) добавляются после проверки
+                alters = []
+                
                 for table_name, columns in tables.items():
                     # Проверяем существование таблицы
-                    table_exists = conn.execute(f"""
-                        SELECT name FROM sqlite_master 
-                        WHERE type='table' AND name='{table_name}'
-                    """).fetchone()
+                    table_exists = conn.execute(table_exists_query, (table_name,)).fetchone()
                     
                     if not table_exists:
                         # Создаем таблицу
@@ -271,21 +761,43 @@ class DatabaseManager:
                         """)
                     else:
                         # Проверяем структуру таблицы
-                        existing_columns = [row['name'] for row in conn.execute(f"PRAGMA table_info({table_name})")]
+                        existing_columns = {row['name'] for row in conn.execute(table_columns_query, (table_name,))}
                         
                         for column in columns:
                             column_name = column.split()[0]
                             if column_name not in existing_columns:
-                                # Добавляем отсутствующий столбец
                                 logger.info(f"Добавление столбца {column_name} в таблицу {table_name}")
-                                conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {column}")
+                                alters.append((table_name, column))
                 
+                # Все изменения схемы выполняются одной транзакцией: блокировка
+                # берется один раз и на диск записывается один коммит.
+                # Имена таблиц и столбцов берутся из словаря выше, а не из ввода
+                conn.execute("BEGIN IMMEDIATE")
+                for table_name, column in alters:
+                    conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {column}")
+                # PRAGMA не поддерживает параметры запроса; значение - целочисленная константа
+                conn.execute(f"PRAGMA user_version = {int(SCHEMA_VERSION)}")
+                conn.commit()
                 logger.info("Структура таблиц проверена и обновлена")
                 
         except Exception as e:
             logger.error(f"Ошибка проверки структуры таблиц: {str(e)}")
             raise
     
+    def _make_timestamp(self) -> str:
+        """
+        Формирование отметки времени для имени файла резервной копии.
+        
+        Форматирование без strftime: не зависит от локали и выполняется быстрее.
+        
+        Returns:
+            str: Местное время в формате YYYYMMDD_HHMMSS
+        """
+        t = time.localtime()
+        return "%04d%02d%02d_%02d%02d%02d" % (
+            t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec
+        )
+    
     def create_backup(self) -> Optional[str]:
         """
         Создание резервной копии базы данных.
@@ -295,17 +807,19 @@ class DatabaseManager:
         """
         try:
             # Проверяем существование базы данных
-            if not os.path.exists(self.db_path):
+            if not self._db_exists:
                 logger.error(f"База данных не найдена: {self.db_path}")
                 return None
                 
             # Создаем имя файла резервной копии
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._make_timestamp()
             backup_filename = f"backup_{timestamp}.db"
             backup_path = os.path.join(self.backup_dir, backup_filename)
             
-            # Копируем файл базы данных
-            shutil.copy2(self.db_path, backup_path)
+            # Копируем базу данных средствами SQLite (Online Backup API):
+            # копия согласована даже при одновременной записи
+            with self.get_connection() as conn:
+                self._backup_to_file(conn, backup_path)
             
             logger.info(f"Резервная копия создана: {backup_path}")
             return backup_path
@@ -322,13 +836,33 @@ class DatabaseManager:
             List[str]: Список путей к файлам резервных копий
         """
         try:
-            backups = [f for f in os.listdir(self.backup_dir) if f.startswith("backup_") and f.endswith(".db")]
+            with os.scandir(self.backup_dir) as entries:
+                backups = [
+                    (entry.name, entry.path) for entry in entries
+                    if entry.name.startswith("backup_") and entry.name.endswith(".db")
+                ]
             backups.sort(reverse=True)  # Сортируем по убыванию (новые в начале)
-            return [os.path.join(self.backup_dir, b) for b in backups]
+            return [path for _, path in backups]
         except Exception as e:
             logger.error(f"Ошибка получения списка резервных копий: {str(e)}")
             return []
     
+    def _stat_backup_entry(self, entry: os.DirEntry) -> Optional[os.stat_result]:
+        """
+        Получение метаданных файла резервной копии.
+        
+        Args:
+            entry: Запись каталога резервных копий
+            
+        Returns:
+            Optional[os.stat_result]: Метаданные файла или None в случае ошибки
+        """
+        try:
+            return entry.stat()
+        except (ValueError, OSError) as e:
+            logger.warning(f"Ошибка при обработке файла резервной копии {entry.name}: {str(e)}")
+            return None
+    
     def get_backup_list(self) -> List[dict]:
         """
         Получение списка резервных копий с информацией о них.
@@ -340,27 +874,32 @@ class DatabaseManager:
             # Получаем список файлов резервных копий
             backup_files = []
             
-            # Смотрим все .db файлы в директории резервных копий
-            for f in os.listdir(self.backup_dir):
-                if f.endswith(".db") and (f != "birthday_bot.db"):  # Исключаем основной файл БД
-                    try:
-                        file_path = os.path.join(self.backup_dir, f)
-                        file_stats = os.stat(file_path)
-                        
-                        # Получаем дату создания файла из метаданных файловой системы
-                        created_at = datetime.fromtimestamp(file_stats.st_ctime)
-                        
-                        # Получаем размер файла
-                        size = file_stats.st_size
-                        
-                        backup_files.append({
-                            'filename': f,
-                            'path': file_path,
-                            'created_at': created_at,
-                            'size': size
-                        })
-                    except (ValueError, OSError) as e:
-                        logger.warning(f"Ошибка при обработке файла резервной копии {f}: {str(e)}")
+            # Смотрим все .db файлы в директории резервных копий; scandir отдает
+            # готовые пути без отдельного listdir + join
+            with os.scandir(self.backup_dir) as entries:
+                backup_entries = [
+                    entry for entry in entries
+                    if entry.name.endswith(".db") and entry.name != "birthday_bot.db"  # Исключаем основной файл БД
+                ]
+            
+            # stat() освобождает GIL, поэтому на медленном (сетевом) диске
+            # запросы метаданных выполняются параллельно
+            if BACKUP_STAT_WORKERS > 0 and len(backup_entries) > 1:
+                with ThreadPoolExecutor(max_workers=BACKUP_STAT_WORKERS) as executor:
+                    entry_stats = list(executor.map(self._stat_backup_entry, backup_entries))
+            else:
+                entry_stats = [self._stat_backup_entry(entry) for entry in backup_entries]
+            
+            for entry, file_stats in zip(backup_entries, entry_stats):
+                if file_stats is None:
+                    continue
+                backup_files.append({
+                    'filename': entry.name,
+                    'path': entry.path,
+                    # Дата создания файла из метаданных файловой системы
+                    'created_at': datetime.fromtimestamp(file_stats.st_ctime),
+                    'size': file_stats.st_size
+                })
             
             # Сортируем резервные копии по дате создания (новые в начале)
             backup_files.sort(key=lambda x: x['created_at'], reverse=True)
@@ -370,6 +909,24 @@ class DatabaseManager:
             logger.error(f"Ошибка получения информации о резервных копиях: {str(e)}")
             return []
     
+    def _find_backup_file(self, backup_name: str) -> Optional[str]:
+        """
+        Поиск обычного файла резервной копии одним вызовом stat.
+        
+        Args:
+            backup_name: Имя файла резервной копии
+            
+        Returns:
+            Optional[str]: Полный путь к файлу или None, если такого файла нет
+        """
+        backup_path = os.path.join(self.backup_dir, backup_name)
+        try:
+            if stat.S_ISREG(os.stat(backup_path).st_mode):
+                return backup_path
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        return None
+    
     def get_backup_path(self, backup_name: str) -> Optional[str]:
         """
         Получение полного пути к файлу резервной копии.
@@ -381,12 +938,9 @@ class DatabaseManager:
             str: Полный путь к файлу резервной копии или None, если файл не найден
         """
         try:
-            # Формируем полный путь
-            backup_path = os.path.join(self.backup_dir, backup_name)
-            
-            # Проверяем существование файла
-            if not os.path.exists(backup_path) or not os.path.isfile(backup_path):
-                logger.warning(f"Файл резервной копии не найден: {backup_path}")
+            backup_path = self._find_backup_file(backup_name)
+            if backup_path is None:
+                logger.warning(f"Файл резервной копии не найден: {os.path.join(self.backup_dir, backup_name)}")
                 return None
                 
             return backup_path
@@ -406,8 +960,7 @@ class DatabaseManager:
             bool: True, если файл существует, иначе False
         """
         try:
-            backup_path = os.path.join(self.backup_dir, backup_name)
-            return os.path.exists(backup_path) and os.path.isfile(backup_path)
+            return self._find_backup_file(backup_name) is not None
         except Exception as e:
             logger.error(f"Ошибка проверки существования резервной копии: {str(e)}")
             return False
@@ -423,11 +976,9 @@ class DatabaseManager:
             bool: True, если файл успешно удален, иначе False
         """
         try:
-            backup_path = os.path.join(self.backup_dir, backup_name)
-            
-            # Проверяем существование файла
-            if not os.path.exists(backup_path) or not os.path.isfile(backup_path):
-                logger.warning(f"Файл резервной копии не найден: {backup_path}")
+            backup_path = self._find_backup_file(backup_name)
+            if backup_path is None:
+                logger.warning(f"Файл резервной копии не найден: {os.path.join(self.backup_dir, backup_name)}")
                 return False
                 
             # Удаляем файл
@@ -466,9 +1017,17 @@ class DatabaseManager:
             # Формируем путь для сохранения файла
             backup_path = os.path.join(self.backup_dir, filename)
             
-            # Сохраняем файл
-            with open(backup_path, 'wb') as f:
-                f.write(file_content)
+            # Сохраняем файл без промежуточного буфера Python: данные передаются
+            # ядру напрямую из переданного объекта, fsync выполняется один раз в конце
+            fd = os.open(backup_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                view = memoryview(file_content)
+                written = 0
+                while written < len(view):
+                    written += os.write(fd, view[written:])
+                os.fsync(fd)
+            finally:
+                os.close(fd)
                 
             logger.info(f"Загруженная резервная копия сохранена: {backup_path}")
             return backup_path
@@ -477,6 +1036,24 @@ class DatabaseManager:
             logger.error(f"Ошибка сохранения загруженной резервной копии: {str(e)}")
             return None
             
+    def _quick_check(self) -> bool:
+        """
+        Быстрая проверка целостности рабочей базы данных.
+        
+        PRAGMA quick_check проверяет страницы и записи за линейное время,
+        пропуская дорогую сверку индексов с таблицами из integrity_check.
+        
+        Returns:
+            bool: True, если база данных не повреждена, иначе False
+        """
+        try:
+            with self.get_connection() as conn:
+                row = conn.execute("PRAGMA quick_check").fetchone()
+            return row is not None and row[0] == 'ok'
+        except sqlite3.DatabaseError as e:
+            logger.error(f"Ошибка проверки целостности базы данных: {str(e)}")
+            return False
+    
     def restore_from_backup(self, backup_path: str) -> bool:
         """
         Восстановление базы данных из резервной копии.
@@ -494,16 +1071,52 @@ class DatabaseManager:
                 return False
                 
             # Создаем резервную копию текущей базы данных
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = self._make_timestamp()
             current_backup_filename = f"before_restore_{timestamp}.db"
             current_backup_path = os.path.join(self.backup_dir, current_backup_filename)
             
-            # Копируем текущую базу данных
-            if os.path.exists(self.db_path):
-                shutil.copy2(self.db_path, current_backup_path)
+            if self._db_exists:
+                # Копируем текущую базу данных
+                with self.get_connection() as conn:
+                    self._backup_to_file(conn, current_backup_path)
+                
+                # Восстанавливаем из резервной копии постранично в рабочую базу:
+                # открытые соединения сразу видят восстановленные данные
+                source = sqlite3.connect(backup_path)
+                try:
+                    with self.get_connection() as conn:
+                        source.backup(conn, pages=1024)
+                finally:
+                    source.close()
+                
+                # Поврежденную копию не оставляем рабочей: возвращаем снимок
+                if not self._quick_check():
+                    logger.error(f"Резервная копия повреждена, база данных возвращена к состоянию до восстановления: {backup_path}")
+                    snapshot = sqlite3.connect(current_backup_path)
+                    try:
+                        with self.get_connection() as conn:
+                            snapshot.backup(conn, pages=1024)
+                    finally:
+                        snapshot.close()
+                    return False
+            else:
+                # Рабочей базы нет - достаточно скопировать файл
+                self.close_all_connections()
+                self._copy_file(backup_path, self.db_path)
+                self._db_exists = True
                 
-            # Восстанавливаем из резервной копии
-            shutil.copy2(backup_path, self.db_path)
+                if not self._quick_check():
+                    logger.error(f"Резервная копия повреждена: {backup_path}")
+                    self.close_all_connections()
+                    os.remove(self.db_path)
+                    self._db_exists = False
+                    return False
+            
+            # В резервной копии может не быть индексов и изменений структуры,
+            # добавленных позже
+            with self.get_connection() as conn:
+                self._ensure_indexes(conn)
+                self._ensure_notification_logs(conn)
             
             logger.info(f"База данных восстановлена из резервной копии: {backup_path}")
             return True
@@ -8,6 +8,7 @@
 from typing import List, Dict, Optional, Any, Tuple
 import logging
 import sqlite3
+import time
 from datetime import datetime, timedelta, date
 
 from bot.core.models import NotificationLog
@@ -16,6 +17,139 @@ from bot.repositories.database_manager import DatabaseManager
 
 logger = logging.getLogger(__name__)
 
+# Тексты запросов вынесены в константы: один и тот же объект строки
+# при каждом вызове находит готовое выражение в кэше соединения
+_SQL_INSERT_LOG = """
+INSERT INTO notification_logs (
+    user_id,
+    message_text,
+    status,
+    error_message,
+    sent_at
+) VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_DELETE_BY_ID = "DELETE FROM notification_logs WHERE id = ?"
+
+_SQL_GET_BY_ID = """
+SELECT
+    id,
+    user_id,
+    message_text as message,
+    status,
+    error_message,
+    sent_at
+FROM notification_logs
+WHERE id = ?
+"""
+
+_SQL_GET_BY_USER = """
+SELECT
+    id,
+    user_id,
+    message_text as message,
+    status,
+    error_message,
+    sent_at
+FROM notification_logs
+WHERE user_id = ?
+ORDER BY sent_at DESC
+LIMIT ?
+"""
+
+_SQL_GET_BY_STATUS = """
+SELECT
+    id,
+    user_id,
+    message_text as message,
+    status,
+    error_message,
+    sent_at
+FROM notification_logs
+WHERE status = ?
+ORDER BY sent_at DESC
+LIMIT ?
+"""
+
+_SQL_GET_BY_DATE_RANGE = """
+SELECT
+    id,
+    user_id,
+    message_text as message,
+    status,
+    error_message,
+    sent_at
+FROM notification_logs
+WHERE sent_at >= ? AND sent_at < ?
+ORDER BY sent_at DESC
+LIMIT ?
+"""
+
+_SQL_GET_ALL = """
+SELECT
+    id,
+    user_id,
+    message_text as message,
+    status,
+    error_message,
+    sent_at
+FROM notification_logs
+ORDER BY sent_at DESC
+LIMIT ?
+"""
+
+_SQL_DELETE_OLDER_THAN = """
+DELETE FROM notification_logs
+WHERE sent_at < ?
+"""
+
+_SQL_GET_WITH_ERRORS = """
+SELECT
+    id,
+    user_id,
+    message_text as message,
+    status,
+    error_message,
+    sent_at
+FROM notification_logs
+WHERE status = 'error' AND error_message IS NOT NULL
+ORDER BY sent_at DESC
+LIMIT ?
+"""
+
+_SQL_SUMMARY_BY_DATE = """
+SELECT
+    COUNT(*) as total,
+    COALESCE(SUM(status = 'success'), 0) as success,
+    COALESCE(SUM(status = 'error'), 0) as error,
+    COALESCE(SUM(status = 'warning'), 0) as warning
+FROM notification_logs
+WHERE sent_at >= ? AND sent_at < ?
+"""
+
+
+def _log_row_factory(cursor: sqlite3.Cursor, row: tuple) -> NotificationLog:
+    """
+    Построение записи журнала прямо из строки результата.
+    
+    Порядок столбцов в запросах совпадает с порядком параметров NotificationLog:
+    id, user_id, message, status, error_message, created_at.
+    """
+    return NotificationLog(*row)
+
+
+def _day_start_timestamp(value: date) -> int:
+    """
+    Unix-время начала суток (по местному времени).
+    
+    Args:
+        value: Дата
+        
+    Returns:
+        int: Количество секунд с начала эпохи
+    """
+    return int(datetime.combine(value, datetime.min.time()).timestamp())
+
 
 class NotificationLogRepository(BaseRepository):
     """
@@ -45,35 +179,14 @@ class NotificationLogRepository(BaseRepository):
             Optional[int]: ID добавленной записи или None в случае ошибки
         """
         try:
-            with self._db_manager.get_connection() as conn:
-                # Проверяем, существует ли таблица
-                conn.execute("""
-                CREATE TABLE IF NOT EXISTS notification_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    message_text TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    error_message TEXT,
-                    sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(id)
-                )
-                """)
-                
+            with self._write_conn() as conn:
                 # Добавляем новую запись
-                cursor = conn.execute("""
-                INSERT INTO notification_logs (
-                    user_id,
-                    message_text,
-                    status,
-                    error_message,
-                    sent_at
-                ) VALUES (?, ?, ?, ?, ?)
-                """, (
+                cursor = conn.execute(_SQL_INSERT_LOG, (
                     log.user_id,
                     log.message,
                     log.status,
                     log.error_message,
-                    log.created_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                    log.created_at or int(time.time())
                 ))
                 
                 logger.info(f"Новая запись журнала добавлена: user_id={log.user_id}, status={log.status}")
@@ -83,6 +196,56 @@ class NotificationLogRepository(BaseRepository):
             logger.error(f"Ошибка добавления записи журнала: {str(e)}")
             return None
             
+    def add_logs(self, logs: List[NotificationLog]) -> int:
+        """
+        Добавление нескольких записей в журнал уведомлений одной транзакцией.
+        
+        Args:
+            logs: Объекты записей журнала уведомлений для добавления
+            
+        Returns:
+            int: Количество добавленных записей
+        """
+        if not logs:
+            return 0
+        
+        try:
+            with self._write_conn() as conn:
+                now = int(time.time())
+                # Явная транзакция: все записи фиксируются одним коммитом,
+                # строки передаются executemany генератором без промежуточного списка
+                conn.execute("BEGIN")
+                cursor = conn.executemany(_SQL_INSERT_LOG, (
+                    (log.user_id, log.message, log.status, log.error_message, log.created_at or now)
+                    for log in logs
+                ))
+                
+                logger.info(f"Добавлено записей журнала: {cursor.rowcount}")
+                return cursor.rowcount
+                
+        except Exception as e:
+            logger.error(f"Ошибка добавления записей журнала: {str(e)}")
+            return 0
+            
+    def _fetch_logs(self, conn: sqlite3.Connection, query: str, params: Tuple) -> List[NotificationLog]:
+        """
+        Выполнение запроса записей журнала.
+        
+        Фабрика строк задается курсору, поэтому соединение из пула
+        сохраняет свою row_factory.
+        
+        Args:
+            conn: Соединение с базой данных
+            query: SQL-запрос, возвращающий столбцы в порядке параметров NotificationLog
+            params: Параметры запроса
+            
+        Returns:
+            List[NotificationLog]: Список объектов записей
+        """
+        cursor = conn.cursor()
+        cursor.row_factory = _log_row_factory
+        return cursor.execute(query, params).fetchall()
+            
     def delete_log(self, log_id: int) -> bool:
         """
         Удаление записи из журнала уведомлений.
@@ -94,19 +257,14 @@ class NotificationLogRepository(BaseRepository):
             bool: True, если запись удалена успешно, иначе False
         """
         try:
-            with self._db_manager.get_connection() as conn:
-                # Проверяем, существует ли запись
-                existing_log = conn.execute(
-                    "SELECT id FROM notification_logs WHERE id = ?",
-                    (log_id,)
-                ).fetchone()
+            with self._write_conn() as conn:
+                # Удаляем запись; отсутствие записи видно по количеству удаленных строк
+                cursor = conn.execute(_SQL_DELETE_BY_ID, (log_id,))
                 
-                if not existing_log:
+                if cursor.rowcount == 0:
                     logger.warning(f"Запись журнала с ID {log_id} не найдена для удаления")
                     return False
                     
-                # Удаляем запись
-                conn.execute("DELETE FROM notification_logs WHERE id = ?", (log_id,))
                 logger.info(f"Запись журнала удалена: ID {log_id}")
                 return True
                 
@@ -125,30 +283,10 @@ class NotificationLogRepository(BaseRepository):
             Optional[NotificationLog]: Объект записи или None, если запись не найдена
         """
         try:
-            with self._db_manager.get_connection() as conn:
-                log_data = conn.execute("""
-                SELECT 
-                    id,
-                    user_id,
-                    message_text as message,
-                    status,
-                    error_message,
-                    sent_at
-                FROM notification_logs
-                WHERE id = ?
-                """, (log_id,)).fetchone()
-                
-                if not log_data:
-                    return None
-                    
-                return NotificationLog(
-                    id=log_data['id'],
-                    user_id=log_data['user_id'],
-                    message=log_data['message'],
-                    status=log_data['status'],
-                    error_message=log_data['error_message'],
-                    created_at=log_data['sent_at']
-                )
+            with self._read_conn() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = _log_row_factory
+                return cursor.execute(_SQL_GET_BY_ID, (log_id,)).fetchone()
                 
         except Exception as e:
             logger.error(f"Ошибка получения записи журнала: {str(e)}")
@@ -166,33 +304,8 @@ class NotificationLogRepository(BaseRepository):
             List[NotificationLog]: Список объектов записей
         """
         try:
-            with self._db_manager.get_connection() as conn:
-                logs_data = conn.execute("""
-                SELECT 
-                    id,
-                    user_id,
-                    message_text as message,
-                    status,
-                    error_message,
-                    sent_at
-                FROM notification_logs
-                WHERE user_id = ?
-                ORDER BY sent_at DESC
-                LIMIT ?
-                """, (user_id, limit)).fetchall()
-                
-                logs = []
-                for log_data in logs_data:
-                    logs.append(NotificationLog(
-                        id=log_data['id'],
-                        user_id=log_data['user_id'],
-                        message=log_data['message'],
-                        status=log_data['status'],
-                        error_message=log_data['error_message'],
-                        created_at=log_data['sent_at']
-                    ))
-                    
-                return logs
+            with self._read_conn() as conn:
+                return self._fetch_logs(conn, _SQL_GET_BY_USER, (user_id, limit))
                 
         except Exception as e:
             logger.error(f"Ошибка получения записей журнала по ID пользователя: {str(e)}")
@@ -210,33 +323,8 @@ class NotificationLogRepository(BaseRepository):
             List[NotificationLog]: Список объектов записей
         """
         try:
-            with self._db_manager.get_connection() as conn:
-                logs_data = conn.execute("""
-                SELECT 
-                    id,
-                    user_id,
-                    message_text as message,
-                    status,
-                    error_message,
-                    sent_at
-                FROM notification_logs
-                WHERE status = ?
-                ORDER BY sent_at DESC
-                LIMIT ?
-                """, (status, limit)).fetchall()
-                
-                logs = []
-                for log_data in logs_data:
-                    logs.append(NotificationLog(
-                        id=log_data['id'],
-                        user_id=log_data['user_id'],
-                        message=log_data['message'],
-                        status=log_data['status'],
-                        error_message=log_data['error_message'],
-                        created_at=log_data['sent_at']
-                    ))
-                    
-                return logs
+            with self._read_conn() as conn:
+                return self._fetch_logs(conn, _SQL_GET_BY_STATUS, (status, limit))
                 
         except Exception as e:
             logger.error(f"Ошибка получения записей журнала по статусу: {str(e)}")
@@ -255,37 +343,13 @@ class NotificationLogRepository(BaseRepository):
             List[NotificationLog]: Список объектов записей
         """
         try:
-            with self._db_manager.get_connection() as conn:
-                # Преобразуем даты в строки
-                start_date_str = start_date.strftime("%Y-%m-%d 00:00:00")
-                end_date_str = end_date.strftime("%Y-%m-%d 23:59:59")
-                
-                logs_data = conn.execute("""
-                SELECT 
-                    id,
-                    user_id,
-                    message_text as message,
-                    status,
-                    error_message,
-                    sent_at
-                FROM notification_logs
-                WHERE sent_at BETWEEN ? AND ?
-                ORDER BY sent_at DESC
-                LIMIT ?
-                """, (start_date_str, end_date_str, limit)).fetchall()
+            with self._read_conn() as conn:
+                # Полуоткрытый период в Unix-времени: от начала первого дня
+                # до начала дня, следующего за последним
+                start_ts = _day_start_timestamp(start_date)
+                stop_ts = _day_start_timestamp(end_date + timedelta(days=1))
                 
-                logs = []
-                for log_data in logs_data:
-                    logs.append(NotificationLog(
-                        id=log_data['id'],
-                        user_id=log_data['user_id'],
-                        message=log_data['message'],
-                        status=log_data['status'],
-                        error_message=log_data['error_message'],
-                        created_at=log_data['sent_at']
-                    ))
-                    
-                return logs
+                return self._fetch_logs(conn, _SQL_GET_BY_DATE_RANGE, (start_ts, stop_ts, limit))
                 
         except Exception as e:
             logger.error(f"Ошибка получения записей журнала по диапазону дат: {str(e)}")
@@ -302,32 +366,8 @@ class NotificationLogRepository(BaseRepository):
             List[NotificationLog]: Список объектов записей
         """
         try:
-            with self._db_manager.get_connection() as conn:
-                logs_data = conn.execute("""
-                SELECT 
-                    id,
-                    user_id,
-                    message_text as message,
-                    status,
-                    error_message,
-                    sent_at
-                FROM notification_logs
-                ORDER BY sent_at DESC
-                LIMIT ?
-                """, (limit,)).fetchall()
-                
-                logs = []
-                for log_data in logs_data:
-                    logs.append(NotificationLog(
-                        id=log_data['id'],
-                        user_id=log_data['user_id'],
-                        message=log_data['message'],
-                        status=log_data['status'],
-                        error_message=log_data['error_message'],
-                        created_at=log_data['sent_at']
-                    ))
-                    
-                return logs
+            with self._read_conn() as conn:
+                return self._fetch_logs(conn, _SQL_GET_ALL, (limit,))
                 
         except Exception as e:
             logger.error(f"Ошибка получения всех записей журнала: {str(e)}")
@@ -344,22 +384,14 @@ class NotificationLogRepository(BaseRepository):
             int: Количество удаленных записей
         """
         try:
-            with self._db_manager.get_connection() as conn:
+            with self._write_conn() as conn:
                 # Рассчитываем дату отсечения
-                cutoff_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d %H:%M:%S")
-                
-                # Подсчитываем количество записей для удаления
-                count = conn.execute("""
-                SELECT COUNT(*) as count
-                FROM notification_logs
-                WHERE sent_at < ?
-                """, (cutoff_date,)).fetchone()['count']
+                cutoff_date = int((datetime.now() - timedelta(days=days)).timestamp())
                 
-                # Удаляем записи
-                conn.execute("""
-                DELETE FROM notification_logs
-                WHERE sent_at < ?
-                """, (cutoff_date,))
+                # Удаляем записи одним запросом в транзакции с блокировкой на запись;
+                # количество удаленных записей возвращает сам DELETE
+                conn.execute("BEGIN IMMEDIATE")
+                count = conn.execute(_SQL_DELETE_OLDER_THAN, (cutoff_date,)).rowcount
                 
                 logger.info(f"Удалены записи журнала старше {days} дней: {count} записей")
                 return count
@@ -379,33 +411,8 @@ class NotificationLogRepository(BaseRepository):
             List[NotificationLog]: Список объектов записей
         """
         try:
-            with self._db_manager.get_connection() as conn:
-                logs_data = conn.execute("""
-                SELECT 
-                    id,
-                    user_id,
-                    message_text as message,
-                    status,
-                    error_message,
-                    sent_at
-                FROM notification_logs
-                WHERE status = 'error' AND error_message IS NOT NULL
-                ORDER BY sent_at DESC
-                LIMIT ?
-                """, (limit,)).fetchall()
-                
-                logs = []
-                for log_data in logs_data:
-                    logs.append(NotificationLog(
-                        id=log_data['id'],
-                        user_id=log_data['user_id'],
-                        message=log_data['message'],
-                        status=log_data['status'],
-                        error_message=log_data['error_message'],
-                        created_at=log_data['sent_at']
-                    ))
-                    
-                return logs
+            with self._read_conn() as conn:
+                return self._fetch_logs(conn, _SQL_GET_WITH_ERRORS, (limit,))
                 
         except Exception as e:
             logger.error(f"Ошибка получения записей журнала с ошибками: {str(e)}")
@@ -422,37 +429,14 @@ class NotificationLogRepository(BaseRepository):
             Dict[str, int]: Словарь с количеством записей по статусам
         """
         try:
-            with self._db_manager.get_connection() as conn:
-                # Преобразуем дату в строки
-                start_date_str = date_value.strftime("%Y-%m-%d 00:00:00")
-                end_date_str = date_value.strftime("%Y-%m-%d 23:59:59")
-                
-                status_counts = conn.execute("""
-                SELECT 
-                    status,
-                    COUNT(*) as count
-                FROM notification_logs
-                WHERE sent_at BETWEEN ? AND ?
-                GROUP BY status
-                """, (start_date_str, end_date_str)).fetchall()
+            with self._read_conn() as conn:
+                # Сутки как полуоткрытый период в Unix-времени
+                start_ts = _day_start_timestamp(date_value)
+                stop_ts = _day_start_timestamp(date_value + timedelta(days=1))
                 
-                summary = {
-                    'total': 0,
-                    'success': 0,
-                    'error': 0,
-                    'warning': 0
-                }
-                
-                for row in status_counts:
-                    status = row['status']
-                    count = row['count']
-                    
-                    if status in summary:
-                        summary[status] = count
-                    
-                    summary['total'] += count
-                    
-                return summary
+                # Подсчет по статусам выполняется в одном запросе
+                row = conn.execute(_SQL_SUMMARY_BY_DATE, (start_ts, stop_ts)).fetchone()
+                return dict(row)
                 
         except Exception as e:
             logger.error(f"Ошибка получения статистики журнала: {str(e)}")
@@ -13,6 +13,7 @@ import sqlite3
 from bot.core.models import User
 from bot.core.base_repository import BaseRepository
 from bot.repositories.database_manager import DatabaseManager
+from bot.utils.formatters import parse_date
 
 logger = logging.getLogger(__name__)
 
@@ -124,7 +125,70 @@ class UserRepository(BaseRepository):
         except Exception as e:
             logger.error(f"Ошибка добавления пользователя: {str(e)}")
             return None
-            
+
+    def add_user_if_absent(self, user: User) -> Optional[User]:
+        """
+        Добавление пользователя, только если его еще нет в базе данных.
+
+        Проверка и вставка выполняются одним запросом: строка не добавляется,
+        если уже есть пользователь с таким username или telegram_id.
+
+        Args:
+            user: Объект пользователя для добавления
+
+        Returns:
+            Optional[User]: Добавленный пользователь или None, если пользователь
+            уже существует или произошла ошибка
+        """
+        try:
+            with self._db_manager.get_connection() as conn:
+                user_data = conn.execute("""
+                INSERT INTO users (
+                    telegram_id,
+                    username,
+                    first_name,
+                    last_name,
+                    birth_date,
+                    is_admin,
+                    is_subscribed,
+                    is_notifications_enabled
+                )
+                SELECT ?, ?, ?, ?, ?, ?, ?, ?
+                WHERE NOT EXISTS (SELECT 1 FROM users WHERE username = ?)
+                ON CONFLICT DO NOTHING
+                RETURNING
+                    id,
+                    telegram_id,
+                    username,
+                    first_name,
+                    last_name,
+                    birth_date,
+                    is_admin,
+                    is_subscribed,
+                    is_notifications_enabled,
+                    created_at
+                """, (
+                    user.telegram_id,
+                    user.username,
+                    user.first_name,
+                    user.last_name,
+                    user.birth_date,
+                    user.is_admin,
+                    user.is_subscribed,
+                    user.is_notifications_enabled,
+                    user.username
+                )).fetchone()
+
+                if not user_data:
+                    return None
+
+                logger.info(f"Новый пользователь добавлен: {user.first_name} {user.last_name} (ID: {user.telegram_id})")
+                return self.to_entity(dict(user_data))
+
+        except Exception as e:
+            logger.error(f"Ошибка добавления пользователя: {str(e)}")
+            return None
+
     def delete_user(self, telegram_id: int) -> bool:
         """
         Удаление пользователя из базы данных.
@@ -250,6 +314,217 @@ class UserRepository(BaseRepository):
         except Exception as e:
             logger.error(f"Ошибка получения всех пользователей: {str(e)}")
             return []
+
+    def get_all_users_ordered(self) -> List[User]:
+        """
+        Получение всех пользователей, упорядоченных для справочника.
+        
+        Сначала возвращаются администраторы, затем остальные пользователи;
+        внутри каждой группы - по фамилии и имени.
+        
+        Returns:
+            List[User]: Список объектов пользователей
+        """
+        try:
+            with self._db_manager.get_connection() as conn:
+                users_data = conn.execute("""
+                SELECT 
+                    id,
+                    telegram_id,
+                    username,
+                    first_name,
+                    last_name,
+                    birth_date,
+                    is_admin,
+                    is_subscribed,
+                    is_notifications_enabled,
+                    created_at
+                FROM users
+                ORDER BY is_admin DESC, last_name, first_name
+                """).fetchall()
+                
+                return [self.to_entity(dict(user_data)) for user_data in users_data]
+                
+        except Exception as e:
+            logger.error(f"Ошибка получения упорядоченного списка пользователей: {str(e)}")
+            return []
+
+    def get_users_directory_rows(self, limit: int, offset: int = 0) -> List[Tuple]:
+        """
+        Получение страницы справочника пользователей в виде кортежей.
+        
+        Выбираются только поля, которые выводятся в справочнике, без создания
+        объектов User.
+        
+        Args:
+            limit: Максимальное количество пользователей на странице
+            offset: Количество пропускаемых пользователей
+            
+        Returns:
+            List[Tuple]: Кортежи (first_name, last_name, username, birth_date, is_admin,
+            is_subscribed, is_notifications_enabled, telegram_id)
+        """
+        try:
+            with self._db_manager.get_connection() as conn:
+                cursor = conn.execute("""
+                SELECT 
+                    first_name,
+                    last_name,
+                    username,
+                    birth_date,
+                    is_admin,
+                    is_subscribed,
+                    is_notifications_enabled,
+                    telegram_id
+                FROM users
+                ORDER BY is_admin DESC, last_name, first_name
+                LIMIT ? OFFSET ?
+                """, (limit, offset))
+                # Обычные кортежи вместо sqlite3.Row: доступ к полям только распаковкой
+                cursor.row_factory = None
+                return cursor.fetchall()
+                
+        except Exception as e:
+            logger.error(f"Ошибка получения страницы справочника пользователей: {str(e)}")
+            return []
+    
+    def count_users(self) -> int:
+        """
+        Получение общего количества пользователей.
+        
+        Returns:
+            int: Количество пользователей
+        """
+        try:
+            with self._db_manager.get_connection() as conn:
+                return conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+                
+        except Exception as e:
+            logger.error(f"Ошибка подсчета пользователей: {str(e)}")
+            return 0
+    
+    def get_admin_telegram_ids(self) -> List[int]:
+        """
+        Получение Telegram ID всех администраторов.
+        
+        Returns:
+            List[int]: Список Telegram ID администраторов
+        """
+        try:
+            with self._db_manager.get_connection() as conn:
+                rows = conn.execute(
+                    "SELECT telegram_id FROM users WHERE is_admin = 1"
+                ).fetchall()
+                return [row['telegram_id'] for row in rows]
+                
+        except Exception as e:
+            logger.error(f"Ошибка получения списка администраторов: {str(e)}")
+            return []
+
+    def get_users_by_telegram_ids(self, telegram_ids: List[int]) -> List[User]:
+        """
+        Получение пользователей по списку Telegram ID.
+
+        Запросы выполняются пакетами, чтобы не превышать ограничение SQLite
+        на количество параметров запроса.
+
+        Args:
+            telegram_ids: Список Telegram ID пользователей
+
+        Returns:
+            List[User]: Найденные пользователи с заполненными id, telegram_id
+            и is_notifications_enabled
+        """
+        try:
+            users = []
+            with self._db_manager.get_connection() as conn:
+                for start in range(0, len(telegram_ids), 500):
+                    chunk = telegram_ids[start:start + 500]
+                    placeholders = ", ".join("?" * len(chunk))
+                    users_data = conn.execute(f"""
+                    SELECT id, telegram_id, is_notifications_enabled
+                    FROM users
+                    WHERE telegram_id IN ({placeholders})
+                    """, chunk).fetchall()
+
+                    users.extend(
+                        User(
+                            id=user_data['id'],
+                            telegram_id=user_data['telegram_id'],
+                            is_notifications_enabled=bool(user_data['is_notifications_enabled'])
+                        )
+                        for user_data in users_data
+                    )
+
+            return users
+
+        except Exception as e:
+            logger.error(f"Ошибка получения пользователей по списку Telegram ID: {str(e)}")
+            return []
+
+    def get_notifiable_telegram_ids(self) -> List[int]:
+        """
+        Получение Telegram ID получателей оповещений - пользователей с включенными оповещениями.
+
+        Строки читаются из курсора по одной, без промежуточного списка строк
+        и объектов User: в памяти остается только список чисел.
+
+        Returns:
+            List[int]: Список Telegram ID
+        """
+        try:
+            with self._db_manager.get_connection() as conn:
+                cursor = conn.execute("""
+                SELECT telegram_id
+                FROM users
+                WHERE is_notifications_enabled = 1
+                """)
+                cursor.row_factory = None
+                return [telegram_id for (telegram_id,) in cursor]
+
+        except Exception as e:
+            logger.error(f"Ошибка получения получателей оповещений: {str(e)}")
+            return []
+
+    def get_users_with_birthdays_on(self, month_days: List[str]) -> List[User]:
+        """
+        Получение пользователей, у которых день рождения приходится на указанные дни.
+        
+        Отбор выполняется в SQL по индексу idx_users_birth_month_day.
+        
+        Args:
+            month_days: Дни в формате MM-DD
+            
+        Returns:
+            List[User]: Список пользователей с днем рождения в указанные дни
+        """
+        if not month_days:
+            return []
+        
+        try:
+            with self._db_manager.get_connection() as conn:
+                placeholders = ", ".join("?" * len(month_days))
+                users_data = conn.execute(f"""
+                SELECT 
+                    id,
+                    telegram_id,
+                    username,
+                    first_name,
+                    last_name,
+                    birth_date,
+                    is_admin,
+                    is_subscribed,
+                    is_notifications_enabled,
+                    created_at
+                FROM users
+                WHERE substr(birth_date, 6, 5) IN ({placeholders})
+                """, month_days).fetchall()
+                
+                return [self.to_entity(dict(user_data)) for user_data in users_data]
+                
+        except Exception as e:
+            logger.error(f"Ошибка получения пользователей по дням рождения: {str(e)}")
+            return []
             
     def get_users_with_birthdays_between(self, start_date: date, end_date: date) -> List[User]:
         """
@@ -288,7 +563,7 @@ class UserRepository(BaseRepository):
                 for user_data in users_data:
                     try:
                         birth_date_str = user_data['birth_date']
-                        birth_date_obj = datetime.strptime(birth_date_str, "%Y-%m-%d").date()
+                        birth_date_obj = parse_date(birth_date_str)
                         
                         # Создаем "эквивалентную" дату рождения для текущего года
                         current_year = datetime.now().year
@@ -340,7 +615,7 @@ class UserRepository(BaseRepository):
             
             for user in users:
                 try:
-                    birth_date_obj = datetime.strptime(user.birth_date, "%Y-%m-%d").date()
+                    birth_date_obj = parse_date(user.birth_date)
                     current_year_birthday = date(current_year, birth_date_obj.month, birth_date_obj.day)
                     
                     # Рассчитываем количество дней до дня рождения
@@ -569,6 +844,51 @@ class UserRepository(BaseRepository):
             logger.error(f"Ошибка отзыва прав администратора у пользователя: {str(e)}")
             return False
 
+    def set_admin_by_username(self, username: str, is_admin: bool) -> Optional[User]:
+        """
+        Изменение статуса администратора по имени пользователя одним запросом.
+
+        Статус меняется только если он отличается от текущего, поэтому
+        None возвращается как для отсутствующего пользователя, так и для
+        пользователя, который уже находится в нужном статусе.
+
+        Args:
+            username: Имя пользователя
+            is_admin: True - назначить администратором, False - отозвать права администратора
+
+        Returns:
+            Optional[User]: Обновленный пользователь или None, если изменений не было
+        """
+        try:
+            with self._db_manager.get_connection() as conn:
+                user_data = conn.execute("""
+                UPDATE users
+                SET
+                    is_admin = ?
+                WHERE username = ? AND is_admin != ?
+                RETURNING
+                    id,
+                    telegram_id,
+                    username,
+                    first_name,
+                    last_name,
+                    birth_date,
+                    is_admin,
+                    is_subscribed,
+                    is_notifications_enabled,
+                    created_at
+                """, (is_admin, username, is_admin)).fetchone()
+
+                if not user_data:
+                    return None
+
+                logger.info(f"Статус администратора пользователя @{username} изменен: is_admin={is_admin}")
+                return self.to_entity(dict(user_data))
+
+        except Exception as e:
+            logger.error(f"Ошибка изменения статуса администратора по имени пользователя: {str(e)}")
+            return None
+
     # Реализация абстрактных методов из BaseRepository
     
     def to_entity(self, data: Dict[str, Any]) -> User:
@@ -6,8 +6,7 @@
 """
 
 import logging
-import os
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Callable
 from datetime import datetime
 
 from bot.core.base_service import BaseService
@@ -33,6 +32,26 @@ class BackupService(BaseService):
         """
         super().__init__()
         self.database_manager = database_manager
+        self._restore_listeners: List[Callable[[], None]] = []
+    
+    def add_restore_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Регистрация обработчика, вызываемого после восстановления базы данных.
+        
+        Args:
+            listener: Функция без аргументов
+        """
+        self._restore_listeners.append(listener)
+    
+    def _notify_restored(self) -> None:
+        """
+        Оповещение зарегистрированных обработчиков о восстановлении базы данных.
+        """
+        for listener in self._restore_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"Ошибка обработчика восстановления базы данных: {e}")
     
     def create_backup(self, comment: str = None) -> Optional[str]:
         """
@@ -87,6 +106,8 @@ class BackupService(BaseService):
             result = self.database_manager.restore_from_backup(backup_path)
             if result:
                 logger.info(f"База данных успешно восстановлена из копии: {backup_name}")
+                # Кэши, построенные по прежней базе данных, больше не действительны
+                self._notify_restored()
             else:
                 logger.warning(f"Не удалось восстановить базу данных из копии: {backup_name}")
             return result
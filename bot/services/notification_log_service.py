@@ -6,7 +6,7 @@
 """
 
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import date, datetime, timedelta
 
 from bot.core.base_service import BaseService
@@ -70,10 +70,33 @@ class NotificationLogService(BaseService):
             message=message,
             status=status,
             error_message=error_message,
-            created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            created_at=int(datetime.now().timestamp())
         )
         return self.add_log(log)
     
+    def log_notifications(self, entries: List[Tuple[int, str, str, Optional[str]]]) -> int:
+        """
+        Логирование нескольких уведомлений одной операцией записи.
+        
+        Args:
+            entries: Кортежи (user_id, message, status, error_message)
+            
+        Returns:
+            Количество добавленных записей
+        """
+        created_at = int(datetime.now().timestamp())
+        logs = [
+            NotificationLog(
+                user_id=user_id,
+                message=message,
+                status=status,
+                error_message=error_message,
+                created_at=created_at
+            )
+            for user_id, message, status, error_message in entries
+        ]
+        return self.log_repository.add_logs(logs)
+    
     def get_log_by_id(self, log_id: int) -> Optional[NotificationLog]:
         """
         Получение записи журнала по ID.
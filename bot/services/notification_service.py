@@ -7,10 +7,12 @@
 
 import logging
 import threading
-import time
-import pytz
-from typing import List, Dict, Optional, Any, Callable, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Optional, Any, Callable, Union, Set, Tuple
 from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import telebot
 
 from bot.core.base_service import BaseService
 from bot.core.models import User, NotificationTemplate, NotificationSetting, NotificationLog
@@ -18,7 +20,10 @@ from bot.services.user_service import UserService
 from bot.services.template_service import TemplateService
 from bot.services.notification_setting_service import NotificationSettingService
 from bot.services.notification_log_service import NotificationLogService
-from bot.constants import MONTHS_RU
+from bot.constants import DAY_MONTH_GEN
+from bot.utils.formatters import parse_date
+from bot.utils.outbox import get_bot_bucket, get_retry_after
+from config import TELEGRAM_SEND_RATE, NOTIFICATION_SEND_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +36,12 @@ class NotificationService(BaseService):
     используя другие сервисы для получения необходимых данных.
     """
     
+    # Максимальное количество повторов отправки после ответа 429
+    SEND_MAX_RETRIES = 3
+    
+    # Насколько далеко в прошлое планировщик досылает пропущенные времена срабатывания
+    SCHEDULER_CATCH_UP = timedelta(hours=1)
+    
     def __init__(
         self,
         bot,
@@ -59,16 +70,35 @@ class NotificationService(BaseService):
         # Инициализация планировщика уведомлений
         self._scheduler_thread = None
         self._stop_flag = False
-        self._last_sent_notifications = {}  # Кэш отправленных уведомлений
-        self.moscow_tz = pytz.timezone('Europe/Moscow')
+        self._wake_event = threading.Event()  # Пробуждение планировщика при остановке или смене настроек
+        # Дата и ID настроек, уже разосланных в эту дату; пара заменяется целиком при смене даты
+        self._dispatched: Tuple[Optional[date], Set[int]] = (None, set())
+        self._dispatch_lock = threading.Lock()
+        # Активные настройки, сгруппированные по минуте суток срабатывания (часы * 60 + минуты)
+        self._settings_by_minute: Optional[Dict[int, List[NotificationSetting]]] = None
+        self.moscow_tz = ZoneInfo('Europe/Moscow')
+        
+        # Планировщик пересчитывает расписание сразу после изменения настроек
+        self.setting_service.add_change_listener(self._on_settings_changed)
         
         # Определение функции отправки сообщений
         self.send_message_func = self._send_message
+        
+        # Пул потоков для параллельной рассылки и ограничитель частоты отправки,
+        # чтобы не превышать лимит Telegram на количество сообщений в секунду
+        self._send_executor = ThreadPoolExecutor(
+            max_workers=NOTIFICATION_SEND_WORKERS,
+            thread_name_prefix="notification-send"
+        )
+        # Ограничитель общий с очередью исходящих сообщений: лимит Telegram действует на бота целиком
+        self._send_bucket = get_bot_bucket(bot, TELEGRAM_SEND_RATE)
     
     def _send_message(self, chat_id: int, text: str, parse_mode: str = 'HTML') -> bool:
         """
         Отправка сообщения через бота.
         
+        После ответа 429 отправка повторяется через указанное Telegram время (retry_after).
+        
         Args:
             chat_id: Telegram ID чата (совпадает с telegram_id пользователя)
             text: Текст сообщения
@@ -77,16 +107,42 @@ class NotificationService(BaseService):
         Returns:
             True, если сообщение успешно отправлено, иначе False
         """
-        try:
-            self.bot.send_message(
-                chat_id=chat_id,
-                text=text,
-                parse_mode=parse_mode
-            )
-            return True
-        except Exception as e:
-            logger.error(f"Ошибка отправки сообщения пользователю {chat_id}: {e}")
-            return False
+        for attempt in range(self.SEND_MAX_RETRIES + 1):
+            try:
+                self.bot.send_message(
+                    chat_id=chat_id,
+                    text=text,
+                    parse_mode=parse_mode
+                )
+                return True
+            except telebot.apihelper.ApiTelegramException as e:
+                if e.error_code != 429 or attempt == self.SEND_MAX_RETRIES:
+                    logger.error(f"Ошибка отправки сообщения пользователю {chat_id}: {e}")
+                    return False
+                
+                retry_after = get_retry_after(e)
+                logger.warning(f"Превышен лимит отправки сообщений, пауза {retry_after} с")
+                # Пауза ограничителя останавливает и очередь исходящих сообщений
+                self._send_bucket.pause(retry_after)
+                self._send_bucket.acquire()
+            except Exception as e:
+                logger.error(f"Ошибка отправки сообщения пользователю {chat_id}: {e}")
+                return False
+        return False
+    
+    def _send_message_rate_limited(self, chat_id: int, text: str) -> bool:
+        """
+        Отправка сообщения с соблюдением ограничения частоты отправки.
+        
+        Args:
+            chat_id: Telegram ID чата
+            text: Текст сообщения
+            
+        Returns:
+            True, если сообщение успешно отправлено, иначе False
+        """
+        self._send_bucket.acquire()
+        return self.send_message_func(chat_id, text)
     
     def _get_current_moscow_time(self) -> datetime:
         """
@@ -122,7 +178,7 @@ class NotificationService(BaseService):
                 return False
             
             if not user.is_notifications_enabled:
-                logger.info(f"Оповещения отключены для пользователя {user_id}")
+                logger.info("Оповещения отключены для пользователя %s", user_id)
                 return False
             
             # Получаем шаблон оповещения
@@ -141,7 +197,7 @@ class NotificationService(BaseService):
             # Логируем результат
             if result:
                 self.log_service.log_notification(user_id, message, "success")
-                logger.info(f"Оповещение успешно отправлено пользователю {user_id}")
+                logger.info("Оповещение успешно отправлено пользователю %s", user_id)
             else:
                 self.log_service.log_notification(user_id, message, "error", "Ошибка отправки сообщения")
                 logger.error(f"Ошибка отправки оповещения пользователю {user_id}")
@@ -171,28 +227,19 @@ class NotificationService(BaseService):
             Словарь с количеством успешных и неуспешных отправок
         """
         try:
-            # Получаем всех пользователей с включенными оповещениями
-            users = self.user_service.get_all_users()
+            template = self.template_service.get_template_by_name(template_name)
+            if not template:
+                logger.warning(f"Шаблон оповещения '{template_name}' не найден")
+                return {"success": 0, "failed": 0}
             
-            exclude_ids = exclude_ids or []
-            results = {"success": 0, "failed": 0}
+            # Получаем всех пользователей с включенными оповещениями одним запросом
+            recipients = self.user_service.get_notifiable_telegram_ids()
             
-            for user in users:
-                telegram_id = user.telegram_id
-                
-                # Пропускаем пользователей из исключений
-                if telegram_id in exclude_ids:
-                    continue
-                
-                # Пропускаем пользователей с отключенными оповещениями
-                if not user.is_notifications_enabled:
-                    continue
-                
-                # Отправляем оповещение
-                if self.send_notification(telegram_id, template_name, context):
-                    results["success"] += 1
-                else:
-                    results["failed"] += 1
+            if exclude_ids:
+                exclude_ids = set(exclude_ids)
+                recipients = [telegram_id for telegram_id in recipients if telegram_id not in exclude_ids]
+            
+            results = self._send_to_recipients(template, context or {}, recipients)
             
             logger.info(f"Результат массовой рассылки: {results}")
             return results
@@ -201,6 +248,59 @@ class NotificationService(BaseService):
             logger.error(f"Ошибка при массовой рассылке: {e}")
             return {"success": 0, "failed": 0}
     
+    def _send_to_recipients(
+        self,
+        template: NotificationTemplate,
+        context: Dict[str, Any],
+        recipients: List[int],
+        exclude_telegram_id: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Отправка оповещения по шаблону списку получателей.
+        
+        Получатели уже загружены вызывающим кодом, поэтому повторных запросов
+        к базе данных для каждого из них не выполняется. Сообщения отправляются
+        параллельно в пуле потоков с ограничением частоты отправки.
+        
+        Args:
+            template: Шаблон оповещения
+            context: Контекст для форматирования шаблона
+            recipients: Telegram ID получателей оповещения
+            exclude_telegram_id: Telegram ID пользователя, которому не нужно отправлять оповещение
+            
+        Returns:
+            Словарь с количеством успешных и неуспешных отправок
+        """
+        results = {"success": 0, "failed": 0}
+        message = self.template_service.format_template(template, context)
+        
+        # Сообщения отправляются параллельно, результаты журналируются по мере завершения
+        futures = {}
+        for telegram_id in recipients:
+            if telegram_id == exclude_telegram_id:
+                continue
+            future = self._send_executor.submit(self._send_message_rate_limited, telegram_id, message)
+            futures[future] = telegram_id
+        
+        # Записи журнала накапливаются и сохраняются одной вставкой после рассылки
+        log_entries = []
+        for future in as_completed(futures):
+            telegram_id = futures[future]
+            try:
+                if future.result():
+                    log_entries.append((telegram_id, message, "success", None))
+                    results["success"] += 1
+                else:
+                    log_entries.append((telegram_id, message, "error", "Ошибка отправки сообщения"))
+                    results["failed"] += 1
+            except Exception as e:
+                logger.error(f"Ошибка при отправке оповещения пользователю {telegram_id}: {e}")
+                log_entries.append((telegram_id, message, "error", str(e)))
+                results["failed"] += 1
+        
+        self.log_service.log_notifications(log_entries)
+        return results
+    
     def send_notification_to_users(
         self, 
         user_ids: List[int], 
@@ -219,13 +319,24 @@ class NotificationService(BaseService):
             Словарь с количеством успешных и неуспешных отправок
         """
         try:
-            results = {"success": 0, "failed": 0}
+            user_ids = list(dict.fromkeys(user_ids))
             
-            for user_id in user_ids:
-                if self.send_notification(user_id, template_name, context):
-                    results["success"] += 1
-                else:
-                    results["failed"] += 1
+            template = self.template_service.get_template_by_name(template_name)
+            if not template:
+                logger.warning(f"Шаблон оповещения '{template_name}' не найден")
+                return {"success": 0, "failed": len(user_ids)}
+            
+            # Загружаем всех получателей одним запросом вместо запроса на каждого
+            users = self.user_service.get_users_by_telegram_ids(user_ids)
+            recipients = [user.telegram_id for user in users if user.is_notifications_enabled]
+            
+            # Ненайденные пользователи и пользователи с отключенными оповещениями считаются неуспешными
+            skipped = len(user_ids) - len(recipients)
+            if skipped:
+                logger.info("Пропущено получателей без включенных оповещений: %s", skipped)
+            
+            results = self._send_to_recipients(template, context or {}, recipients)
+            results["failed"] += skipped
             
             logger.info(f"Результат рассылки группе пользователей: {results}")
             return results
@@ -261,9 +372,20 @@ class NotificationService(BaseService):
             results = {"success": 0, "failed": 0}
             today = datetime.now().date()
             
+            # Получатели загружаются один раз на всю рассылку, а не для каждого именинника
+            recipients = None
+            
+            # Платежные данные не зависят ни от именинника, ни от получателя
+            phone_pay = self.setting_service.get_payment_phone()
+            name_pay = self.setting_service.get_payment_name()
+            logger.debug("Платежные данные для уведомления: phone=%s, name=%s", phone_pay, name_pay)
+            
+            # Шаблоны запрашиваются из базы данных не более одного раза за рассылку
+            templates_by_id: Dict[int, Optional[NotificationTemplate]] = {}
+            
             for birthday_date_str, users in birthdays_by_date.items():
                 try:
-                    birthday_date = datetime.strptime(birthday_date_str, "%Y-%m-%d").date()
+                    birthday_date = parse_date(birthday_date_str)
                     days_until = (birthday_date - today).days
                     
                     # Получаем настройки оповещений для данного количества дней
@@ -273,9 +395,16 @@ class NotificationService(BaseService):
                         logger.info(f"Нет настроек оповещений для {days_until} дней до дня рождения")
                         continue
                     
+                    # Даты одинаковы для всех именинников этого дня и всех настроек: форматируем их один раз
+                    date_str = DAY_MONTH_GEN[birthday_date.month, birthday_date.day]
+                    date_before = birthday_date - timedelta(days=1)
+                    date_before_str = DAY_MONTH_GEN[date_before.month, date_before.day]
+                    
                     # Для каждой настройки отправляем оповещения
                     for setting in settings:
-                        template = self.template_service.get_template_by_id(setting.template_id)
+                        if setting.template_id not in templates_by_id:
+                            templates_by_id[setting.template_id] = self.template_service.get_template_by_id(setting.template_id)
+                        template = templates_by_id[setting.template_id]
                         
                         if not template:
                             logger.warning(f"Шаблон с ID {setting.template_id} не найден")
@@ -283,18 +412,6 @@ class NotificationService(BaseService):
                         
                         # Для каждого пользователя с ДР в эту дату отправляем оповещения всем остальным
                         for birthday_user in users:
-                            # Форматируем даты с русскими названиями месяцев
-                            date_str = f"{birthday_date.day:02d} {MONTHS_RU[birthday_date.month]['gen']}"
-                            date_before = birthday_date - timedelta(days=1)
-                            date_before_str = f"{date_before.day:02d} {MONTHS_RU[date_before.month]['gen']}"
-                            
-                            # Получаем значения платежных данных
-                            phone_pay = self.setting_service.get_payment_phone()
-                            name_pay = self.setting_service.get_payment_name()
-                            
-                            # Логируем платежные данные для отладки
-                            logger.info(f"Платежные данные для уведомления: phone={phone_pay}, name={name_pay}")
-                            
                             # Подготавливаем контекст для шаблона
                             context = {
                                 'name': f"{birthday_user['first_name']} {birthday_user['last_name']}".strip(),
@@ -308,8 +425,11 @@ class NotificationService(BaseService):
                             }
                             
                             # Отправляем всем пользователям, кроме именинника
-                            exclude_ids = [birthday_user['telegram_id']]
-                            result = self.send_notification_to_all(template.name, context, exclude_ids)
+                            if recipients is None:
+                                recipients = self.user_service.get_notifiable_telegram_ids()
+                            result = self._send_to_recipients(
+                                template, context, recipients, birthday_user['telegram_id']
+                            )
                             
                             results["success"] += result["success"]
                             results["failed"] += result["failed"]
@@ -323,43 +443,63 @@ class NotificationService(BaseService):
             logger.error(f"Ошибка при рассылке оповещений о днях рождения: {e}")
             return {"success": 0, "failed": 0}
     
-    def send_notifications_for_current_time(self) -> Dict[str, int]:
+    def send_notifications_for_current_time(self, fire_time: Optional[datetime] = None) -> Dict[str, int]:
         """
         Отправка оповещений, соответствующих текущему времени.
         
+        Args:
+            fire_time: Время срабатывания в московском часовом поясе, для которого
+                выполняется рассылка (по умолчанию - текущее время). Планировщик передает
+                запланированное время, чтобы опоздавшее пробуждение не сдвигало минуту рассылки
+        
         Returns:
             Словарь с количеством успешных и неуспешных отправок
         """
         try:
-            # Получаем текущее время в формате ЧЧ:ММ для сравнения с настройками
-            current_time = self._get_current_moscow_time()
-            current_hour_minute = current_time.strftime("%H:%M")
+            # Получаем минуту суток рассылки для сравнения с настройками
+            current_time = fire_time or self._get_current_moscow_time()
+            current_minute = current_time.hour * 60 + current_time.minute
             
             # Получаем настройки оповещений для текущего времени
-            settings = self.setting_service.get_settings_for_time(current_hour_minute)
+            settings = self._get_settings_by_minute().get(current_minute)
             
             if not settings:
-                logger.debug(f"Нет настроек оповещений для времени {current_hour_minute}")
+                logger.debug("Нет настроек оповещений для времени %02d:%02d", current_time.hour, current_time.minute)
                 return {"success": 0, "failed": 0}
             
-            # Проверяем кэш оповещений - отправляем не чаще раза в 10 минут
-            current_10min = current_time.strftime('%Y%m%d_%H%M')[:-1]  # Округляем до десятков минут
+            current_date = current_time.date()
             results = {"success": 0, "failed": 0}
             
+            # Получатели загружаются один раз на всю рассылку, а не для каждого именинника
+            recipients = None
+            
+            # Платежные данные не зависят ни от именинника, ни от получателя
+            phone_pay = self.setting_service.get_payment_phone()
+            name_pay = self.setting_service.get_payment_name()
+            logger.debug("Платежные данные для уведомления: phone=%s, name=%s", phone_pay, name_pay)
+            
+            # Шаблоны запрашиваются из базы данных не более одного раза за рассылку
+            templates_by_id: Dict[int, Optional[NotificationTemplate]] = {}
+            
+            birthdays_by_days: Dict[int, Dict[str, List[Dict[str, Any]]]] = {}
+            
             for setting in settings:
-                setting_id = setting.id
-                cache_key = f"{setting_id}_{current_10min}"
-                
-                if cache_key in self._last_sent_notifications:
-                    logger.debug(f"Пропуск отправки: уведомления уже были отправлены в интервале {current_10min}")
+                # Каждая настройка рассылается не более одного раза в сутки
+                if not self._claim_dispatch(setting.id, current_date):
+                    logger.debug("Пропуск отправки: уведомления по настройке %s уже были отправлены сегодня", setting.id)
                     continue
                 
-                # Получаем пользователей с приближающимися днями рождения
+                # Получаем пользователей с приближающимися днями рождения;
+                # настройки с одинаковым days_before используют один результат запроса
                 days_ahead = setting.days_before
-                birthdays_by_date = self.user_service.get_users_with_birthdays(days_ahead)
+                birthdays_by_date = birthdays_by_days.get(days_ahead)
+                if birthdays_by_date is None:
+                    birthdays_by_date = self.user_service.get_users_with_birthdays(days_ahead)
+                    birthdays_by_days[days_ahead] = birthdays_by_date
                 
                 if not birthdays_by_date:
-                    logger.debug(f"Нет приближающихся дней рождения в течение {days_ahead} дней")
+                    logger.debug("Нет приближающихся дней рождения в течение %s дней", days_ahead)
+                    self._release_dispatch(setting.id, current_date)
                     continue
                 
                 # Для каждой даты отправляем уведомления
@@ -368,33 +508,28 @@ class NotificationService(BaseService):
                 
                 for birthday_date_str, users in birthdays_by_date.items():
                     try:
-                        birthday_date = datetime.strptime(birthday_date_str, "%Y-%m-%d").date()
+                        birthday_date = parse_date(birthday_date_str)
                         days_until = (birthday_date - today).days
                         
                         # Если настройка не соответствует текущему количеству дней, пропускаем
                         if days_until != setting.days_before:
                             continue
                         
-                        template = self.template_service.get_template_by_id(setting.template_id)
+                        if setting.template_id not in templates_by_id:
+                            templates_by_id[setting.template_id] = self.template_service.get_template_by_id(setting.template_id)
+                        template = templates_by_id[setting.template_id]
                         
                         if not template:
                             logger.warning(f"Шаблон с ID {setting.template_id} не найден")
                             continue
                         
+                        # Даты одинаковы для всех именинников этого дня: форматируем их один раз
+                        date_str = DAY_MONTH_GEN[birthday_date.month, birthday_date.day]
+                        date_before = birthday_date - timedelta(days=1)
+                        date_before_str = DAY_MONTH_GEN[date_before.month, date_before.day]
+                        
                         # Для каждого пользователя с ДР в эту дату отправляем оповещения всем остальным
                         for birthday_user in users:
-                            # Форматируем даты с русскими названиями месяцев
-                            date_str = f"{birthday_date.day:02d} {MONTHS_RU[birthday_date.month]['gen']}"
-                            date_before = birthday_date - timedelta(days=1)
-                            date_before_str = f"{date_before.day:02d} {MONTHS_RU[date_before.month]['gen']}"
-                            
-                            # Получаем значения платежных данных
-                            phone_pay = self.setting_service.get_payment_phone()
-                            name_pay = self.setting_service.get_payment_name()
-                            
-                            # Логируем платежные данные для отладки
-                            logger.info(f"Платежные данные для уведомления: phone={phone_pay}, name={name_pay}")
-                            
                             # Подготавливаем контекст для шаблона
                             context = {
                                 'name': f"{birthday_user['first_name']} {birthday_user['last_name']}".strip(),
@@ -408,8 +543,11 @@ class NotificationService(BaseService):
                             }
                             
                             # Отправляем всем пользователям, кроме именинника
-                            exclude_ids = [birthday_user['telegram_id']]
-                            result = self.send_notification_to_all(template.name, context, exclude_ids)
+                            if recipients is None:
+                                recipients = self.user_service.get_notifiable_telegram_ids()
+                            result = self._send_to_recipients(
+                                template, context, recipients, birthday_user['telegram_id']
+                            )
                             
                             results["success"] += result["success"]
                             results["failed"] += result["failed"]
@@ -417,9 +555,9 @@ class NotificationService(BaseService):
                     except Exception as e:
                         logger.error(f"Ошибка при обработке дня рождения {birthday_date_str}: {e}")
                 
-                # Добавляем запись в кэш только если было отправлено хотя бы одно оповещение
-                if has_sent:
-                    self._last_sent_notifications[cache_key] = True
+                # Настройка остается отмеченной только если было отправлено хотя бы одно оповещение
+                if not has_sent:
+                    self._release_dispatch(setting.id, current_date)
             
             logger.info(f"Результат рассылки оповещений для текущего времени: {results}")
             return results
@@ -428,66 +566,157 @@ class NotificationService(BaseService):
             logger.error(f"Ошибка при рассылке оповещений для текущего времени: {e}")
             return {"success": 0, "failed": 0}
     
-    def _clear_notification_cache(self):
+    def _claim_dispatch(self, setting_id: int, current_date: date) -> bool:
+        """
+        Отметка настройки как разосланной в указанную дату.
+        
+        Проверка и отметка выполняются атомарно, поэтому при одновременном
+        вызове из планировщика и обработчиков рассылка не дублируется.
+        
+        Args:
+            setting_id: ID настройки уведомлений
+            current_date: Дата рассылки
+            
+        Returns:
+            True, если настройка отмечена, False, если она уже была разослана в эту дату
+        """
+        with self._dispatch_lock:
+            dispatched_date, dispatched = self._dispatched
+            if dispatched_date != current_date:
+                # Смена даты: записи прошлых дней отбрасываются целиком
+                dispatched = set()
+                self._dispatched = (current_date, dispatched)
+            
+            if setting_id in dispatched:
+                return False
+            dispatched.add(setting_id)
+            return True
+    
+    def _release_dispatch(self, setting_id: int, current_date: date) -> None:
         """
-        Очистка кэша отправленных уведомлений.
+        Снятие отметки о рассылке настройки, если оповещения не были отправлены.
         
-        Удаляет из кэша записи, которые не относятся к текущему 10-минутному интервалу.
+        Args:
+            setting_id: ID настройки уведомлений
+            current_date: Дата рассылки
         """
-        try:
-            current_time = self._get_current_moscow_time()
-            current_10min = current_time.strftime('%Y%m%d_%H%M')[:-1]  # Округляем до десятков минут
-
-            # Оставляем только записи текущего 10-минутного интервала
-            self._last_sent_notifications = {
-                key: value for key, value in self._last_sent_notifications.items()
-                if key.split('_')[1] == current_10min
-            }
-
-            logger.info(f"Очищен кэш уведомлений, осталось {len(self._last_sent_notifications)} записей")
-        except Exception as e:
-            logger.error(f"Ошибка при очистке кеша уведомлений: {e}")
-            self._last_sent_notifications = {}  # При ошибке полностью очищаем кеш
+        with self._dispatch_lock:
+            dispatched_date, dispatched = self._dispatched
+            if dispatched_date == current_date:
+                dispatched.discard(setting_id)
     
-    def _check_and_send_notifications(self):
+    def _on_settings_changed(self) -> None:
         """
-        Проверка и отправка уведомлений на основе текущего времени.
+        Обработка изменения настроек уведомлений: сброс расписания и пробуждение планировщика.
+        """
+        self._settings_by_minute = None
+        self._wake_event.set()
+    
+    def _get_settings_by_minute(self) -> Dict[int, List[NotificationSetting]]:
+        """
+        Получение активных настроек уведомлений, сгруппированных по минуте суток срабатывания.
+        
+        Настройки загружаются из базы данных один раз и хранятся до изменения
+        настроек или следующего пробуждения планировщика. Время HH:MM разбирается
+        при загрузке, настройки с неверным временем пропускаются.
         
-        Выполняется в отдельном потоке для периодической проверки и отправки
-        уведомлений в соответствии с настройками.
+        Returns:
+            Словарь, где ключи - минута суток (часы * 60 + минуты), значения - списки настроек
         """
-        try:
-            current_time = self._get_current_moscow_time()
+        settings_by_minute = self._settings_by_minute
+        if settings_by_minute is None:
+            settings_by_minute = {}
+            for setting in self.setting_service.get_all_settings(active_only=True):
+                try:
+                    hour, minute = map(int, setting.time.split(':'))
+                    if not (0 <= hour < 24 and 0 <= minute < 60):
+                        raise ValueError("время вне допустимого диапазона")
+                except (ValueError, AttributeError) as e:
+                    logger.warning(f"Неверное время в настройке уведомлений {setting.id}: {e}")
+                    continue
+                settings_by_minute.setdefault(hour * 60 + minute, []).append(setting)
+            self._settings_by_minute = settings_by_minute
+        return settings_by_minute
+    
+    def _get_next_fire_time(self, now: datetime) -> Optional[datetime]:
+        """
+        Вычисление ближайшего времени срабатывания активных настроек уведомлений.
+        
+        Args:
+            now: Текущее время в московском часовом поясе
             
-            # Перезагрузка настроек и очистка кеша каждые 10 минут
-            if current_time.minute % 10 == 0 and current_time.second < 30:
-                self.setting_service.reload_settings()
-                self._clear_notification_cache()
-                logger.info("Перезагрузка настроек и очистка кеша (10-минутный интервал)")
+        Returns:
+            Ближайшее время срабатывания или None, если активных настроек нет
+        """
+        next_fire = None
+        
+        for minute_of_day in self._get_settings_by_minute():
+            fire_time = now.replace(hour=minute_of_day // 60, minute=minute_of_day % 60, second=0, microsecond=0)
             
-            # Отправляем уведомления для текущего времени
-            self.send_notifications_for_current_time()
+            # Время уже прошло сегодня - срабатывание завтра
+            if fire_time <= now:
+                fire_time += timedelta(days=1)
             
+            if next_fire is None or fire_time < next_fire:
+                next_fire = fire_time
+        
+        return next_fire
+    
+    def _check_and_send_notifications(self, fire_time: datetime) -> None:
+        """
+        Проверка и отправка уведомлений для времени срабатывания.
+        
+        Вызывается планировщиком для каждого наступившего времени срабатывания настроек уведомлений.
+        
+        Args:
+            fire_time: Время срабатывания в московском часовом поясе
+        """
+        try:
+            self.send_notifications_for_current_time(fire_time)
         except Exception as e:
             logger.error(f"Ошибка в _check_and_send_notifications: {e}")
     
-    def _run_scheduler(self):
+    def _run_scheduler(self) -> None:
         """
         Запуск планировщика уведомлений.
         
-        Выполняется в отдельном потоке и периодически проверяет необходимость
-        отправки уведомлений.
+        Выполняется в отдельном потоке: вычисляет ближайшее время срабатывания
+        настроек и ожидает его, не просыпаясь каждую минуту. Ожидание прерывается
+        при остановке сервиса и при перезагрузке настроек.
+        
+        При каждом пробуждении рассылаются все времена срабатывания, наступившие
+        с предыдущей проверки (но не старше SCHEDULER_CATCH_UP), поэтому
+        опоздавшее пробуждение не пропускает настройки; повторную рассылку
+        исключает _claim_dispatch.
         """
         logger.info("Запуск планировщика уведомлений")
+        last_checked = self._get_current_moscow_time()
         while not self._stop_flag:
             try:
-                self._check_and_send_notifications()
-                time.sleep(60)  # Проверка каждую минуту
+                # Настройки перечитываются при каждом пробуждении, чтобы учесть
+                # изменения, внесенные в базу данных в обход сервиса
+                self._settings_by_minute = None
+                now = self._get_current_moscow_time()
+                
+                fire_time = self._get_next_fire_time(max(last_checked, now - self.SCHEDULER_CATCH_UP))
+                while fire_time is not None and fire_time <= now:
+                    self._check_and_send_notifications(fire_time)
+                    fire_time = self._get_next_fire_time(fire_time)
+                last_checked = now
+                
+                # Ожидание ограничено часом, чтобы учитывать перевод системных часов
+                timeout = 3600.0
+                if fire_time is not None:
+                    timeout = min(timeout, (fire_time - now).total_seconds())
+                
+                if self._wake_event.wait(timeout):
+                    # Остановка сервиса или изменение настроек - пересчитываем расписание
+                    self._wake_event.clear()
             except Exception as e:
                 logger.error(f"Ошибка в планировщике уведомлений: {e}")
-                time.sleep(60)  # При ошибке ждем минуту перед следующей попыткой
+                self._wake_event.wait(60)  # При ошибке ждем минуту перед следующей попыткой
     
-    def start(self):
+    def start(self) -> None:
         """
         Запуск сервиса отправки уведомлений.
         
@@ -502,7 +731,7 @@ class NotificationService(BaseService):
             self._scheduler_thread.start()
             logger.info("NotificationService успешно запущен")
     
-    def stop(self):
+    def stop(self) -> None:
         """
         Остановка сервиса отправки уведомлений.
         
@@ -510,15 +739,16 @@ class NotificationService(BaseService):
         """
         logger.info("Остановка NotificationService")
         self._stop_flag = True
+        self._wake_event.set()
         if self._scheduler_thread:
             self._scheduler_thread.join()
         logger.info("NotificationService остановлен")
     
-    def reload_settings(self):
+    def reload_settings(self) -> None:
         """
         Перезагрузка настроек уведомлений.
         
-        Обновляет настройки из базы данных.
+        Оповещает планировщик, и тот пересчитывает расписание по настройкам из базы данных.
         """
         logger.info("Принудительная перезагрузка настроек уведомлений")
         self.setting_service.reload_settings()
@@ -537,6 +767,27 @@ class NotificationService(BaseService):
         """
         return self.send_notification(user_id, template_name, context)
     
+    def force_send_notifications(
+        self,
+        user_ids: List[int],
+        template_name: str,
+        context: Dict[str, Any] = None
+    ) -> Dict[str, int]:
+        """
+        Принудительная отправка уведомления нескольким пользователям.
+        
+        Пользователи загружаются одним запросом, сообщение форматируется один раз.
+        
+        Args:
+            user_ids: Список Telegram ID пользователей
+            template_name: Имя шаблона уведомления
+            context: Контекст для форматирования шаблона
+            
+        Returns:
+            Словарь с количеством успешных и неуспешных отправок
+        """
+        return self.send_notification_to_users(user_ids, template_name, context)
+    
     def execute(self, *args, **kwargs) -> Any:
         """
         Выполнение основной бизнес-логики сервиса.
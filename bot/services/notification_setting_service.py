@@ -6,7 +6,7 @@
 """
 
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Callable
 from datetime import datetime
 
 from bot.core.base_service import BaseService
@@ -39,6 +39,26 @@ class NotificationSettingService(BaseService):
         super().__init__()
         self.setting_repository = setting_repository
         self.template_repository = template_repository
+        self._change_listeners: List[Callable[[], None]] = []
+    
+    def add_change_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Регистрация обработчика, вызываемого после изменения настроек.
+        
+        Args:
+            listener: Функция без аргументов
+        """
+        self._change_listeners.append(listener)
+    
+    def _notify_changed(self) -> None:
+        """
+        Оповещение зарегистрированных обработчиков об изменении настроек.
+        """
+        for listener in self._change_listeners:
+            try:
+                listener()
+            except Exception as e:
+                logger.error(f"Ошибка обработчика изменения настроек уведомлений: {e}")
     
     def get_setting_by_id(self, setting_id: int) -> Optional[NotificationSetting]:
         """
@@ -99,7 +119,10 @@ class NotificationSettingService(BaseService):
         Returns:
             ID созданной настройки или None в случае ошибки
         """
-        return self.setting_repository.add_setting(setting)
+        setting_id = self.setting_repository.add_setting(setting)
+        if setting_id:
+            self._notify_changed()
+        return setting_id
     
     def update_setting(self, setting: NotificationSetting) -> bool:
         """
@@ -111,7 +134,10 @@ class NotificationSettingService(BaseService):
         Returns:
             True, если обновление прошло успешно, иначе False
         """
-        return self.setting_repository.update_setting(setting)
+        result = self.setting_repository.update_setting(setting)
+        if result:
+            self._notify_changed()
+        return result
     
     def delete_setting(self, setting_id: int) -> bool:
         """
@@ -123,7 +149,10 @@ class NotificationSettingService(BaseService):
         Returns:
             True, если удаление прошло успешно, иначе False
         """
-        return self.setting_repository.delete_setting(setting_id)
+        result = self.setting_repository.delete_setting(setting_id)
+        if result:
+            self._notify_changed()
+        return result
     
     def toggle_setting_active(self, setting_id: int, is_active: bool) -> bool:
         """
@@ -136,7 +165,10 @@ class NotificationSettingService(BaseService):
         Returns:
             True, если изменение прошло успешно, иначе False
         """
-        return self.setting_repository.toggle_setting_active(setting_id, is_active)
+        result = self.setting_repository.toggle_setting_active(setting_id, is_active)
+        if result:
+            self._notify_changed()
+        return result
     
     def get_max_days_before(self) -> int:
         """
@@ -230,7 +262,7 @@ class NotificationSettingService(BaseService):
             True, если перезагрузка прошла успешно, иначе False
         """
         try:
-            # Можно реализовать дополнительную логику обновления кэша, если необходимо
+            self._notify_changed()
             logger.info("Выполнена перезагрузка настроек уведомлений")
             return True
         except Exception as e:
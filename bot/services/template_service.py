@@ -225,6 +225,10 @@ class TemplateService(BaseService):
             # Определяем текст шаблона в зависимости от типа входного параметра
             template_text = template.template if isinstance(template, NotificationTemplate) else template
             
+            # В шаблоне без переменных подставлять нечего
+            if '{' not in template_text:
+                return template_text
+            
             # Используем стандартный метод format для подстановки значений
             return template_text.format(**context)
         except Exception as e:
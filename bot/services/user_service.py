@@ -6,12 +6,13 @@
 """
 
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import date, datetime, timedelta
 
 from bot.core.base_service import BaseService
 from bot.core.models import User
 from bot.repositories.user_repository import UserRepository
+from bot.utils.formatters import parse_date
 
 logger = logging.getLogger(__name__)
 
@@ -79,6 +80,60 @@ class UserService(BaseService):
         """
         return self.user_repository.get_all_users()
     
+    def get_all_users_ordered(self) -> List[User]:
+        """
+        Получение всех пользователей: сначала администраторы, затем остальные,
+        внутри групп - по фамилии и имени.
+        
+        Returns:
+            Упорядоченный список всех пользователей
+        """
+        return self.user_repository.get_all_users_ordered()
+    
+    def get_users_by_telegram_ids(self, telegram_ids: List[int]) -> List[User]:
+        """
+        Получение пользователей по списку Telegram ID одним запросом.
+
+        Args:
+            telegram_ids: Список Telegram ID пользователей
+
+        Returns:
+            Список найденных пользователей
+        """
+        return self.user_repository.get_users_by_telegram_ids(telegram_ids)
+
+    def get_notifiable_telegram_ids(self) -> List[int]:
+        """
+        Получение Telegram ID пользователей с включенными оповещениями.
+
+        Returns:
+            Список Telegram ID получателей оповещений
+        """
+        return self.user_repository.get_notifiable_telegram_ids()
+
+    def get_users_directory_rows(self, limit: int, offset: int = 0) -> List[Tuple]:
+        """
+        Получение страницы справочника пользователей в виде кортежей.
+        
+        Args:
+            limit: Максимальное количество пользователей на странице
+            offset: Количество пропускаемых пользователей
+            
+        Returns:
+            Кортежи (first_name, last_name, username, birth_date, is_admin,
+            is_subscribed, is_notifications_enabled, telegram_id)
+        """
+        return self.user_repository.get_users_directory_rows(limit, offset)
+    
+    def count_users(self) -> int:
+        """
+        Получение общего количества пользователей.
+        
+        Returns:
+            Количество пользователей
+        """
+        return self.user_repository.count_users()
+    
     def create_user(self, user: User) -> int:
         """
         Создание нового пользователя.
@@ -90,7 +145,20 @@ class UserService(BaseService):
             ID созданного пользователя или None в случае ошибки
         """
         return self.user_repository.add_user(user)
-    
+
+    def create_user_if_absent(self, user: User) -> Optional[User]:
+        """
+        Создание нового пользователя, если он еще не существует.
+
+        Args:
+            user: Пользователь для создания
+
+        Returns:
+            Созданный пользователь или None, если пользователь уже существует
+            или произошла ошибка
+        """
+        return self.user_repository.add_user_if_absent(user)
+
     def update_user(self, user: User) -> bool:
         """
         Обновление пользователя.
@@ -130,7 +198,21 @@ class UserService(BaseService):
             return self.user_repository.promote_to_admin(telegram_id)
         else:
             return self.user_repository.demote_from_admin(telegram_id)
-    
+
+    def set_admin_by_username(self, username: str, is_admin: bool) -> Optional[User]:
+        """
+        Изменение статуса администратора по имени пользователя.
+
+        Args:
+            username: Имя пользователя
+            is_admin: True - назначить администратором, False - отозвать права администратора
+
+        Returns:
+            Обновленный пользователь или None, если пользователь не найден
+            или уже находится в нужном статусе
+        """
+        return self.user_repository.set_admin_by_username(username, is_admin)
+
     def toggle_notifications(self, telegram_id: int, is_enabled: bool) -> bool:
         """
         Включение/отключение уведомлений.
@@ -211,8 +293,7 @@ class UserService(BaseService):
         Returns:
             Список Telegram ID всех администраторов
         """
-        admin_users = [user for user in self.get_all_users() if user.is_admin]
-        return [user.telegram_id for user in admin_users]
+        return self.user_repository.get_admin_telegram_ids()
     
     def get_all_users_with_birthdays(self) -> List[Dict[str, Any]]:
         """
@@ -234,7 +315,7 @@ class UserService(BaseService):
             
             for user in users_with_birthdays:
                 try:
-                    birth_date_obj = datetime.strptime(user.birth_date, "%Y-%m-%d").date()
+                    birth_date_obj = parse_date(user.birth_date)
                     
                     birthdays_list.append({
                         'first_name': user.first_name,
@@ -267,22 +348,29 @@ class UserService(BaseService):
             значения - списки словарей с информацией о пользователях
         """
         try:
-            # Получаем всех пользователей
-            users = self.user_repository.get_all_users()
+            # Получаем текущую дату
+            today = datetime.now().date()
+            
+            if days_ahead is not None and days_ahead < 366:
+                # Отбираем в SQL только пользователей с днем рождения в ближайшие days_ahead дней
+                month_days = []
+                for offset in range(days_ahead + 1):
+                    day = today + timedelta(days=offset)
+                    month_days.append(f"{day.month:02d}-{day.day:02d}")
+                users = self.user_repository.get_users_with_birthdays_on(month_days)
+            else:
+                users = self.user_repository.get_all_users()
             
             # Фильтруем пользователей, у которых указана дата рождения
             users_with_birthdays = [user for user in users if user.birth_date]
             
-            # Получаем текущую дату
-            today = datetime.now().date()
-            
             # Создаем словарь для группировки по датам
             birthdays_by_date = {}
             
             for user in users_with_birthdays:
                 try:
                     # Преобразуем строку даты рождения в объект date
-                    birth_date = datetime.strptime(user.birth_date, "%Y-%m-%d").date()
+                    birth_date = parse_date(user.birth_date)
                     
                     # Вычисляем дату следующего дня рождения
                     next_birthday = date(today.year, birth_date.month, birth_date.day)
@@ -299,7 +387,7 @@ class UserService(BaseService):
                         continue
                     
                     # Добавляем пользователя в соответствующий список
-                    birthday_date_str = next_birthday.strftime("%Y-%m-%d")
+                    birthday_date_str = next_birthday.isoformat()
                     if birthday_date_str not in birthdays_by_date:
                         birthdays_by_date[birthday_date_str] = []
                     
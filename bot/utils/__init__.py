@@ -5,16 +5,22 @@
 """
 
 # Импорты модулей
-from .formatters import format_date, format_phone_number
-from .validators import validate_date_format, validate_birth_date, validate_html, validate_template_variables
+from .formatters import format_date, format_phone_number, parse_date
+from .validators import (
+    validate_date_format, validate_birth_date, validate_html, validate_template_variables,
+    has_only_allowed_tags, has_only_allowed_variables
+)
 from .keyboard_manager import KeyboardManager
 
 __all__ = [
     'format_date',
     'format_phone_number',
+    'parse_date',
     'validate_date_format',
     'validate_birth_date',
     'validate_html',
     'validate_template_variables',
+    'has_only_allowed_tags',
+    'has_only_allowed_variables',
     'KeyboardManager'
 ] 
\ No newline at end of file
@@ -7,14 +7,80 @@
 
 import logging
 import re
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
-from bot.constants import MONTHS_RU, SAMPLE_TEMPLATE_DATA
+from bot.constants import MONTH_GEN, SAMPLE_TEMPLATE_DATA
 from config import PHONE_PAY, NAME_PAY
 
 logger = logging.getLogger(__name__)
 
+# Переменная шаблона в формате {variable}
+_TEMPLATE_VAR_RE = re.compile(r'{([^{}]+)}')
+
+
+def _fast_ymd(date_str: str) -> Optional[date]:
+    """
+    Быстрый разбор даты в формате ГГГГ-ММ-ДД без strptime.
+    
+    Args:
+        date_str: Строка с датой
+        
+    Returns:
+        Объект date или None, если строка не похожа на дату в этом формате
+    """
+    if (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+            and date_str[0:4].isdigit() and date_str[5:7].isdigit() and date_str[8:10].isdigit()):
+        try:
+            return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+        except ValueError:
+            return None
+    return None
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str, date_format: str = "%Y-%m-%d") -> date:
+    """
+    Разбор строки с датой с кэшированием результата.
+    
+    Даты рождения повторяются при каждой отрисовке списков и отправке
+    напоминаний, поэтому повторный разбор сводится к поиску в кэше.
+    
+    Args:
+        date_str: Строка с датой
+        date_format: Формат даты (по умолчанию ГГГГ-ММ-ДД)
+        
+    Returns:
+        Объект date
+        
+    Raises:
+        ValueError: Если строка не соответствует формату
+    """
+    if date_format == "%Y-%m-%d":
+        parsed = _fast_ymd(date_str)
+        if parsed is not None:
+            return parsed
+    
+    # Нестандартные строки разбираем через strptime, чтобы сохранить его ValueError
+    return datetime.strptime(date_str, date_format).date()
+
+
+@lru_cache(maxsize=512)
+def format_day_month(month: int, day: int) -> str:
+    """
+    Форматирование дня и месяца с названием месяца в родительном падеже.
+    
+    Args:
+        month: Номер месяца
+        day: День месяца
+        
+    Returns:
+        Строка вида "5 марта"
+    """
+    return f"{day} {MONTH_GEN[month]}"
+
 
 def format_date(date_obj: datetime, format_type: str = 'full') -> str:
     """
@@ -32,13 +98,13 @@ def format_date(date_obj: datetime, format_type: str = 'full') -> str:
     year = date_obj.year
     
     if format_type == 'full':
-        return f"{day} {MONTHS_RU[month]['gen']} {year}"
+        return f"{format_day_month(month, day)} {year}"
     elif format_type == 'short':
         return f"{day:02d}.{month:02d}.{year}"
     elif format_type == 'day_month':
-        return f"{day} {MONTHS_RU[month]['gen']}"
+        return format_day_month(month, day)
     else:
-        return f"{day} {MONTHS_RU[month]['gen']} {year}"
+        return f"{day} {MONTH_GEN[month]} {year}"
 
 
 def format_template(template: str, data: Dict[str, Any]) -> str:
@@ -54,19 +120,68 @@ def format_template(template: str, data: Dict[str, Any]) -> str:
     Returns:
         Отформатированное сообщение
     """
-    # Используем регулярное выражение для поиска переменных в формате {variable}
-    result = template
+    # В шаблоне без переменных подставлять нечего
+    if '{' not in template:
+        return template
     
-    # Находим все переменные в шаблоне
-    variables = re.findall(r'{([^{}]+)}', template)
+    # Подстановка за один проход по регулярному выражению: заменяются только
+    # переменные с именами из словаря данных, остальной текст в скобках
+    # (в том числе атрибуты, преобразования и форматы str.format) не вычисляется
+    def replace_variable(match: re.Match) -> str:
+        var = match.group(1)
+        return str(data[var]) if var in data else match.group(0)
     
-    # Заменяем каждую переменную на соответствующее значение
-    for var in variables:
-        placeholder = f"{{{var}}}"
-        if var in data:
-            result = result.replace(placeholder, str(data[var]))
+    return _TEMPLATE_VAR_RE.sub(replace_variable, template)
+
+
+# Текущая дата и момент (time.time()) начала следующих суток, когда ее нужно обновить
+_today_cache = [date.min, 0.0]
+
+
+def _today() -> date:
+    """
+    Получение текущей даты с кэшированием до конца суток.
     
-    return result
+    Returns:
+        Текущая дата
+    """
+    now = time.time()
+    if now >= _today_cache[1]:
+        today = date.today()
+        next_midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _today_cache[0] = today
+        _today_cache[1] = next_midnight.timestamp()
+    return _today_cache[0]
+
+
+@lru_cache(maxsize=1024)
+def _reminder_dates(month: int, day: int, days_before: int, today: date) -> Tuple[str, str]:
+    """
+    Расчет отформатированных дат дня рождения и напоминания о нем.
+    
+    Результат одинаков для всех именинников с одной датой в пределах дня,
+    поэтому кэшируется; текущая дата входит в ключ кэша.
+    
+    Args:
+        month: Месяц рождения
+        day: День рождения
+        days_before: Количество дней до дня рождения
+        today: Текущая дата
+        
+    Returns:
+        Кортеж (дата дня рождения, дата напоминания)
+    """
+    # Определяем дату дня рождения в текущем году
+    birthday = date(today.year, month, day)
+    
+    # Если день рождения уже прошел в этом году, берем дату на следующий год
+    if birthday < today:
+        birthday = date(today.year + 1, month, day)
+    
+    # Определяем дату для напоминания (за days_before дней)
+    reminder_date = birthday - timedelta(days=days_before)
+    
+    return format_day_month(birthday.month, birthday.day), format_day_month(reminder_date.month, reminder_date.day)
 
 
 def format_birthday_reminder(template: str, first_name: str, last_name: str, 
@@ -84,29 +199,27 @@ def format_birthday_reminder(template: str, first_name: str, last_name: str,
     Returns:
         Отформатированное сообщение
     """
+    # В шаблоне без переменных даты не нужны
+    if '{' not in template:
+        return template
+    
     try:
         # Парсим дату рождения
-        birth_date_obj = datetime.strptime(birth_date, "%d.%m.%Y")
-        
-        # Определяем дату дня рождения в текущем году
-        now = datetime.now()
-        birthday_this_year = datetime(now.year, birth_date_obj.month, birth_date_obj.day)
-        
-        # Если день рождения уже прошел в этом году, берем дату на следующий год
-        if birthday_this_year < now:
-            birthday_this_year = datetime(now.year + 1, birth_date_obj.month, birth_date_obj.day)
+        birth_date_obj = parse_date(birth_date, "%d.%m.%Y")
         
-        # Определяем дату для напоминания (за days_before дней)
-        reminder_date = birthday_this_year - timedelta(days=days_before)
+        # Даты дня рождения и напоминания зависят только от дня, месяца и текущей даты
+        date_str, date_before_str = _reminder_dates(
+            birth_date_obj.month, birth_date_obj.day, days_before, _today()
+        )
         
         # Подготавливаем данные для форматирования
         data = {
             "name": f"{first_name} {last_name}",
             "first_name": first_name,
             "last_name": last_name,
-            "date": format_date(birthday_this_year, 'day_month'),
-            "date_before": format_date(reminder_date, 'day_month'),
-            "days_until": str(days_before),
+            "date": date_str,
+            "date_before": date_before_str,
+            "days_until": days_before,
             "phone_pay": PHONE_PAY,
             "name_pay": NAME_PAY
         }
@@ -0,0 +1,256 @@
+"""
+Модуль outbox содержит очередь исходящих сообщений с ограничением частоты отправки.
+
+Telegram ограничивает бота примерно 30 сообщениями в секунду в целом и одним
+сообщением в секунду в один чат. Очередь выравнивает всплески отправки под эти
+ограничения и учитывает ответ 429 (retry_after), чтобы повторные попытки
+не превращались в лавину.
+"""
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+import telebot
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты по алгоритму "ведро токенов".
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        """
+        Инициализация ограничителя.
+        
+        Args:
+            rate: Скорость пополнения (токенов в секунду)
+            capacity: Максимальное количество накопленных токенов
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Приостановка выдачи токенов (после ответа 429 от Telegram).
+        
+        Args:
+            seconds: Длительность паузы (в секундах)
+        """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+    
+    def try_acquire(self) -> float:
+        """
+        Попытка получить один токен.
+        
+        Returns:
+            0, если токен получен, иначе время ожидания до появления токена (в секундах)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._paused_until:
+                return self._paused_until - now
+            
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+    
+    def acquire(self) -> None:
+        """
+        Ожидание и получение одного токена.
+        """
+        wait = self.try_acquire()
+        while wait:
+            time.sleep(wait)
+            wait = self.try_acquire()
+
+
+# Ограничители частоты отправки по ботам: лимит Telegram действует на бота целиком,
+# поэтому все отправители одного бота должны делить один ограничитель
+_bot_buckets: Dict[int, TokenBucket] = {}
+_bot_buckets_lock = threading.Lock()
+
+
+def get_bot_bucket(bot: telebot.TeleBot, rate: float) -> TokenBucket:
+    """
+    Получение общего ограничителя частоты отправки для бота.
+    
+    Args:
+        bot: Экземпляр бота Telegram
+        rate: Максимальное количество сообщений в секунду (используется при создании)
+        
+    Returns:
+        TokenBucket: Ограничитель, общий для всех отправителей этого бота
+    """
+    with _bot_buckets_lock:
+        bucket = _bot_buckets.get(id(bot))
+        if bucket is None:
+            bucket = _bot_buckets[id(bot)] = TokenBucket(rate, rate)
+        return bucket
+
+
+def get_retry_after(e: telebot.apihelper.ApiTelegramException) -> float:
+    """
+    Получение времени ожидания из ответа 429 от Telegram.
+    
+    Args:
+        e: Исключение API Telegram
+        
+    Returns:
+        Время ожидания перед повтором (в секундах)
+    """
+    return (e.result_json or {}).get('parameters', {}).get('retry_after', 1)
+
+
+class MessageOutbox:
+    """
+    Очередь исходящих сообщений с фоновыми потоками отправки.
+    
+    Сообщения в один чат отправляются не чаще одного раза в chat_interval секунд
+    и в порядке постановки в очередь; общая частота ограничивается TokenBucket,
+    общим для всех отправителей бота (см. get_bot_bucket).
+    
+    Очередь разбита на шарды по chat_id, и каждый шард обслуживает один поток:
+    сообщения одного чата отправляются строго последовательно, поэтому ни
+    медленный ответ Telegram, ни пауза после 429 не меняют их порядок.
+    """
+    
+    def __init__(self, bot: telebot.TeleBot, rate: float = 30, chat_interval: float = 1.0,
+                 workers: int = 4, max_retries: int = 3):
+        """
+        Инициализация очереди.
+        
+        Args:
+            bot: Экземпляр бота Telegram
+            rate: Максимальное количество сообщений в секунду
+            chat_interval: Минимальный интервал между сообщениями в один чат (в секундах)
+            workers: Количество потоков отправки (шардов очереди)
+            max_retries: Максимальное количество повторов после ответа 429
+        """
+        self.bot = bot
+        self.chat_interval = chat_interval
+        self.max_retries = max_retries
+        self._bucket = get_bot_bucket(bot, rate)
+        
+        # Кучи шардов: (время готовности, порядковый номер, chat_id, параметры, попытка)
+        self._heaps: List[List[Tuple[float, int, Any, Dict[str, Any], int]]] = [[] for _ in range(workers)]
+        self._conds = [threading.Condition() for _ in range(workers)]
+        self._seq = itertools.count()
+        self._chat_next: Dict[Any, float] = {}
+        self._chat_lock = threading.Lock()
+        
+        for i in range(workers):
+            threading.Thread(target=self._worker, args=(i,), name=f"outbox-{i}", daemon=True).start()
+    
+    def _shard(self, chat_id: Any) -> int:
+        """
+        Определение шарда очереди для чата.
+        
+        Args:
+            chat_id: Идентификатор чата
+            
+        Returns:
+            Номер шарда
+        """
+        return hash(chat_id) % len(self._heaps)
+    
+    def put(self, chat_id: Any, text: str, **kwargs) -> None:
+        """
+        Постановка сообщения в очередь на отправку.
+        
+        Args:
+            chat_id: Идентификатор чата
+            text: Текст сообщения
+            **kwargs: Дополнительные параметры bot.send_message
+        """
+        kwargs['text'] = text
+        with self._chat_lock:
+            now = time.monotonic()
+            ready = max(now, self._chat_next.get(chat_id, 0.0))
+            self._chat_next[chat_id] = ready + self.chat_interval
+            
+            # Не даем словарю расти бесконечно: давно отправившие чаты больше не ограничены
+            if len(self._chat_next) > 10000:
+                self._chat_next = {k: v for k, v in self._chat_next.items() if v > now}
+            
+            seq = next(self._seq)
+        
+        self._push(self._shard(chat_id), (ready, seq, chat_id, kwargs, 0))
+    
+    def _push(self, shard: int, item: Tuple[float, int, Any, Dict[str, Any], int]) -> None:
+        """
+        Добавление элемента в кучу шарда.
+        
+        Args:
+            shard: Номер шарда
+            item: Элемент очереди
+        """
+        with self._conds[shard]:
+            heapq.heappush(self._heaps[shard], item)
+            self._conds[shard].notify()
+    
+    def _next_item(self, shard: int) -> Tuple[float, int, Any, Dict[str, Any], int]:
+        """
+        Ожидание следующего сообщения шарда, которое можно отправить.
+        
+        Args:
+            shard: Номер шарда
+            
+        Returns:
+            Элемент очереди (время готовности, порядковый номер, chat_id,
+            параметры сообщения, номер попытки)
+        """
+        heap = self._heaps[shard]
+        with self._conds[shard]:
+            while True:
+                now = time.monotonic()
+                if not heap:
+                    self._conds[shard].wait()
+                    continue
+                
+                if heap[0][0] > now:
+                    self._conds[shard].wait(heap[0][0] - now)
+                    continue
+                
+                return heapq.heappop(heap)
+    
+    def _worker(self, shard: int) -> None:
+        """
+        Цикл потока отправки сообщений шарда.
+        
+        Args:
+            shard: Номер шарда
+        """
+        while True:
+            ready, seq, chat_id, kwargs, attempt = self._next_item(shard)
+            
+            self._bucket.acquire()
+            
+            try:
+                self.bot.send_message(chat_id, **kwargs)
+            except telebot.apihelper.ApiTelegramException as e:
+                if e.error_code == 429 and attempt < self.max_retries:
+                    retry_after = get_retry_after(e)
+                    logger.warning(f"Превышен лимит отправки сообщений, пауза {retry_after} с")
+                    # Останавливаем всех отправителей бота: лимит действует на бота целиком.
+                    # Сообщение возвращается на прежнее место, чтобы сохранить порядок в чате
+                    self._bucket.pause(retry_after)
+                    self._push(shard, (ready, seq, chat_id, kwargs, attempt + 1))
+                else:
+                    logger.error(f"Ошибка отправки сообщения пользователю {chat_id}: {str(e)}")
+            except Exception as e:
+                logger.error(f"Ошибка отправки сообщения пользователю {chat_id}: {str(e)}")
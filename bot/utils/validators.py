@@ -14,6 +14,12 @@ from bot.constants import ALLOWED_HTML_TAGS, TEMPLATE_VARIABLES
 
 logger = logging.getLogger(__name__)
 
+# Открывающий или закрывающий HTML-тег (группа - имя тега)
+_TAG_RE = re.compile(r'</?([a-zA-Z0-9_-]+)[^>]*>')
+
+# Переменная шаблона в фигурных скобках (группа - имя переменной)
+_VAR_RE = re.compile(r'{([^{}]+)}')
+
 
 def validate_html(text: str) -> Tuple[bool, Optional[List[str]]]:
     """
@@ -29,15 +35,12 @@ def validate_html(text: str) -> Tuple[bool, Optional[List[str]]]:
         - is_valid: True, если все HTML-теги допустимы
         - invalid_tags: список недопустимых тегов или None, если is_valid = True
     """
-    # Находим все HTML-теги в тексте
-    tags = re.findall(r'<([a-zA-Z0-9_-]+)[^>]*>', text)
-    closing_tags = re.findall(r'</([a-zA-Z0-9_-]+)>', text)
-    
-    # Объединяем найденные теги
-    all_tags = set(tags + closing_tags)
+    # Находим все открывающие и закрывающие HTML-теги в тексте за один проход
+    all_tags = set(_TAG_RE.findall(text))
     
     # Проверяем, есть ли недопустимые теги
-    invalid_tags = [tag for tag in all_tags if tag not in ALLOWED_HTML_TAGS]
+    # Telegram не различает регистр в именах тегов
+    invalid_tags = [tag for tag in all_tags if tag.lower() not in ALLOWED_HTML_TAGS]
     
     return len(invalid_tags) == 0, invalid_tags if invalid_tags else None
 
@@ -56,16 +59,48 @@ def validate_template_variables(text: str) -> Tuple[bool, Optional[List[str]]]:
         - is_valid: True, если все переменные допустимы
         - invalid_vars: список недопустимых переменных или None, если is_valid = True
     """
-    # Находим все переменные в фигурных скобках
-    variables = re.findall(r'{([^{}]+)}', text)
+    # Повторяющиеся переменные проверяем один раз
+    invalid_vars = sorted(set(_VAR_RE.findall(text)) - TEMPLATE_VARIABLES)
     
-    # Получаем чистые имена переменных из списка TEMPLATE_VARIABLES
-    allowed_vars = [var.strip('{}') for var in TEMPLATE_VARIABLES]
+    return len(invalid_vars) == 0, invalid_vars if invalid_vars else None
+
+
+def has_only_allowed_tags(text: str) -> bool:
+    """
+    Быстрая проверка того, что в тексте используются только разрешенные HTML-теги.
     
-    # Проверяем, есть ли недопустимые переменные
-    invalid_vars = [var for var in variables if var not in allowed_vars]
+    В отличие от validate_html не собирает список недопустимых тегов
+    и прекращает разбор на первом из них.
     
-    return len(invalid_vars) == 0, invalid_vars if invalid_vars else None
+    Args:
+        text: Текст для проверки
+        
+    Returns:
+        True, если все HTML-теги допустимы, иначе False
+    """
+    for match in _TAG_RE.finditer(text):
+        if match.group(1).lower() not in ALLOWED_HTML_TAGS:
+            return False
+    return True
+
+
+def has_only_allowed_variables(text: str) -> bool:
+    """
+    Быстрая проверка того, что в тексте используются только допустимые переменные шаблона.
+    
+    В отличие от validate_template_variables прекращает разбор на первой
+    недопустимой переменной.
+    
+    Args:
+        text: Текст для проверки
+        
+    Returns:
+        True, если все переменные допустимы, иначе False
+    """
+    for match in _VAR_RE.finditer(text):
+        if match.group(1) not in TEMPLATE_VARIABLES:
+            return False
+    return True
 
 
 def validate_date_format(date_str: str) -> bool:
@@ -25,6 +25,20 @@ BOT_TOKEN = os.environ.get("BOT_TOKEN")
 if not BOT_TOKEN:
     raise ValueError("Не установлена переменная окружения BOT_TOKEN")
 
+# Количество рабочих потоков, в которых бот параллельно обрабатывает обновления
+BOT_NUM_THREADS = int(os.environ.get("BOT_NUM_THREADS", "8"))
+
+# Размер пула HTTP-соединений с Telegram API
+TELEGRAM_HTTP_POOL_SIZE = int(os.environ.get("TELEGRAM_HTTP_POOL_SIZE", "64"))
+
+# Ограничения частоты отправки сообщений через очередь исходящих сообщений:
+# сообщений в секунду для бота в целом и минимальный интервал между сообщениями в один чат
+TELEGRAM_SEND_RATE = float(os.environ.get("TELEGRAM_SEND_RATE", "30"))
+TELEGRAM_CHAT_SEND_INTERVAL = float(os.environ.get("TELEGRAM_CHAT_SEND_INTERVAL", "1"))
+
+# Количество потоков параллельной отправки оповещений о днях рождения
+NOTIFICATION_SEND_WORKERS = int(os.environ.get("NOTIFICATION_SEND_WORKERS", "20"))
+
 # Преобразование списка ADMIN_IDS из строки с разделителями-запятыми в список целых чисел
 ADMIN_IDS: List[int] = [
     int(id_str.strip()) 
@@ -59,6 +73,16 @@ if not os.path.exists(DATA_DIR):
 DB_PATH = os.path.join(DATA_DIR, "birthday_bot.db")
 SCHEMA_PATH = os.path.join(DATA_DIR, "db_schema.sql")
 
+# Максимальное количество переиспользуемых соединений с базой данных
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "10"))
+
+# Размер кэша подготовленных SQL-запросов каждого соединения
+DB_STATEMENT_CACHE_SIZE = int(os.environ.get("DB_STATEMENT_CACHE_SIZE", "256"))
+
+# Количество потоков для параллельного чтения метаданных файлов резервных копий.
+# Полезно, если директория резервных копий на сетевом диске; 0 - последовательно
+BACKUP_STAT_WORKERS = int(os.environ.get("BACKUP_STAT_WORKERS", "0"))
+
 # Логируем пути
 logger.info(f"DB_PATH: {DB_PATH}")
 logger.info(f"SCHEMA_PATH: {SCHEMA_PATH}")
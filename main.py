@@ -1,6 +1,9 @@
 import logging
 import sys
 import telebot
+from telebot import apihelper
+import requests
+from requests.adapters import HTTPAdapter
 import os
 import platform
 from bot.repositories import (
@@ -27,7 +30,7 @@ from bot.handlers import (
     GameHandler,
     NotificationHandler
 )
-from config import BOT_TOKEN, DATA_DIR
+from config import BOT_TOKEN, DATA_DIR, BOT_NUM_THREADS, TELEGRAM_HTTP_POOL_SIZE
 
 # Настройка логирования
 logging.basicConfig(
@@ -64,8 +67,23 @@ def obtain_lock():
             logger.error("Не удалось получить блокировку. Возможно, бот уже запущен.")
             sys.exit(1)
 
+def configure_http_session():
+    """Настройка общей HTTP-сессии для запросов к Telegram API"""
+    # По умолчанию у каждого потока своя сессия с пулом на 10 соединений;
+    # общая сессия с увеличенным пулом переиспользует соединения всеми потоками
+    adapter = HTTPAdapter(
+        pool_connections=TELEGRAM_HTTP_POOL_SIZE,
+        pool_maxsize=TELEGRAM_HTTP_POOL_SIZE
+    )
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    apihelper.session = session
+
 def main():
     """Главная функция для запуска бота"""
+    lock_fd = None
+    db_manager = None
     try:
         # Получаем блокировку для предотвращения запуска нескольких экземпляров
         lock_fd = obtain_lock()
@@ -91,7 +109,10 @@ def main():
         
         # Создание бота
         logger.info("Создание бота...")
-        bot = telebot.TeleBot(BOT_TOKEN)
+        configure_http_session()
+        # Обработчики синхронные, поэтому обновления раздаются пулу потоков:
+        # медленный запрос к БД или Telegram не блокирует остальных пользователей
+        bot = telebot.TeleBot(BOT_TOKEN, threaded=True, num_threads=BOT_NUM_THREADS)
         
         # Настройка менеджера уведомлений
         logger.info("Настройка менеджера уведомлений...")
@@ -123,6 +144,9 @@ def main():
         logger.info("Запуск менеджера уведомлений...")
         notification_service.start()
         
+        # Обслуживание базы данных выполняется в фоне, не задерживая запуск
+        db_manager.start_maintenance()
+        
         # Запуск бота
         logger.info("Запуск бота...")
         logger.info("Бот успешно запущен!")
@@ -135,6 +159,9 @@ def main():
         logger.error(f"Ошибка запуска бота: {str(e)}")
         raise
     finally:
+        # Закрываем соединения из пула, чтобы WAL-журнал был сброшен в основной файл
+        if db_manager is not None:
+            db_manager.close_all_connections()
         # Освобождаем блокировку при завершении
         if lock_fd is not None:
             lock_fd.close()
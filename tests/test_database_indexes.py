@@ -0,0 +1,91 @@
+"""
+Тесты уникальных индексов шаблонов и настроек уведомлений.
+
+Резервная копия, сделанная до появления уникальных индексов, может содержать
+дубликаты; после восстановления дубликаты удаляются, а индексы создаются.
+"""
+
+import os
+import sqlite3
+
+import pytest
+
+pytest.importorskip("telebot")
+pytest.importorskip("dotenv")
+os.environ.setdefault("BOT_TOKEN", "test-token")
+
+from bot.repositories import database_manager
+from bot.repositories.database_manager import DatabaseManager
+
+SCHEMA = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    telegram_id INTEGER UNIQUE NOT NULL,
+    first_name TEXT NOT NULL,
+    birth_date TEXT NOT NULL,
+    is_notifications_enabled BOOLEAN DEFAULT 1
+);
+CREATE TABLE notification_templates (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    template TEXT NOT NULL,
+    category TEXT NOT NULL,
+    is_active BOOLEAN DEFAULT 1
+);
+CREATE TABLE notification_settings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    template_id INTEGER NOT NULL,
+    days_before INTEGER NOT NULL,
+    time TEXT NOT NULL,
+    is_active BOOLEAN DEFAULT 1
+);
+"""
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    schema_path = tmp_path / "db_schema.sql"
+    schema_path.write_text(SCHEMA, encoding="utf-8")
+    monkeypatch.setattr(database_manager, "SCHEMA_PATH", str(schema_path))
+    database_manager._load_schema.cache_clear()
+
+    manager = DatabaseManager(db_path=str(tmp_path / "birthday_bot.db"))
+    yield manager
+
+    manager.close_all_connections()
+    database_manager._load_schema.cache_clear()
+
+
+def test_restore_removes_duplicates_and_creates_unique_indexes(db_manager, tmp_path):
+    backup_path = str(tmp_path / "backups" / "backup_duplicates.db")
+    os.makedirs(os.path.dirname(backup_path), exist_ok=True)
+    conn = sqlite3.connect(backup_path)
+    try:
+        conn.executescript(SCHEMA + """
+        INSERT INTO notification_templates (id, name, template, category) VALUES
+            (1, 'Напоминание', 'first', 'birthday'),
+            (2, 'Напоминание', 'second', 'birthday');
+        INSERT INTO notification_settings (id, template_id, days_before, time) VALUES
+            (1, 1, 1, '10:00'),
+            (2, 2, 1, '10:00'),
+            (3, 2, 0, '09:00');
+        """)
+        conn.commit()
+    finally:
+        conn.close()
+
+    assert db_manager.restore_from_backup(backup_path)
+
+    with db_manager.get_connection() as conn:
+        templates = [tuple(row) for row in conn.execute("SELECT id, template FROM notification_templates")]
+        settings = [
+            tuple(row) for row in conn.execute(
+                "SELECT id, template_id, days_before, time FROM notification_settings ORDER BY id"
+            )
+        ]
+        indexes = {row["name"] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    assert templates == [(1, "first")]
+    assert settings == [(1, 1, 1, "10:00"), (3, 1, 0, "09:00")]
+    assert "ux_notification_templates_name_category" in indexes
+    assert "ux_notification_settings_template_days_time" in indexes
@@ -0,0 +1,96 @@
+"""
+Тесты восстановления журнала уведомлений из резервной копии.
+
+Резервная копия, сделанная до перехода на Unix-время, хранит время отправки
+текстом и не содержит индексов журнала; после восстановления записи должны
+находиться по периоду так же, как новые.
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("telebot")
+pytest.importorskip("dotenv")
+os.environ.setdefault("BOT_TOKEN", "test-token")
+
+from bot.repositories import database_manager
+from bot.repositories.database_manager import DatabaseManager
+from bot.repositories.notification_log_repository import NotificationLogRepository
+
+SCHEMA = """
+CREATE TABLE users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    telegram_id INTEGER UNIQUE NOT NULL,
+    first_name TEXT NOT NULL,
+    birth_date TEXT NOT NULL,
+    is_notifications_enabled BOOLEAN DEFAULT 1
+);
+"""
+
+
+@pytest.fixture
+def db_manager(tmp_path, monkeypatch):
+    schema_path = tmp_path / "db_schema.sql"
+    schema_path.write_text(SCHEMA, encoding="utf-8")
+    monkeypatch.setattr(database_manager, "SCHEMA_PATH", str(schema_path))
+    database_manager._load_schema.cache_clear()
+
+    manager = DatabaseManager(db_path=str(tmp_path / "birthday_bot.db"))
+    yield manager
+
+    manager.close_all_connections()
+    database_manager._load_schema.cache_clear()
+
+
+def _make_old_format_backup(path: str, sent_times) -> None:
+    """
+    Создание резервной копии со старой структурой журнала (время отправки текстом).
+    """
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(SCHEMA + """
+        CREATE TABLE notification_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            message_text TEXT NOT NULL,
+            status TEXT NOT NULL,
+            error_message TEXT,
+            sent_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        """)
+        conn.executemany(
+            "INSERT INTO notification_logs (user_id, message_text, status, sent_at) VALUES (?, ?, ?, ?)",
+            [(1, "Поздравление", "success", sent_at.strftime("%Y-%m-%d %H:%M:%S")) for sent_at in sent_times]
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_restore_migrates_old_format_logs(db_manager, tmp_path):
+    # Репозиторий создан до восстановления, как в работающем боте
+    repository = NotificationLogRepository(db_manager)
+
+    now = datetime.now().replace(microsecond=0)
+    backup_path = str(tmp_path / "backups" / "backup_old.db")
+    _make_old_format_backup(backup_path, [now, now - timedelta(days=40)])
+
+    assert db_manager.restore_from_backup(backup_path)
+
+    logs = repository.get_logs_by_date_range(now.date(), now.date())
+    assert [log.created_at for log in logs] == [int(now.timestamp())]
+    assert repository.get_log_summary_by_date(now.date())["success"] == 1
+    assert repository.delete_logs_older_than(30) == 1
+
+    with db_manager.get_connection() as conn:
+        indexes = {
+            row["name"] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'notification_logs'"
+            )
+        }
+        version = conn.execute("SELECT value FROM meta WHERE key = 'notification_logs_version'").fetchone()
+    assert "idx_notification_logs_sent_status" in indexes
+    assert int(version["value"]) == database_manager.NOTIFICATION_LOGS_VERSION